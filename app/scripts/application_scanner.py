@@ -0,0 +1,108 @@
+"""
+Directory scanning for 04_Applications archives.
+
+Listing with Path.iterdir() and filtering with is_dir() costs a stat call per
+entry, and checking for job-spec.md with exists() before stat-ing and
+reading it costs two more. On a network-mounted archive each of those is a
+round trip. The scanner lists directories with os.scandir, whose entries
+carry the file type from the directory read itself, so the only stat left
+per folder is the one of job-spec.md, whose mtime and size the manifest
+needs anyway.
+
+Large archives can be sharded into subdirectories (e.g.
+04_Applications/2025/<folder>); with depth=2 the shards are listed in
+parallel threads. scan_applications() then stats each folder's job-spec.md
+a bounded window at a time, also in threads, and yields ApplicationFolder
+tuples lazily in the order the folders were given, so parsing can start
+before the whole archive has been stat-ed.
+
+Folder names still identify applications (folder_path is
+04_Applications/<folder name>), so they must be unique across shards.
+
+Usage:
+    folders = sorted(list_application_folders(APPLICATIONS_DIR, depth=2, workers=8), key=folder_sort_key)
+    for application in scan_applications(folders, workers=8):
+        if application.stat is not None:
+            parse(application.spec_path)
+"""
+
+import os
+import stat as stat_module
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, Iterator, List, NamedTuple, Optional
+
+
+SPEC_FILE_NAME = 'job-spec.md'
+
+
+class ApplicationFolder(NamedTuple):
+    """One application folder and its job-spec.md."""
+    path: Path
+    spec_path: Path
+    stat: Optional[os.stat_result]  # None when the folder has no job-spec.md
+
+
+def _subdirectories(directory: str) -> List[str]:
+    """Paths of the non-hidden subdirectories of `directory`, from dirent types."""
+    with os.scandir(directory) as entries:
+        # is_dir() only stats entries whose type the file system doesn't report (or symlinks)
+        return [entry.path for entry in entries if not entry.name.startswith('.') and entry.is_dir()]
+
+
+def list_application_folders(root: Path, depth: int = 1, workers: int = 1) -> List[Path]:
+    """
+    Application folders `depth` directory levels below `root` (1: root/<folder>,
+    2: root/<shard>/<folder>, ...), listing each level's directories with
+    `workers` threads. Unordered.
+    """
+    if depth < 1:
+        raise ValueError('depth must be at least 1')
+    if not root.is_dir():
+        return []
+
+    level = [str(root)]
+    if workers <= 1:
+        for _ in range(depth):
+            level = [path for directory in level for path in _subdirectories(directory)]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for _ in range(depth):
+                level = [path for paths in executor.map(_subdirectories, level) for path in paths]
+    return [Path(path) for path in level]
+
+
+def stat_application(folder: Path) -> ApplicationFolder:
+    """The folder with the stat of its job-spec.md (None if missing or not a file)."""
+    spec_path = folder / SPEC_FILE_NAME
+    try:
+        stat = os.stat(spec_path)
+    except OSError:
+        stat = None
+    if stat is not None and not stat_module.S_ISREG(stat.st_mode):
+        stat = None
+    return ApplicationFolder(folder, spec_path, stat)
+
+
+def scan_applications(folders: Iterable[Path], workers: int = 1) -> Iterator[ApplicationFolder]:
+    """
+    Yield an ApplicationFolder per folder, in the given order, stat-ing up to
+    `workers` job-spec.md files at a time. Only a small window of folders is
+    in flight, so this stays lazy for any archive size.
+    """
+    if workers <= 1:
+        for folder in folders:
+            yield stat_application(folder)
+        return
+
+    window_size = workers * 4
+    window = deque()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for folder in folders:
+            window.append(executor.submit(stat_application, folder))
+            if len(window) >= window_size:
+                yield window.popleft().result()
+        while window:
+            yield window.popleft().result()
+
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark date_normalization.normalize_date_range against the original parse_date_range.
+
+Builds a workload like a bulk import: many date ranges drawn from a small
+pool of distinct strings. Checks both parsers agree on every form the
+original understands, then times the original, the normalizer's regex alone
+(uncached), the normalizer with its cache cleared before every pass (cold),
+and with the cache kept (warm).
+
+Usage:
+    python3 bench_date_normalization.py                     # 200,000 lookups
+    python3 bench_date_normalization.py --lookups 1000000 --distinct 2000
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Callable, List, Optional
+
+from bench_profile_parser import parse_date_range
+from date_normalization import clear_caches, normalize_date_range
+from synthetic_data import MONTHS
+
+
+def generate_ranges(count: int, seed: int) -> List[str]:
+    """Distinct ranges in the "Month YYYY - Month YYYY" / "- Present" form the original parses."""
+    rng = random.Random(seed)
+    ranges = set()
+    while len(ranges) < count:
+        start_year = rng.randint(1990, 2025)
+        start = f"{rng.choice(MONTHS)} {start_year}"
+        end = 'Present' if rng.random() < 0.2 else f"{rng.choice(MONTHS)} {rng.randint(start_year, 2026)}"
+        ranges.add(f"{start} - {end}")
+    return sorted(ranges)
+
+
+def time_parser(parse: Callable[[str], Any], workload: List[str], repeat: int,
+                before_pass: Optional[Callable[[], None]] = None) -> float:
+    """Best wall time over `repeat` passes over the workload."""
+    best = float('inf')
+    for _ in range(repeat):
+        if before_pass:
+            before_pass()
+        start = time.perf_counter()
+        for text in workload:
+            parse(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark date range parsing')
+    parser.add_argument('--lookups', type=int, default=200_000, help='Date ranges parsed per pass (default: 200000)')
+    parser.add_argument('--distinct', type=int, default=500, help='Distinct date strings (default: 500)')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed passes per parser (default: 3)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+    args = parser.parse_args()
+
+    distinct = generate_ranges(args.distinct, args.seed)
+    rng = random.Random(args.seed)
+    workload = [rng.choice(distinct) for _ in range(args.lookups)]
+    print(f"🧪 {len(workload):,} lookups over {len(distinct):,} distinct date ranges")
+
+    print("\n🔍 Checking results match the original parser...")
+    mismatches = [text for text in distinct if normalize_date_range(text) != parse_date_range(text)]
+    if mismatches:
+        for text in mismatches[:3]:
+            print(f"  ❌ {text!r}: {parse_date_range(text)} != {normalize_date_range(text)}")
+        print(f"  ❌ {len(mismatches)} of {len(distinct)} ranges differ")
+        return 1
+    print(f"  ✅ All {len(distinct)} ranges match")
+
+    print(f"\n⏱️  Timing (best of {args.repeat})...")
+    legacy_time = time_parser(parse_date_range, workload, args.repeat)
+    uncached_time = time_parser(normalize_date_range.__wrapped__, workload, args.repeat)
+    cold_time = time_parser(normalize_date_range, workload, args.repeat, before_pass=clear_caches)
+    warm_time = time_parser(normalize_date_range, workload, args.repeat)
+
+    for label, seconds in (
+        ('parse_date_range:             ', legacy_time),
+        ('normalize_date_range (regex): ', uncached_time),
+        ('normalize_date_range (cold):  ', cold_time),
+        ('normalize_date_range (warm):  ', warm_time),
+    ):
+        print(f"  {label}{seconds:.3f}s ({len(workload) / seconds:,.0f} ranges/s, "
+              f"{legacy_time / seconds:.1f}x)")
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Benchmark the single-pass job-spec extractor against the original extract_* functions.
+
+The per-field regex functions generate-seed-data.py used before
+job_spec_fields live here as the reference implementation. Generates a
+synthetic corpus, checks that job_spec_fields.extract_fields returns exactly
+what they return for every document, then times both.
+
+Usage:
+    python3 bench_job_spec_fields.py                  # 5,000 documents
+    python3 bench_job_spec_fields.py --docs 50000     # Larger corpus
+"""
+
+import argparse
+import re
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from job_spec_fields import extract_fields
+from synthetic_data import generate_corpus
+
+
+def extract_match_percentage(content: str) -> Optional[int]:
+    """Extract match percentage from job spec content."""
+    # Try various patterns
+    patterns = [
+        r'\*\*Match Score:\s*(\d+)%\*\*',
+        r'\*\*Match Percentage:\s*(\d+)%\*\*',
+        r'Match Score:\s*(\d+)%',
+        r'Match Percentage:\s*(\d+)%',
+        r'Match.*?:\s*(\d+)%',
+    ]
+
+    for pattern in patterns:
+        match = re.search(pattern, content, re.IGNORECASE)
+        if match:
+            return int(match.group(1))
+
+    return None
+
+
+def extract_company_info(content: str, folder_company: str) -> str:
+    """Extract company name from job spec."""
+    # Try to find company in markdown
+    patterns = [
+        r'\*\*Company\*\*:\s*(.+?)(?:\n|$)',
+        r'##\s*Company Information.*?\*\*Company\*\*:\s*(.+?)(?:\n|$)',
+        r'Company:\s*(.+?)(?:\n|$)',
+    ]
+
+    for pattern in patterns:
+        match = re.search(pattern, content, re.MULTILINE)
+        if match:
+            return match.group(1).strip()
+
+    return folder_company
+
+
+def extract_position_title(content: str, folder_position: str) -> str:
+    """Extract position title from job spec."""
+    patterns = [
+        r'\*\*Title\*\*:\s*(.+?)(?:\n|$)',
+        r'\*\*Position\*\*:\s*(.+?)(?:\n|$)',
+        r'Position:\s*(.+?)(?:\n|$)',
+        r'Title:\s*(.+?)(?:\n|$)',
+        r'^#\s*(.+?)(?:\n|$)',
+    ]
+
+    for pattern in patterns:
+        match = re.search(pattern, content, re.MULTILINE)
+        if match:
+            title = match.group(1).strip()
+            # Clean up title
+            title = re.sub(r'\*\*Match.*?:\s*\d+%\*\*', '', title).strip()
+            title = re.sub(r'-\s*Very Strong Match', '', title).strip()
+            if title:
+                return title
+
+    return folder_position
+
+
+def extract_location(content: str) -> Optional[str]:
+    """Extract location from job spec."""
+    patterns = [
+        r'\*\*Location\*\*:\s*(.+?)(?:\n|$)',
+        r'Location:\s*(.+?)(?:\n|$)',
+    ]
+
+    for pattern in patterns:
+        match = re.search(pattern, content, re.MULTILINE)
+        if match:
+            return match.group(1).strip()
+
+    return None
+
+
+def extract_salary_range(content: str) -> Optional[str]:
+    """Extract salary range from job spec."""
+    patterns = [
+        r'\*\*Salary Range\*\*:\s*(.+?)(?:\n|$)',
+        r'\*\*Compensation\*\*:\s*(.+?)(?:\n|$)',
+        r'Salary Range:\s*(.+?)(?:\n|$)',
+        r'Compensation:\s*(.+?)(?:\n|$)',
+    ]
+
+    for pattern in patterns:
+        match = re.search(pattern, content, re.MULTILINE)
+        if match:
+            return match.group(1).strip()
+
+    return None
+
+
+def extract_job_type(content: str) -> Optional[str]:
+    """Extract job type from job spec."""
+    patterns = [
+        r'\*\*Type\*\*:\s*(.+?)(?:\n|$)',
+        r'\*\*Employment Type\*\*:\s*(.+?)(?:\n|$)',
+        r'Type:\s*(.+?)(?:\n|$)',
+        r'Employment Type:\s*(.+?)(?:\n|$)',
+    ]
+
+    for pattern in patterns:
+        match = re.search(pattern, content, re.MULTILINE)
+        if match:
+            return match.group(1).strip()
+
+    return None
+
+
+def extract_original_url(content: str) -> Optional[str]:
+    """Extract original job posting URL from job spec."""
+    patterns = [
+        r'\*\*Source URL\*\*:\s*(https?://[^\s\)]+)',
+        r'\*\*Job URL\*\*:\s*(https?://[^\s\)]+)',
+        r'Source URL:\s*(https?://[^\s\)]+)',
+        r'Job URL:\s*(https?://[^\s\)]+)',
+        r'\(https?://[^\s\)]+\)',
+    ]
+
+    for pattern in patterns:
+        match = re.search(pattern, content)
+        if match:
+            url = match.group(1) if match.lastindex else match.group(0)
+            return url.strip('()')
+
+    return None
+
+
+def extract_match_analysis(content: str) -> Dict[str, List[str]]:
+    """Extract match analysis with strengths, partial matches, and gaps."""
+    analysis = {
+        'strengths': [],
+        'partial_matches': [],
+        'gaps': []
+    }
+
+    # Extract strengths
+    strengths_section = re.search(
+        r'(?:### Strong Matches|### Strengths?).*?(?=###|\Z)',
+        content,
+        re.DOTALL | re.IGNORECASE
+    )
+    if strengths_section:
+        strengths_text = strengths_section.group(0)
+        strengths = re.findall(r'[-\*]\s*[✅✓]\s*\*\*(.+?)\*\*', strengths_text)
+        if not strengths:
+            strengths = re.findall(r'[-\*]\s*✅\s*(.+?)(?:\n|$)', strengths_text)
+        analysis['strengths'] = [s.strip() for s in strengths[:5]]  # Limit to top 5
+
+    # Extract partial matches
+    partial_section = re.search(
+        r'### Partial Matches.*?(?=###|\Z)',
+        content,
+        re.DOTALL | re.IGNORECASE
+    )
+    if partial_section:
+        partial_text = partial_section.group(0)
+        partials = re.findall(r'[-\*]\s*[⚠️🟡]\s*\*\*(.+?)\*\*', partial_text)
+        if not partials:
+            partials = re.findall(r'[-\*]\s*⚠️\s*(.+?)(?:\n|$)', partial_text)
+        analysis['partial_matches'] = [p.strip() for p in partials[:5]]
+
+    # Extract gaps
+    gaps_section = re.search(
+        r'### Gaps.*?(?=###|\Z)',
+        content,
+        re.DOTALL | re.IGNORECASE
+    )
+    if gaps_section:
+        gaps_text = gaps_section.group(0)
+        gaps = re.findall(r'[-\*]\s*[❌]\s*\*\*(.+?)\*\*', gaps_text)
+        if not gaps:
+            gaps = re.findall(r'[-\*]\s*❌\s*(.+?)(?:\n|$)', gaps_text)
+        analysis['gaps'] = [g.strip() for g in gaps[:5]]
+
+    return analysis
+
+
+def extract_job_description(content: str) -> str:
+    """Extract job description text."""
+    # Try to find the job description section
+    patterns = [
+        r'## Job Description(.*?)(?=##|\Z)',
+        r'## Role Overview(.*?)(?=##|\Z)',
+        r'## About the Role(.*?)(?=##|\Z)',
+    ]
+
+    for pattern in patterns:
+        match = re.search(pattern, content, re.DOTALL | re.IGNORECASE)
+        if match:
+            desc = match.group(1).strip()
+            # Limit to first 1000 characters for seed data
+            return desc[:1000] if len(desc) > 1000 else desc
+
+    # If no section found, take first 500 characters after the header
+    lines = content.split('\n')
+    desc_lines = []
+    skip_count = 5  # Skip first few header lines
+    for line in lines[skip_count:]:
+        if line.strip():
+            desc_lines.append(line)
+        if len('\n'.join(desc_lines)) > 500:
+            break
+
+    return '\n'.join(desc_lines)[:500]
+
+
+def legacy_extract_fields(content: str, folder_company: str, folder_position: str) -> Dict[str, Any]:
+    """The field extraction generate-seed-data.py used before job_spec_fields."""
+    return {
+        'original_url': extract_original_url(content),
+        'company_name': extract_company_info(content, folder_company),
+        'position_title': extract_position_title(content, folder_position),
+        'location': extract_location(content),
+        'salary_range': extract_salary_range(content),
+        'job_type': extract_job_type(content),
+        'job_description_text': extract_job_description(content),
+        'match_percentage': extract_match_percentage(content),
+        'match_analysis': extract_match_analysis(content),
+    }
+
+
+def time_extractor(extract: Callable[[str], Dict[str, Any]], corpus: List[str], repeat: int) -> float:
+    """Best wall time over `repeat` passes over the corpus."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for content in corpus:
+            extract(content)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark job-spec field extraction')
+    parser.add_argument('--docs', type=int, default=5000, help='Number of synthetic documents (default: 5000)')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed passes per extractor (default: 3)')
+    parser.add_argument('--seed', type=int, default=42, help='Corpus random seed (default: 42)')
+    args = parser.parse_args()
+
+    print(f"🧪 Generating {args.docs} synthetic job specs...")
+    corpus = generate_corpus(args.docs, args.seed)
+    total_mb = sum(len(content.encode('utf-8')) for content in corpus) / 1_000_000
+    print(f"  Corpus size: {total_mb:.1f} MB")
+
+    print("\n🔍 Checking results match the original extractors...")
+    mismatches = 0
+    for index, content in enumerate(corpus):
+        expected = legacy_extract_fields(content, 'FolderCompany', 'Folder Position')
+        actual = extract_fields(content, 'FolderCompany', 'Folder Position')
+        if actual != expected:
+            mismatches += 1
+            if mismatches <= 3:
+                diff = {key: (expected[key], actual[key]) for key in expected if expected[key] != actual[key]}
+                print(f"  ❌ Document {index}: {diff}")
+    if mismatches:
+        print(f"  ❌ {mismatches} of {len(corpus)} documents differ")
+        return 1
+    print(f"  ✅ All {len(corpus)} documents match")
+
+    print(f"\n⏱️  Timing (best of {args.repeat})...")
+    legacy_time = time_extractor(
+        lambda content: legacy_extract_fields(content, 'FolderCompany', 'Folder Position'),
+        corpus, args.repeat
+    )
+    single_pass_time = time_extractor(
+        lambda content: extract_fields(content, 'FolderCompany', 'Folder Position'),
+        corpus, args.repeat
+    )
+
+    print(f"  extract_* functions: {legacy_time:.3f}s ({len(corpus) / legacy_time:,.0f} docs/s)")
+    print(f"  extract_fields:      {single_pass_time:.3f}s ({len(corpus) / single_pass_time:,.0f} docs/s)")
+    print(f"  Speedup: {legacy_time / single_pass_time:.1f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
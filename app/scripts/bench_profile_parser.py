@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+Benchmark the single-pass profile parser against the original parse_* functions.
+
+The per-section parse_* functions migrate_to_db.py used before
+profile_parser live here as the reference implementation. Generates
+master_profile.md documents of doubling size, checks that
+profile_parser.parse_profile returns exactly what they return, then times
+both. Time per KB staying flat as documents grow
+shows the parser scales linearly.
+
+Usage:
+    python3 bench_profile_parser.py                          # 100 to 12,800 experiences
+    python3 bench_profile_parser.py --sizes 1000 10000 100000
+"""
+
+import argparse
+import random
+import re
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from profile_parser import parse_profile
+from synthetic_data import generate_master_profile
+
+
+DEFAULT_SIZES = [100, 200, 400, 800, 1600, 3200, 6400, 12800]
+
+
+def parse_contact_info(content: str) -> Dict[str, str]:
+    """Parse contact information section."""
+    contact = {}
+
+    # Extract email
+    email_match = re.search(r'\*\*Email\*\*:\s*([^\n]+)', content)
+    if email_match:
+        contact['email'] = email_match.group(1).strip()
+
+    # Extract phones
+    whatsapp_match = re.search(r'Whatsapp:\s*([^\n]+)', content)
+    if whatsapp_match:
+        contact['phone_primary'] = whatsapp_match.group(1).strip()
+
+    phone_match = re.search(r'Phone:\s*([^\n]+)', content)
+    if phone_match:
+        contact['phone_secondary'] = phone_match.group(1).strip()
+
+    # Extract LinkedIn
+    linkedin_match = re.search(r'\*\*LinkedIn\*\*:.*?\[.*?\]\((https?://[^\)]+)\)', content)
+    if linkedin_match:
+        contact['linkedin_url'] = linkedin_match.group(1).strip()
+
+    # Extract location
+    location_match = re.search(r'\*\*Location\*\*:\s*([^\n]+)', content)
+    if location_match:
+        contact['location'] = location_match.group(1).strip()
+
+    return contact
+
+
+def parse_professional_summary(content: str) -> str:
+    """Parse professional summary section."""
+    match = re.search(r'## Professional Summary\n(.+?)(?=\n##)', content, re.DOTALL)
+    if match:
+        return match.group(1).strip()
+    return ""
+
+
+def parse_work_experiences(content: str) -> List[Dict[str, Any]]:
+    """Parse professional experience section."""
+    experiences = []
+
+    # Find Professional Experience section (extract until ## Education)
+    exp_start = content.find('## Professional Experience')
+    edu_start = content.find('## Education', exp_start)
+
+    if exp_start == -1:
+        return experiences
+
+    exp_text = content[exp_start:edu_start] if edu_start != -1 else content[exp_start:]
+
+    # Find all job entries (### Company | Position)
+    job_pattern = r'###\s+(.+?)\s*\|\s*(.+?)\n\*\*(.+?)\*\*\s*\|\s*(.+?)\n((?:-.+?\n)+)'
+    matches = re.finditer(job_pattern, exp_text, re.MULTILINE)
+
+    for idx, match in enumerate(matches):
+        company_name = match.group(1).strip()
+        position_title = match.group(2).strip()
+        date_range = match.group(3).strip()
+        location = match.group(4).strip()
+        description_text = match.group(5).strip()
+
+        # Parse date range
+        start_date, end_date, is_current = parse_date_range(date_range)
+
+        experiences.append({
+            'company_name': company_name,
+            'position_title': position_title,
+            'location': location if location else None,
+            'start_date': start_date,
+            'end_date': end_date,
+            'is_current': is_current,
+            'description': description_text,
+            'display_order': idx
+        })
+
+    return experiences
+
+
+def parse_date_range(date_range: str) -> tuple[Optional[str], Optional[str], bool]:
+    """
+    Parse date range like 'March 2023 - Present' or 'June 2022 - March 2023'.
+    Returns (start_date, end_date, is_current) in YYYY-MM-DD format.
+    """
+    is_current = 'Present' in date_range or 'present' in date_range
+
+    # Split by dash
+    parts = date_range.split('-')
+    if len(parts) != 2:
+        return None, None, False
+
+    start_str = parts[0].strip()
+    end_str = parts[1].strip()
+
+    start_date = parse_month_year(start_str)
+    end_date = None if is_current else parse_month_year(end_str)
+
+    return start_date, end_date, is_current
+
+
+def parse_month_year(date_str: str) -> Optional[str]:
+    """
+    Parse 'March 2023' or 'June 2022' to 'YYYY-MM-DD' format.
+    Returns first day of the month.
+    """
+    months = {
+        'January': '01', 'February': '02', 'March': '03', 'April': '04',
+        'May': '05', 'June': '06', 'July': '07', 'August': '08',
+        'September': '09', 'October': '10', 'November': '11', 'December': '12'
+    }
+
+    for month_name, month_num in months.items():
+        if month_name in date_str:
+            year_match = re.search(r'(\d{4})', date_str)
+            if year_match:
+                year = year_match.group(1)
+                return f"{year}-{month_num}-01"
+
+    return None
+
+
+def parse_skills(content: str) -> List[Dict[str, Any]]:
+    """Parse all skills sections."""
+    skills = []
+
+    # Find Technical Skills section (extract until ## Professional Experience)
+    skills_start = content.find('## Technical Skills')
+    exp_start = content.find('## Professional Experience', skills_start)
+
+    if skills_start == -1:
+        return skills
+
+    skills_text = content[skills_start:exp_start] if exp_start != -1 else content[skills_start:]
+
+    # Find all skill category sections (### Category Name)
+    category_pattern = r'###\s+(.+?)\n((?:-.+?\n)+)'
+    matches = re.finditer(category_pattern, skills_text, re.MULTILINE)
+
+    display_order = 0
+
+    for match in matches:
+        category_name = match.group(1).strip()
+        skills_block = match.group(2).strip()
+
+        # Extract individual skills (lines starting with -)
+        skill_lines = [line.strip()[2:].strip() for line in skills_block.split('\n') if line.strip().startswith('-')]
+
+        for skill_name in skill_lines:
+            if skill_name:
+                skills.append({
+                    'skill_name': skill_name,
+                    'category': category_name,
+                    'proficiency_level': None,
+                    'years_of_experience': None,
+                    'display_order': display_order
+                })
+                display_order += 1
+
+    return skills
+
+
+def parse_education(content: str) -> List[Dict[str, Any]]:
+    """Parse education section."""
+    education = []
+
+    # Find Education section
+    edu_section = re.search(r'## Education\n(.+?)(?=\n##|$)', content, re.DOTALL)
+    if not edu_section:
+        return education
+
+    edu_text = edu_section.group(1).strip()
+
+    # Split by lines starting with -
+    edu_lines = [line.strip()[2:].strip() for line in edu_text.split('\n') if line.strip().startswith('-')]
+
+    for idx, edu_line in enumerate(edu_lines):
+        # Example: "SMK Negeri 7 Bandung (High School) - Analytical Chemistry (2009-2011)"
+
+        # Extract institution name (before first parenthesis or dash)
+        institution_match = re.search(r'^([^(]+?)(?:\s*\(|\s*-)', edu_line)
+        institution_name = institution_match.group(1).strip() if institution_match else edu_line
+        # Remove markdown bold syntax
+        institution_name = institution_name.replace('**', '').strip()
+
+        # Extract degree/field
+        degree_match = re.search(r'-\s*([^(]+?)\s*\(', edu_line)
+        degree_or_field = degree_match.group(1).strip() if degree_match else None
+
+        # Extract date range (last parentheses)
+        date_match = re.search(r'\((\d{4})-(\d{4})\)', edu_line)
+        start_date = None
+        end_date = None
+
+        if date_match:
+            start_year = date_match.group(1)
+            end_year = date_match.group(2)
+            start_date = f"{start_year}-01-01"  # Year precision
+            end_date = f"{end_year}-12-31"
+
+        education.append({
+            'institution_name': institution_name,
+            'degree_or_field': degree_or_field,
+            'location': None,
+            'description': None,
+            'start_date': start_date,
+            'end_date': end_date,
+            'date_precision': 'year',
+            'is_current': False,
+            'display_order': idx
+        })
+
+    return education
+
+
+def parse_certifications(content: str) -> List[Dict[str, Any]]:
+    """Parse certifications section."""
+    certifications = []
+
+    # Find Certifications section
+    cert_section = re.search(r'## Certifications\n(.+?)(?=\n##|$)', content, re.DOTALL)
+    if not cert_section:
+        return certifications
+
+    cert_text = cert_section.group(1).strip()
+
+    # Split by lines starting with -
+    cert_lines = [line.strip()[2:].strip() for line in cert_text.split('\n') if line.strip().startswith('-')]
+
+    for idx, cert_line in enumerate(cert_lines):
+        certifications.append({
+            'certification_name': cert_line,
+            'issuing_organization': None,
+            'credential_id': None,
+            'credential_url': None,
+            'description': None,
+            'issue_date': None,
+            'expiry_date': None,
+            'date_precision': 'year',
+            'display_order': idx
+        })
+
+    return certifications
+
+
+def legacy_parse_profile(content: str) -> Dict[str, Any]:
+    """The section parsing migrate_to_db.py did before parse_profile."""
+    return {
+        'contact': parse_contact_info(content),
+        'summary': parse_professional_summary(content),
+        'experiences': parse_work_experiences(content),
+        'skills': parse_skills(content),
+        'education': parse_education(content),
+        'certifications': parse_certifications(content),
+    }
+
+
+def time_parser(parse: Callable[[str], Any], content: str, repeat: int) -> float:
+    """Best wall time over `repeat` parses of one document."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(content)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark master_profile.md parsing')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='Work experiences per generated profile (default: 100 to 12800, doubling)')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed parses per size (default: 3)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+    parser.add_argument('--skip-legacy', action='store_true',
+                        help="Don't time the original parsers (slow on the largest sizes)")
+    args = parser.parse_args()
+
+    print(f"🧪 Generating {len(args.sizes)} synthetic profiles...")
+    documents: List[str] = [generate_master_profile(random.Random(args.seed + size), size) for size in args.sizes]
+
+    print("\n🔍 Checking results match the original parsers...")
+    mismatches = 0
+    for size, content in zip(args.sizes, documents):
+        expected = legacy_parse_profile(content)
+        actual = parse_profile(content)
+        differing = [key for key in expected if expected[key] != actual[key]]
+        if differing:
+            mismatches += 1
+            print(f"  ❌ {size} experiences: {', '.join(differing)} differ")
+    if mismatches:
+        print(f"  ❌ {mismatches} of {len(documents)} profiles differ")
+        return 1
+    print(f"  ✅ All {len(documents)} profiles match")
+
+    print(f"\n⏱️  Timing (best of {args.repeat})...")
+    print(f"  {'Experiences':>11}  {'Size':>9}  {'parse_profile':>13}  {'µs/KB':>7}  {'parse_*':>9}  {'Speedup':>7}")
+    for size, content in zip(args.sizes, documents):
+        kilobytes = len(content.encode('utf-8')) / 1024
+        single_pass_time = time_parser(parse_profile, content, args.repeat)
+        row = (f"  {size:>11,}  {kilobytes:>7,.0f}KB  {single_pass_time:>12.4f}s  "
+               f"{single_pass_time * 1_000_000 / kilobytes:>7.1f}")
+        if not args.skip_legacy:
+            legacy_time = time_parser(legacy_parse_profile, content, args.repeat)
+            row += f"  {legacy_time:>8.4f}s  {legacy_time / single_pass_time:>6.1f}x"
+        print(row)
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+End-to-end benchmark of the seed and profile migration pipelines.
+
+For each scale, generates a synthetic 04_Applications tree with that many
+folders and a master_profile.md with that many work experiences, then times
+every stage the two scripts go through:
+
+- folder_scan: listing and ordering the application folders and stat-ing their specs
+- parse_job_spec: reading and parsing every job-spec.md
+- generate_sql_insert: rendering the INSERT statements
+- json_dump: streaming seed-data.json through JsonSeedWriter
+- parse_profile / build_profile_data: the profile parsers (migrate_to_db.py)
+
+Each scale runs in a fresh process, so peak RSS (the process high-water mark
+at the end of each stage) isn't inherited from a larger scale. Results,
+including throughput, go to a JSON file. Passing an earlier result as
+--baseline flags stages whose throughput dropped by more than --tolerance
+and exits with status 1, so the benchmark can gate regressions.
+
+Usage:
+    python3 bench_seed_pipeline.py                                # 10, 1,000 and 100,000 folders
+    python3 bench_seed_pipeline.py --scales 10 1000 --output before.json
+    python3 bench_seed_pipeline.py --scales 10 1000 --baseline before.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from application_scanner import ApplicationFolder, list_application_folders, scan_applications
+from profile_parser import build_profile_data, parse_profile
+from seed_generator import load_seed_generator
+from seed_output import JsonSeedWriter
+from synthetic_data import generate_master_profile, write_applications_tree
+
+
+DEFAULT_SCALES = [10, 1000, 100000]
+DEFAULT_OUTPUT = Path(__file__).with_name('bench-seed-pipeline.json')
+DEFAULT_TOLERANCE = 0.2
+MIN_COMPARED_SECONDS = 0.01  # Shorter stages are too noisy to flag
+
+
+def peak_rss_mb() -> float:
+    """High-water mark of this process's resident set size in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def time_stage(stages: Dict[str, Dict[str, Any]], name: str, run: Callable[[], Any], items: int,
+               size_bytes: Optional[Callable[[Any], int]] = None) -> Any:
+    """
+    Run one stage and record its wall time, throughput and peak RSS.
+
+    `size_bytes` maps the stage's result to the bytes it read or wrote, for MB/s.
+    """
+    start = time.perf_counter()
+    result = run()
+    seconds = time.perf_counter() - start
+    stage = {
+        'seconds': round(seconds, 4),
+        'items': items,
+        'items_per_second': round(items / seconds, 1) if seconds else None,
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+    }
+    if size_bytes is not None:
+        stage['mb_per_second'] = round(size_bytes(result) / 1_000_000 / seconds, 2) if seconds else None
+    stages[name] = stage
+    print(f"  {name:<20} {seconds:8.3f}s  {stage['items_per_second'] or 0:>12,.0f} items/s  "
+          f"peak RSS {stage['peak_rss_mb']:,.0f} MB")
+    return result
+
+
+def run_scale(scale: int, seed_value: int, workdir: Optional[str]) -> Dict[str, Any]:
+    """Benchmark every stage at one scale (runs in its own process)."""
+    seed = load_seed_generator()
+    stages: Dict[str, Dict[str, Any]] = {}
+
+    with tempfile.TemporaryDirectory(prefix='bench-seed-', dir=workdir) as temp_dir:
+        root = Path(temp_dir)
+        applications_dir = root / '04_Applications'
+
+        print(f"\n🧪 {scale:,} folders: generating synthetic data...")
+        setup_start = time.perf_counter()
+        write_applications_tree(applications_dir, scale, seed_value)
+        profile = generate_master_profile(random.Random(seed_value), scale)
+        setup_seconds = time.perf_counter() - setup_start
+        corpus_bytes = sum(path.stat().st_size for path in applications_dir.glob('*/job-spec.md'))
+        profile_bytes = len(profile.encode('utf-8'))
+        print(f"  Corpus {corpus_bytes / 1_000_000:.1f} MB, profile {profile_bytes / 1000:.0f} KB "
+              f"({setup_seconds:.1f}s)")
+
+        def scan() -> List[ApplicationFolder]:
+            # Same listing, ordering and job-spec.md stats as generate-seed-data.py
+            folders = sorted(sorted(list_application_folders(applications_dir)), key=seed.folder_sort_key)
+            return list(scan_applications(folders))
+
+        def parse(applications: List[ApplicationFolder]) -> List[Dict[str, Any]]:
+            jobs = []
+            for folder, spec_path, _ in applications:
+                job = seed.parse_job_spec(spec_path, folder.name, seed.parse_folder_name(folder.name)['date'])
+                if job:
+                    jobs.append(job)
+            return jobs
+
+        def dump() -> int:
+            with JsonSeedWriter(root / 'seed-data.json') as writer:
+                for job in jobs:
+                    writer.write(job)
+            return (root / 'seed-data.json').stat().st_size
+
+        applications = time_stage(stages, 'folder_scan', scan, scale)
+        jobs = time_stage(stages, 'parse_job_spec', lambda: parse(applications), len(applications),
+                          lambda _: corpus_bytes)
+        time_stage(stages, 'generate_sql_insert',
+                   lambda: sum(len(seed.generate_sql_insert(job, order)) for order, job in enumerate(jobs)),
+                   len(jobs), lambda sql_length: sql_length)
+        time_stage(stages, 'json_dump', dump, len(jobs), lambda json_bytes: json_bytes)
+        time_stage(stages, 'parse_profile', lambda: parse_profile(profile), scale, lambda _: profile_bytes)
+        time_stage(stages, 'build_profile_data', lambda: build_profile_data(profile), scale, lambda _: profile_bytes)
+
+    return {
+        'folders': scale,
+        'jobs_parsed': len(jobs),
+        'corpus_mb': round(corpus_bytes / 1_000_000, 2),
+        'profile_experiences': scale,
+        'profile_kb': round(profile_bytes / 1000, 1),
+        'setup_seconds': round(setup_seconds, 2),
+        'stages': stages,
+    }
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=Path(__file__).parent, check=True).stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def find_regressions(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """
+    Stages whose throughput fell more than `tolerance` below the baseline at
+    the same scale. Stages shorter than MIN_COMPARED_SECONDS are skipped.
+    """
+    baseline_scales = {entry['folders']: entry for entry in baseline.get('scales', [])}
+    regressions = []
+    for entry in results['scales']:
+        before = baseline_scales.get(entry['folders'])
+        if before is None:
+            continue
+        for name, stage in entry['stages'].items():
+            previous = before['stages'].get(name, {}).get('items_per_second')
+            current = stage['items_per_second']
+            if stage['seconds'] < MIN_COMPARED_SECONDS:
+                continue
+            if previous and current and current < previous * (1 - tolerance):
+                regressions.append(f"{entry['folders']:,} folders / {name}: "
+                                   f"{current:,.0f} items/s vs {previous:,.0f} ({current / previous - 1:+.0%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the seed and profile migration pipelines')
+    parser.add_argument('--scales', type=int, nargs='+', default=DEFAULT_SCALES,
+                        help='Application folders (and profile experiences) per run (default: 10 1000 100000)')
+    parser.add_argument('--seed', type=int, default=42, help='Synthetic data random seed (default: 42)')
+    parser.add_argument('--output', type=str, default=str(DEFAULT_OUTPUT),
+                        help=f'JSON results file (default: app/scripts/{DEFAULT_OUTPUT.name})')
+    parser.add_argument('--workdir', type=str, default=None,
+                        help='Directory for the generated trees (default: system temp directory)')
+    parser.add_argument('--baseline', type=str, default=None,
+                        help='Earlier results file to compare throughput against')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help=f'Throughput drop that counts as a regression (default: {DEFAULT_TOLERANCE:.0%}%)')
+    args = parser.parse_args()
+
+    if any(scale < 1 for scale in args.scales):
+        parser.error('--scales must be at least 1')
+
+    results: Dict[str, Any] = {
+        'created_at': datetime.now().isoformat(),
+        'git_commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': args.seed,
+        'scales': [],
+    }
+
+    for scale in args.scales:
+        # A fresh process per scale keeps each peak RSS independent
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as executor:
+            results['scales'].append(executor.submit(run_scale, scale, args.seed, args.workdir).result())
+
+    output = Path(args.output)
+    output.write_text(json.dumps(results, indent=2), encoding='utf-8')
+    print(f"\n💾 Results written to {output}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding='utf-8'))
+        regressions = find_regressions(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n❌ {len(regressions)} stages regressed by more than {args.tolerance:.0%} "
+                  f"against {args.baseline}:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            return 1
+        print(f"\n✅ No stage regressed by more than {args.tolerance:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,122 @@
+"""
+Shared date normalization for the profile and job-spec scripts.
+
+migrate_to_db.py (via profile_parser.py) turns "March 2023 - Present" style
+ranges and "(2010-2014)" education years into ISO dates, and
+generate-seed-data.py reads the YYYY-MM-DD suffix of application folder
+names. Both go through this module: each form is matched by one precompiled
+regex and results are memoized on the raw string, so bulk imports, where the
+same few hundred date strings repeat across thousands of entries, parse each
+distinct string once.
+
+Accepted forms:
+- Month names, full or abbreviated, any case, optional "." or ",":
+  "March 2023", "Mar 2023", "Sept. 2021", "march, 2023"
+- ISO: "2023-03", "2023-03-15"
+- Range separators: "-", en dash, em dash or "to"; "Present", "Current"
+  or "Now" as the end of an ongoing range
+"""
+
+import re
+from datetime import date
+from functools import lru_cache
+from typing import Optional, Tuple
+
+
+CACHE_SIZE = 4096
+
+MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+}
+
+# One date, or the open end of a range
+_DATE_RE = re.compile(
+    r'\b(?:'
+    r'(?P<month>jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?'
+    r'|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\.?,?\s+(?P<year>\d{4})'
+    r'|(?P<iso_year>\d{4})-(?P<iso_month>\d{1,2})(?:-\d{1,2})?'
+    r'|(?P<present>present|current|now)'
+    r')\b',
+    re.IGNORECASE
+)
+
+# "(2010-2014)" education years, with any dash
+_YEAR_RANGE_RE = re.compile(r'\((\d{4})\s*[-–—]\s*(\d{4})\)')
+
+_ISO_DATE_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+
+
+def _match_date(match: 're.Match[str]') -> Optional[str]:
+    """YYYY-MM-01 for a month/ISO _DATE_RE match, None for "Present" or an invalid month."""
+    if match.group('month'):
+        return f"{match.group('year')}-{MONTHS[match.group('month')[:3].lower()]:02d}-01"
+    if match.group('iso_year'):
+        month = int(match.group('iso_month'))
+        if 1 <= month <= 12:
+            return f"{match.group('iso_year')}-{month:02d}-01"
+    return None
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def normalize_month_year(text: str) -> Optional[str]:
+    """
+    First day of the month a date string names, e.g. 'Mar 2023' -> '2023-03-01'.
+    Returns None when no month and year are found.
+    """
+    for match in _DATE_RE.finditer(text):
+        normalized = _match_date(match)
+        if normalized:
+            return normalized
+    return None
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def normalize_date_range(text: str) -> Tuple[Optional[str], Optional[str], bool]:
+    """
+    Parse 'March 2023 - Present', 'Jun 2022 – Mar 2023' or '2021-04 to 2022-01'.
+    Returns (start_date, end_date, is_current) with dates as YYYY-MM-01.
+    """
+    dates = []
+    is_current = False
+    for match in _DATE_RE.finditer(text):
+        if match.group('present'):
+            is_current = True
+            continue
+        normalized = _match_date(match)
+        if normalized:
+            dates.append(normalized)
+    start_date = dates[0] if dates else None
+    end_date = dates[1] if len(dates) > 1 and not is_current else None
+    return start_date, end_date, is_current
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def normalize_year_range(text: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Parse the '(2010-2014)' years of an education line.
+    Returns (start_date, end_date) as YYYY-01-01 and YYYY-12-31.
+    """
+    match = _YEAR_RANGE_RE.search(text)
+    if not match:
+        return None, None
+    return f"{match.group(1)}-01-01", f"{match.group(2)}-12-31"
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def normalize_iso_date(text: str) -> Optional[str]:
+    """`text` if it is exactly a valid YYYY-MM-DD date, else None."""
+    match = _ISO_DATE_RE.fullmatch(text.strip())
+    if not match:
+        return None
+    try:
+        date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+    except ValueError:
+        return None
+    return match.group(0)
+
+
+def clear_caches() -> None:
+    """Drop every memoized result (for benchmarks)."""
+    for function in (normalize_month_year, normalize_date_range, normalize_year_range, normalize_iso_date):
+        function.cache_clear()
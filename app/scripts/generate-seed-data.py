@@ -9,33 +9,64 @@ This script:
 
 Usage:
     python3 generate-seed-data.py
+    python3 generate-seed-data.py --workers 8    # Parse job specs in 8 processes
+    python3 generate-seed-data.py load           # Upsert jobs straight into Postgres
+    python3 generate-seed-data.py watch --sink db   # Keep Postgres in sync as job specs are edited
+    python3 generate-seed-data.py backfill-salaries # Fill the migration 028 salary columns of existing jobs
+    python3 generate-seed-data.py --include-dumps   # Also add postings from 05_Tracking dumps
+    python3 generate-seed-data.py --columnar     # Also write seed-data.npz for seed_columns.py
+    python3 generate-seed-data.py --dedupe       # One job per cluster of near-duplicate descriptions
+    python3 generate-seed-data.py --profile --profile-output seed.pstats   # Stage timings and cProfile
 """
 
 import os
-import re
+import sys
 import json
+import argparse
+from collections import deque
+from contextlib import nullcontext
+from itertools import chain
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, Optional, Any, NamedTuple, Iterable, Iterator, Tuple
 import uuid
 
+from application_scanner import SPEC_FILE_NAME, ApplicationFolder, list_application_folders, scan_applications
+from date_normalization import normalize_iso_date
+from job_dedupe import DEFAULT_THRESHOLD, NearDuplicateFilter
+from job_search_dumps import DUMP_GLOB, TRACKING_DIR, iter_dump_jobs
+from job_spec_fields import extract_fields
+from seed_manifest import ManifestEntry, SeedManifest, content_hash
+from seed_loader import DEFAULT_CHUNK_SIZE, DEFAULT_DATABASE_URL, SEED_USER_ID, JobLoader, backfill_salaries
+from salary_normalization import add_salary_fields
+from seed_columns import COLUMNAR_FILE, ColumnarSeedWriter
+from seed_output import DEFAULT_BATCH_SIZE, SQL_FORMATS, JsonSeedWriter, SeedStats, SqlSeedWriter
+from seed_watch import DEFAULT_INTERVAL, DELTA_SINKS, SpecWatcher, SyncState, open_delta_sink, sink_key, watch
+from stage_profiler import StageProfiler, lap_timer, profile_calls
+
 
 # Constants
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 APPLICATIONS_DIR = PROJECT_ROOT / "04_Applications"
 OUTPUT_SQL_FILE = PROJECT_ROOT / "app" / "supabase" / "migrations" / "003_seed_jobs.sql"
 OUTPUT_JSON_FILE = PROJECT_ROOT / "app" / "scripts" / "seed-data.json"
+MANIFEST_FILE = PROJECT_ROOT / "app" / "scripts" / ".seed-manifest.sqlite"
+WATCH_STATE_FILE = PROJECT_ROOT / "app" / "scripts" / ".seed-watch.sqlite"
+DEDUPE_REPORT_FILE = PROJECT_ROOT / "app" / "scripts" / "seed-dedupe-report.json"
+DEFAULT_SCAN_WORKERS = 1
 
 
 def parse_folder_name(folder_name: str) -> Dict[str, str]:
     """
     Parse folder name to extract company, position, and date.
     Format: CompanyName_PositionTitle_YYYY-MM-DD
+    The date is empty when the last part isn't a valid YYYY-MM-DD date.
     """
     parts = folder_name.split('_')
 
     # Date is always the last part (YYYY-MM-DD)
-    date_str = parts[-1] if len(parts) > 0 else ""
+    date_str = (normalize_iso_date(parts[-1]) or "") if len(parts) > 0 else ""
 
     # Company is the first part
     company = parts[0] if len(parts) > 0 else ""
@@ -50,245 +81,227 @@ def parse_folder_name(folder_name: str) -> Dict[str, str]:
     }
 
 
-def extract_match_percentage(content: str) -> Optional[int]:
-    """Extract match percentage from job spec content."""
-    # Try various patterns
-    patterns = [
-        r'\*\*Match Score:\s*(\d+)%\*\*',
-        r'\*\*Match Percentage:\s*(\d+)%\*\*',
-        r'Match Score:\s*(\d+)%',
-        r'Match Percentage:\s*(\d+)%',
-        r'Match.*?:\s*(\d+)%',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, content, re.IGNORECASE)
-        if match:
-            return int(match.group(1))
-
-    return None
-
-
-def extract_company_info(content: str, folder_company: str) -> str:
-    """Extract company name from job spec."""
-    # Try to find company in markdown
-    patterns = [
-        r'\*\*Company\*\*:\s*(.+?)(?:\n|$)',
-        r'##\s*Company Information.*?\*\*Company\*\*:\s*(.+?)(?:\n|$)',
-        r'Company:\s*(.+?)(?:\n|$)',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, content, re.MULTILINE)
-        if match:
-            return match.group(1).strip()
-
-    return folder_company
-
-
-def extract_position_title(content: str, folder_position: str) -> str:
-    """Extract position title from job spec."""
-    patterns = [
-        r'\*\*Title\*\*:\s*(.+?)(?:\n|$)',
-        r'\*\*Position\*\*:\s*(.+?)(?:\n|$)',
-        r'Position:\s*(.+?)(?:\n|$)',
-        r'Title:\s*(.+?)(?:\n|$)',
-        r'^#\s*(.+?)(?:\n|$)',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, content, re.MULTILINE)
-        if match:
-            title = match.group(1).strip()
-            # Clean up title
-            title = re.sub(r'\*\*Match.*?:\s*\d+%\*\*', '', title).strip()
-            title = re.sub(r'-\s*Very Strong Match', '', title).strip()
-            if title:
-                return title
-
-    return folder_position
-
-
-def extract_location(content: str) -> Optional[str]:
-    """Extract location from job spec."""
-    patterns = [
-        r'\*\*Location\*\*:\s*(.+?)(?:\n|$)',
-        r'Location:\s*(.+?)(?:\n|$)',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, content, re.MULTILINE)
-        if match:
-            return match.group(1).strip()
-
-    return None
-
-
-def extract_salary_range(content: str) -> Optional[str]:
-    """Extract salary range from job spec."""
-    patterns = [
-        r'\*\*Salary Range\*\*:\s*(.+?)(?:\n|$)',
-        r'\*\*Compensation\*\*:\s*(.+?)(?:\n|$)',
-        r'Salary Range:\s*(.+?)(?:\n|$)',
-        r'Compensation:\s*(.+?)(?:\n|$)',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, content, re.MULTILINE)
-        if match:
-            return match.group(1).strip()
-
-    return None
-
-
-def extract_job_type(content: str) -> Optional[str]:
-    """Extract job type from job spec."""
-    patterns = [
-        r'\*\*Type\*\*:\s*(.+?)(?:\n|$)',
-        r'\*\*Employment Type\*\*:\s*(.+?)(?:\n|$)',
-        r'Type:\s*(.+?)(?:\n|$)',
-        r'Employment Type:\s*(.+?)(?:\n|$)',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, content, re.MULTILINE)
-        if match:
-            return match.group(1).strip()
-
-    return None
-
-
-def extract_original_url(content: str) -> Optional[str]:
-    """Extract original job posting URL from job spec."""
-    patterns = [
-        r'\*\*Source URL\*\*:\s*(https?://[^\s\)]+)',
-        r'\*\*Job URL\*\*:\s*(https?://[^\s\)]+)',
-        r'Source URL:\s*(https?://[^\s\)]+)',
-        r'Job URL:\s*(https?://[^\s\)]+)',
-        r'\(https?://[^\s\)]+\)',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, content)
-        if match:
-            url = match.group(1) if match.lastindex else match.group(0)
-            return url.strip('()')
-
-    return None
-
-
-def extract_match_analysis(content: str) -> Dict[str, List[str]]:
-    """Extract match analysis with strengths, partial matches, and gaps."""
-    analysis = {
-        'strengths': [],
-        'partial_matches': [],
-        'gaps': []
-    }
+def read_job_spec(file_path: Path) -> str:
+    """Read a job-spec.md file."""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return f.read()
 
-    # Extract strengths
-    strengths_section = re.search(
-        r'(?:### Strong Matches|### Strengths?).*?(?=###|\Z)',
-        content,
-        re.DOTALL | re.IGNORECASE
-    )
-    if strengths_section:
-        strengths_text = strengths_section.group(0)
-        strengths = re.findall(r'[-\*]\s*[✅✓]\s*\*\*(.+?)\*\*', strengths_text)
-        if not strengths:
-            strengths = re.findall(r'[-\*]\s*✅\s*(.+?)(?:\n|$)', strengths_text)
-        analysis['strengths'] = [s.strip() for s in strengths[:5]]  # Limit to top 5
-
-    # Extract partial matches
-    partial_section = re.search(
-        r'### Partial Matches.*?(?=###|\Z)',
-        content,
-        re.DOTALL | re.IGNORECASE
-    )
-    if partial_section:
-        partial_text = partial_section.group(0)
-        partials = re.findall(r'[-\*]\s*[⚠️🟡]\s*\*\*(.+?)\*\*', partial_text)
-        if not partials:
-            partials = re.findall(r'[-\*]\s*⚠️\s*(.+?)(?:\n|$)', partial_text)
-        analysis['partial_matches'] = [p.strip() for p in partials[:5]]
-
-    # Extract gaps
-    gaps_section = re.search(
-        r'### Gaps.*?(?=###|\Z)',
-        content,
-        re.DOTALL | re.IGNORECASE
-    )
-    if gaps_section:
-        gaps_text = gaps_section.group(0)
-        gaps = re.findall(r'[-\*]\s*[❌]\s*\*\*(.+?)\*\*', gaps_text)
-        if not gaps:
-            gaps = re.findall(r'[-\*]\s*❌\s*(.+?)(?:\n|$)', gaps_text)
-        analysis['gaps'] = [g.strip() for g in gaps[:5]]
-
-    return analysis
-
-
-def extract_job_description(content: str) -> str:
-    """Extract job description text."""
-    # Try to find the job description section
-    patterns = [
-        r'## Job Description(.*?)(?=##|\Z)',
-        r'## Role Overview(.*?)(?=##|\Z)',
-        r'## About the Role(.*?)(?=##|\Z)',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, content, re.DOTALL | re.IGNORECASE)
-        if match:
-            desc = match.group(1).strip()
-            # Limit to first 1000 characters for seed data
-            return desc[:1000] if len(desc) > 1000 else desc
-
-    # If no section found, take first 500 characters after the header
-    lines = content.split('\n')
-    desc_lines = []
-    skip_count = 5  # Skip first few header lines
-    for line in lines[skip_count:]:
-        if line.strip():
-            desc_lines.append(line)
-        if len('\n'.join(desc_lines)) > 500:
-            break
-
-    return '\n'.join(desc_lines)[:500]
+
+def build_job_record(content: str, folder_name: str, folder_date: str,
+                     timings: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+    """
+    Build a job record from job-spec.md content, raising on any parse failure.
+
+    When `timings` is given, per-extractor seconds are added to it.
+    """
+    folder_info = parse_folder_name(folder_name)
+
+    return {
+        'id': str(uuid.uuid4()),
+        'created_at': f"{folder_date}T12:00:00Z" if folder_date else datetime.now().isoformat(),
+        'input_type': 'url',  # Most jobs are from URLs
+        'input_content': f"Job application for {folder_info['position']} at {folder_info['company']}",
+        **extract_fields(content, folder_info['company'], folder_info['position'], timings),
+        'status': 'to_submit',  # Default status for historical applications
+        'folder_path': f"04_Applications/{folder_name}",
+    }
 
 
 def parse_job_spec(file_path: Path, folder_name: str, folder_date: str) -> Optional[Dict[str, Any]]:
     """Parse a job-spec.md file and extract all relevant data."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        folder_info = parse_folder_name(folder_name)
-
-        job_data = {
-            'id': str(uuid.uuid4()),
-            'created_at': f"{folder_date}T12:00:00Z" if folder_date else datetime.now().isoformat(),
-            'input_type': 'url',  # Most jobs are from URLs
-            'input_content': f"Job application for {folder_info['position']} at {folder_info['company']}",
-            'original_url': extract_original_url(content),
-            'company_name': extract_company_info(content, folder_info['company']),
-            'position_title': extract_position_title(content, folder_info['position']),
-            'location': extract_location(content),
-            'salary_range': extract_salary_range(content),
-            'job_type': extract_job_type(content),
-            'job_description_text': extract_job_description(content),
-            'match_percentage': extract_match_percentage(content),
-            'match_analysis': extract_match_analysis(content),
-            'status': 'to_submit',  # Default status for historical applications
-            'folder_path': f"04_Applications/{folder_name}",
-        }
-
-        return job_data
-
+        return build_job_record(read_job_spec(file_path), folder_name, folder_date)
     except Exception as e:
         print(f"Error parsing {file_path}: {e}")
         return None
 
 
+class FolderParseResult(NamedTuple):
+    """Outcome of parsing one application folder."""
+    folder_name: str
+    job: Optional[Dict[str, Any]]
+    error: Optional[str]
+    content_hash: Optional[str]  # None when the folder has no job-spec.md
+    unchanged: bool = False  # Content matched the known hash, so parsing was skipped
+    timings: Optional[Dict[str, float]] = None  # Seconds per stage, with profile=True
+
+
+def parse_application_folder(folder: Path, known_hash: Optional[str] = None,
+                             profile: bool = False) -> FolderParseResult:
+    """
+    Parse the job-spec.md of one application folder.
+
+    When `known_hash` matches the file content, parsing is skipped and the
+    result is flagged as unchanged. Runs inside worker processes, so errors
+    are returned instead of printed, and with `profile` the read, hash and
+    per-extractor timings are returned too.
+    """
+    timings: Optional[Dict[str, float]] = {} if profile else None
+    extract_timings: Optional[Dict[str, float]] = {} if profile else None
+    lap = lap_timer(timings)
+    job_spec_file = folder / SPEC_FILE_NAME
+
+    try:
+        # Opening is the existence check: no separate stat round trip
+        try:
+            content = read_job_spec(job_spec_file)
+        except FileNotFoundError:
+            return FolderParseResult(folder.name, None, None, None)
+        lap('read')
+        sha256 = content_hash(content)
+        lap('hash')
+        if sha256 == known_hash:
+            return FolderParseResult(folder.name, None, None, sha256, unchanged=True, timings=timings)
+
+        folder_info = parse_folder_name(folder.name)
+        job_data = build_job_record(content, folder.name, folder_info['date'], extract_timings)
+        lap('parse_job_spec')
+        if profile:
+            timings.update((f"extract.{name}", seconds) for name, seconds in extract_timings.items())
+        return FolderParseResult(folder.name, job_data, None, sha256, timings=timings)
+    except Exception as e:
+        return FolderParseResult(folder.name, None, f"Error parsing {job_spec_file}: {e}", None)
+
+
+def folder_sort_key(folder: Path) -> Tuple[bool, str]:
+    """
+    Sort key that matches the created_at order of the parsed jobs.
+
+    created_at comes from the folder date, so folders can be put in final
+    order before anything is parsed and jobs streamed straight to the output.
+    Folders without a date get the current time as created_at, so they sort last.
+    """
+    date = parse_folder_name(folder.name)['date']
+    return (not date, f"{date}T12:00:00Z")
+
+
+class _FolderPlan(NamedTuple):
+    folder: Path
+    folder_path: str
+    entry: Optional[ManifestEntry]
+    stat: Optional[os.stat_result]
+    cached: bool
+
+
+def _plan_folder(application: ApplicationFolder, manifest: Optional[SeedManifest], full: bool) -> _FolderPlan:
+    """
+    Decide whether a folder's cached parse can be reused.
+
+    A matching mtime/size (from the scanner's stat) is trusted without
+    reading the file; otherwise the worker re-reads it and only re-parses
+    when the content hash changed.
+    """
+    folder, _, stat = application
+    folder_path = f"04_Applications/{folder.name}"
+    entry = manifest.get(folder_path) if manifest else None
+
+    cached = (
+        entry is not None and entry.job is not None and stat is not None
+        and not full and entry.matches_stat(stat)
+    )
+    return _FolderPlan(folder, folder_path, entry, stat, cached)
+
+
+def iter_jobs(applications: Iterable[ApplicationFolder], workers: int = 1, manifest: Optional[SeedManifest] = None,
+              full: bool = False, stats: Optional[Dict[str, Any]] = None,
+              profiler: Optional[StageProfiler] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Yield parsed jobs in folder order, reusing manifest entries for unchanged specs.
+
+    `applications` come from application_scanner.scan_applications. With workers > 1 folders are parsed in a process pool. At most a small
+    window of folders is in flight at a time, so memory stays bounded no
+    matter how large the archive is. Parse errors and reuse counts are
+    collected into `stats` ('errors', 'reused', 'parsed'). With a `profiler`,
+    per-folder timings from the parsers are merged into it and the per-job
+    progress lines are left out.
+    """
+    if stats is None:
+        stats = {}
+    stats.setdefault('errors', [])
+    stats.setdefault('reused', 0)
+    stats.setdefault('parsed', 0)
+
+    def known_hash(plan: _FolderPlan) -> Optional[str]:
+        entry = plan.entry
+        return entry.sha256 if entry is not None and entry.job is not None and not full else None
+
+    def finish(plan: _FolderPlan, result: Optional[FolderParseResult]) -> Optional[Dict[str, Any]]:
+        folder, folder_path, entry, stat, _ = plan
+        if manifest and stat is not None:
+            manifest.mark_seen(folder_path)
+        if profiler and result is not None and result.timings:
+            profiler.add_timings(result.timings)
+            # extract.* entries are already inside the parse_job_spec lap
+            profiler.record_file(f"{folder_path}/job-spec.md", sum(
+                seconds for stage, seconds in result.timings.items() if not stage.startswith('extract.')
+            ))
+
+        if result is None:
+            stats['reused'] += 1
+            job_data = entry.job
+        elif result.error:
+            stats['errors'].append(result.error)
+            print(f"  ❌ {result.error}")
+            return None
+        elif result.unchanged:
+            # Touched but not edited: keep the cached record, refresh the stat
+            stats['reused'] += 1
+            job_data = entry.job
+            manifest.record(folder_path, stat, result.content_hash, entry.job_id, job_data)
+        elif result.job:
+            stats['parsed'] += 1
+            job_data = result.job
+            if entry is not None:
+                job_data['id'] = entry.job_id  # Keep ids stable across edits
+            if manifest and stat is not None:
+                manifest.record(folder_path, stat, result.content_hash, job_data['id'], job_data)
+        else:
+            print(f"  ⚠️  Skipping {folder.name} - no job-spec.md found")
+            return None
+
+        if profiler is None:
+            print(f"  ✅ {job_data['company_name']} - {job_data['position_title']}")
+        return job_data
+
+    profile = profiler is not None
+    plans = (_plan_folder(application, manifest, full) for application in applications)
+    if profiler:
+        plans = profiler.timed('plan', plans)
+
+    if workers <= 1:
+        for plan in plans:
+            result = None if plan.cached else parse_application_folder(plan.folder, known_hash(plan), profile)
+            job_data = finish(plan, result)
+            if job_data:
+                yield job_data
+    else:
+        # Ordered window of (plan, future); cached folders ride along with no future
+        window_size = workers * 8
+        window = deque()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for plan in plans:
+                future = None if plan.cached else executor.submit(
+                    parse_application_folder, plan.folder, known_hash(plan), profile
+                )
+                window.append((plan, future))
+                while len(window) > window_size or (window and window[0][1] is None):
+                    head, head_future = window.popleft()
+                    job_data = finish(head, head_future.result() if head_future else None)
+                    if job_data:
+                        yield job_data
+
+            while window:
+                head, head_future = window.popleft()
+                job_data = finish(head, head_future.result() if head_future else None)
+                if job_data:
+                    yield job_data
+
+    if manifest:
+        with profiler.stage('manifest_commit') if profiler else nullcontext():
+            manifest.prune_unseen()
+            manifest.commit()
+
+
 def generate_sql_insert(job: Dict[str, Any], order: int) -> str:
     """Generate SQL INSERT statement for a job."""
 
@@ -351,86 +364,288 @@ INSERT INTO jobs (
 );"""
 
 
+def add_database_arguments(subparser: argparse.ArgumentParser) -> None:
+    subparser.add_argument('--database-url', type=str, default=DEFAULT_DATABASE_URL,
+                           help='Postgres connection URL (default: $SUPABASE_DB_URL, $DATABASE_URL '
+                                'or the local Supabase database)')
+    subparser.add_argument('--created-by', type=str, default=SEED_USER_ID,
+                           help='Owner user id for loaded jobs (default: seed placeholder user)')
+
+
 def main():
     """Main function to generate seed data."""
+    parser = argparse.ArgumentParser(description='Generate seed data from 04_Applications')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Number of processes used to parse job specs (default: 1)')
+    parser.add_argument('--scan-workers', type=int, default=DEFAULT_SCAN_WORKERS,
+                        help='Threads listing shards and stat-ing job specs; more helps on network mounts '
+                             f'(default: {DEFAULT_SCAN_WORKERS})')
+    parser.add_argument('--scan-depth', type=int, default=1,
+                        help='Directory levels from 04_Applications to the application folders, '
+                             'e.g. 2 for 04_Applications/<shard>/<folder> (default: 1)')
+    parser.add_argument('--manifest', type=str, default=str(MANIFEST_FILE),
+                        help='Path to the incremental parse manifest (default: app/scripts/.seed-manifest.sqlite)')
+    parser.add_argument('--no-manifest', action='store_true',
+                        help='Parse every job spec without reading or updating the manifest')
+    parser.add_argument('--full', action='store_true',
+                        help='Re-parse every job spec but keep job ids from the manifest')
+    parser.add_argument('--sql-format', choices=SQL_FORMATS, default='insert',
+                        help='insert: one INSERT per job (default); values: multi-row INSERT batches; '
+                             'copy: COPY jobs FROM STDIN block for psql')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f'Rows per INSERT with --sql-format values (default: {DEFAULT_BATCH_SIZE})')
+    parser.add_argument('--columnar', action='store_true',
+                        help=f'Also write the report columns to {COLUMNAR_FILE.name} (NumPy .npz) '
+                             'for seed_columns.py analytics')
+    parser.add_argument('--include-dumps', action='store_true',
+                        help=f'Also add every posting in 05_Tracking/{DUMP_GLOB}, streamed one at a time')
+    parser.add_argument('--dedupe', action='store_true',
+                        help='Keep only the first job of each cluster of near-duplicate descriptions '
+                             f'and write the merged sources to {DEDUPE_REPORT_FILE.name}')
+    parser.add_argument('--dedupe-threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'Estimated Jaccard similarity that counts as a duplicate (default: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--profile', action='store_true',
+                        help='Time every stage and extractor, list the slowest job specs, and print a '
+                             'summary instead of per-job progress')
+    parser.add_argument('--profile-output', type=str, default=None,
+                        help='With --profile, also run under cProfile and write pstats to this file '
+                             '(main process only; use --workers 1 to include parsing)')
+
+    subparsers = parser.add_subparsers(dest='command')
+    load_parser = subparsers.add_parser(
+        'load', help='Upsert parsed jobs straight into Postgres instead of writing seed files'
+    )
+    add_database_arguments(load_parser)
+    load_parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                             help=f'Rows per upsert transaction (default: {DEFAULT_CHUNK_SIZE})')
+    watch_parser = subparsers.add_parser(
+        'watch', help='Keep running and sync created, edited and deleted job specs as deltas'
+    )
+    watch_parser.add_argument('--sink', choices=DELTA_SINKS, default='jsonl',
+                              help='sql: upsert/delete statements; jsonl: one JSON delta per line (default); '
+                                   'db: apply straight to Postgres')
+    watch_parser.add_argument('--output', type=str, default=None,
+                              help='File the sql and jsonl sinks append to (default: stdout)')
+    watch_parser.add_argument('--interval', type=float, default=DEFAULT_INTERVAL,
+                              help=f'Seconds between polls of 04_Applications (default: {DEFAULT_INTERVAL})')
+    watch_parser.add_argument('--once', action='store_true',
+                              help='Sync the changes since the last run, then exit')
+    watch_parser.add_argument('--state', type=str, default=str(WATCH_STATE_FILE),
+                              help='What each sink has acknowledged, kept apart from the manifest '
+                                   f'(default: app/scripts/{WATCH_STATE_FILE.name})')
+    add_database_arguments(watch_parser)
+    backfill_parser = subparsers.add_parser(
+        'backfill-salaries', help='Parse salary_range of every job already in Postgres into the salary columns'
+    )
+    backfill_parser.add_argument('--database-url', type=str, default=DEFAULT_DATABASE_URL,
+                                 help='Postgres connection URL (default: $SUPABASE_DB_URL, $DATABASE_URL '
+                                      'or the local Supabase database)')
+    backfill_parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                                 help=f'Rows per update transaction (default: {DEFAULT_CHUNK_SIZE})')
+    args = parser.parse_args()
+
+    if args.workers < 1:
+        parser.error('--workers must be at least 1')
+    if args.scan_workers < 1 or args.scan_depth < 1:
+        parser.error('--scan-workers and --scan-depth must be at least 1')
+    if args.batch_size < 1:
+        parser.error('--batch-size must be at least 1')
+    if args.command in ('load', 'backfill-salaries') and args.chunk_size < 1:
+        parser.error('--chunk-size must be at least 1')
+    if args.command == 'watch' and args.interval <= 0:
+        parser.error('--interval must be positive')
+    if not 0 < args.dedupe_threshold <= 1:
+        parser.error('--dedupe-threshold must be between 0 and 1')
+    if args.profile_output and not args.profile:
+        parser.error('--profile-output requires --profile')
+
+    if args.command == 'watch':
+        run_watch(args)
+        return
+    if args.command == 'backfill-salaries':
+        run_backfill_salaries(args)
+        return
+
+    profiler = StageProfiler() if args.profile else None
+    with profile_calls(args.profile_output):
+        generate(args, profiler)
+    if profiler:
+        profiler.print_summary('Seed generation profile')
+
+
+def run_backfill_salaries(args: argparse.Namespace) -> None:
+    """Fill salary_min/max/currency/period of jobs loaded before migration 028."""
+    print("💰 Backfilling salary columns from salary_range...")
+    try:
+        read, changed = backfill_salaries(args.database_url, args.chunk_size)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return
+    print(f"✅ {read} jobs with salary text, {changed} updated")
+
+
+def run_watch(args: argparse.Namespace) -> None:
+    """Poll 04_Applications and send a delta per created, edited or deleted job spec to the sink."""
+    manifest = None if args.no_manifest else SeedManifest(Path(args.manifest))
+    state = SyncState(Path(args.state), sink_key(args.sink, args.output, args.database_url, args.created_by))
+    try:
+        try:
+            sink = open_delta_sink(args.sink, args.output, args.database_url, args.created_by)
+        except RuntimeError as e:
+            print(f"❌ {e}")
+            return
+        watcher = SpecWatcher(APPLICATIONS_DIR, manifest, parse_application_folder,
+                              args.scan_depth, args.scan_workers, state)
+        # Progress goes to stderr so the sql and jsonl sinks can stream to stdout
+        print(f"👀 Watching {APPLICATIONS_DIR} every {args.interval}s ({watcher.folder_count} folders known, "
+              f"{args.sink} sink), Ctrl+C to stop", file=sys.stderr)
+        try:
+            totals = watch(watcher, sink, args.interval, args.once)
+        finally:
+            sink.close()
+    finally:
+        state.close()
+        if manifest:
+            manifest.close()
+    print(f"\n✨ Upserted {totals['upsert']}, deleted {totals['delete']}, "
+          f"{totals['unchanged']} touched but unchanged, {totals['errors']} errors", file=sys.stderr)
+
+
+def generate(args: argparse.Namespace, profiler: Optional[StageProfiler] = None) -> None:
+    """Parse the applications (and dumps) and write or load the seed data."""
+
+    def stage(name: str):
+        return profiler.stage(name) if profiler else nullcontext()
+
     print("🌱 Generating seed data from job applications...")
     print(f"📁 Scanning: {APPLICATIONS_DIR}")
 
-    # Find all application folders
-    application_folders = [
-        d for d in APPLICATIONS_DIR.iterdir()
-        if d.is_dir() and not d.name.startswith('.')
-    ]
+    # Find all application folders (directory entry types only, no stat per folder)
+    with stage('scan'):
+        application_folders = list_application_folders(APPLICATIONS_DIR, args.scan_depth, args.scan_workers)
 
     print(f"📊 Found {len(application_folders)} application folders")
 
+    dump_files = sorted(TRACKING_DIR.glob(DUMP_GLOB)) if args.include_dumps else []
+    if args.include_dumps:
+        print(f"📊 Found {len(dump_files)} job-search dumps in {TRACKING_DIR}")
+
     # Parse all job specs
-    jobs = []
-    for folder in sorted(application_folders):
-        job_spec_file = folder / "job-spec.md"
-        if job_spec_file.exists():
-            folder_info = parse_folder_name(folder.name)
-            job_data = parse_job_spec(job_spec_file, folder.name, folder_info['date'])
-            if job_data:
-                jobs.append(job_data)
-                print(f"  ✅ {job_data['company_name']} - {job_data['position_title']}")
+    if args.workers > 1:
+        print(f"⚙️  Parsing with {args.workers} worker processes")
+
+    with stage('manifest_open'):
+        manifest = None if args.no_manifest else SeedManifest(Path(args.manifest))
+    with stage('sort'):
+        folders = sorted(sorted(application_folders), key=folder_sort_key)
+    parse_stats: Dict[str, Any] = {}
+    summary = SeedStats()
+
+    dedupe = NearDuplicateFilter(args.dedupe_threshold) if args.dedupe else None
+
+    def jobs() -> Iterator[Dict[str, Any]]:
+        # Dump postings follow the application folders, streamed the same way
+        # job-spec.md stats run ahead of parsing in --scan-workers threads
+        applications = scan_applications(folders, args.scan_workers)
+        parsed = chain(iter_jobs(applications, args.workers, manifest, args.full, parse_stats, profiler),
+                       iter_dump_jobs(dump_files))
+        if dedupe:
+            parsed = dedupe.unique(parsed)
+        # Numeric salary_min/max, currency and period from salary_range (also for cached jobs)
+        parsed = map(add_salary_fields, parsed)
+        # 'next_job' is the wall time the writers wait for each job: parsing, dumps and dedupe
+        return profiler.timed('next_job', parsed) if profiler else parsed
+
+    # Jobs are parsed, written and dropped one at a time
+    loader = None
+    try:
+        if args.command == 'load':
+            try:
+                loader = JobLoader(args.database_url, args.created_by, args.chunk_size)
+            except RuntimeError as e:
+                print(f"❌ {e}")
+                return
+            with loader:
+                for job_data in jobs():
+                    with stage('load'):
+                        loader.write(job_data)
+                    summary.add(job_data)
         else:
-            print(f"  ⚠️  Skipping {folder.name} - no job-spec.md found")
-
-    print(f"\n✨ Successfully parsed {len(jobs)} jobs")
-
-    # Sort jobs by created_at date
-    jobs.sort(key=lambda x: x['created_at'])
-
-    # Generate SQL seed file
-    print(f"\n📝 Generating SQL seed file: {OUTPUT_SQL_FILE}")
-    sql_content = """-- Seed data for jobs table
--- Generated from 04_Applications folder
--- Date: """ + datetime.now().strftime('%Y-%m-%d %H:%M:%S') + """
-
--- Clear existing seed data (optional - comment out if you want to keep existing data)
--- DELETE FROM jobs WHERE folder_path LIKE '04_Applications/%';
-
-"""
-
-    for idx, job in enumerate(jobs):
-        sql_content += generate_sql_insert(job, idx)
-
-    OUTPUT_SQL_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(OUTPUT_SQL_FILE, 'w', encoding='utf-8') as f:
-        f.write(sql_content)
-
-    print(f"  ✅ SQL file created with {len(jobs)} INSERT statements")
-
-    # Generate JSON seed file
-    print(f"\n📝 Generating JSON seed file: {OUTPUT_JSON_FILE}")
-    json_content = {
-        'generated_at': datetime.now().isoformat(),
-        'total_jobs': len(jobs),
-        'jobs': jobs
-    }
-
-    with open(OUTPUT_JSON_FILE, 'w', encoding='utf-8') as f:
-        json.dump(json_content, f, indent=2, ensure_ascii=False)
-
-    print(f"  ✅ JSON file created with {len(jobs)} job records")
+            try:
+                columnar_writer = ColumnarSeedWriter(COLUMNAR_FILE) if args.columnar else None
+            except RuntimeError as e:
+                print(f"❌ {e}")
+                return
+            with SqlSeedWriter(OUTPUT_SQL_FILE, generate_sql_insert,
+                               args.sql_format, args.batch_size) as sql_writer, \
+                    JsonSeedWriter(OUTPUT_JSON_FILE) as json_writer, \
+                    columnar_writer or nullcontext():
+                for job_data in jobs():
+                    with stage('write_sql'):
+                        sql_writer.write(job_data)
+                    with stage('write_json'):
+                        json_writer.write(job_data)
+                    if columnar_writer:
+                        with stage('write_columnar'):
+                            columnar_writer.write(job_data)
+                    summary.add(job_data)
+    finally:
+        if manifest:
+            manifest.close()
+
+    errors = parse_stats['errors']
+    print(f"\n✨ Successfully parsed {summary.total} jobs")
+    if manifest:
+        print(f"♻️  Reused {parse_stats['reused']} unchanged, parsed {parse_stats['parsed']} new or edited")
+    if args.include_dumps:
+        dumped = summary.total - parse_stats['reused'] - parse_stats['parsed']
+        if dedupe:
+            dumped += dedupe.duplicates
+        print(f"📥 Added {dumped} postings from {len(dump_files)} job-search dumps")
+    if dedupe:
+        dedupe.write_report(DEDUPE_REPORT_FILE)
+        print(f"🧬 Merged {dedupe.duplicates} near-duplicates, kept {summary.total} jobs "
+              f"(report: {DEDUPE_REPORT_FILE})")
+    if errors:
+        print(f"⚠️  {len(errors)} folders failed to parse:")
+        for error in errors:
+            print(f"  - {error}")
+
+    if loader:
+        print(f"\n🗄️  Loaded into Postgres in {loader.chunks} chunks")
+        print(f"  ✅ {loader.count} rows upserted ({loader.written} inserted or changed, "
+              f"{loader.count - loader.written} unchanged)")
+        print(f"  ⏱️  {loader.seconds:.2f}s ({loader.rows_per_second:,.0f} rows/s)")
+    else:
+        print(f"\n📝 SQL seed file: {OUTPUT_SQL_FILE}")
+        if args.sql_format == 'insert':
+            print(f"  ✅ SQL file created with {summary.total} INSERT statements")
+        elif args.sql_format == 'values':
+            batches = -(-summary.total // args.batch_size)
+            print(f"  ✅ SQL file created with {summary.total} rows in {batches} batched INSERT statements")
+        else:
+            print(f"  ✅ SQL file created with {summary.total} rows in a COPY block (load with psql -f)")
+        print(f"\n📝 JSON seed file: {OUTPUT_JSON_FILE}")
+        print(f"  ✅ JSON file created with {summary.total} job records")
+        if args.columnar:
+            print(f"\n📝 Columnar seed file: {COLUMNAR_FILE}")
+            print(f"  ✅ {summary.total} rows (analyze with: python3 app/scripts/seed_columns.py)")
 
     # Print summary statistics
     print("\n📊 Summary Statistics:")
-    print(f"  Total jobs: {len(jobs)}")
+    print(f"  Total jobs: {summary.total}")
 
-    match_percentages = [j['match_percentage'] for j in jobs if j.get('match_percentage')]
-    if match_percentages:
-        avg_match = sum(match_percentages) / len(match_percentages)
-        print(f"  Average match: {avg_match:.1f}%")
-        print(f"  Best match: {max(match_percentages)}%")
-        print(f"  Lowest match: {min(match_percentages)}%")
+    if summary.match_count:
+        print(f"  Average match: {summary.match_average:.1f}%")
+        print(f"  Best match: {summary.match_best}%")
+        print(f"  Lowest match: {summary.match_lowest}%")
 
-    companies_with_location = [j for j in jobs if j.get('location')]
-    print(f"  Jobs with location: {len(companies_with_location)}")
+    print(f"  Jobs with location: {summary.with_location}")
+    print(f"  Jobs with salary: {summary.with_salary}")
 
-    companies_with_salary = [j for j in jobs if j.get('salary_range')]
-    print(f"  Jobs with salary: {len(companies_with_salary)}")
+    if loader:
+        print("\n✅ Database load complete!")
+        return
 
     print("\n✅ Seed data generation complete!")
     print(f"\n📌 Next steps:")
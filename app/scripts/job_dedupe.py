@@ -0,0 +1,167 @@
+"""
+Near-duplicate detection for parsed jobs (MinHash + LSH).
+
+The same posting often shows up several times: on several days of the
+05_Tracking job-search dumps, or as more than one 04_Applications folder.
+NearDuplicateFilter sits between the job stream and the seed writers or
+loader and drops every job whose description is a near-duplicate of one it
+has already passed on, so each cluster is emitted once, as its first
+(earliest) job, and the merged sources are collected for a report.
+
+Each description is reduced to a MinHash signature of its word 5-gram
+shingles. Signatures are split into LSH bands, and only jobs of the same
+company that share at least two band buckets are compared, so the work per
+job stays roughly constant instead of growing with the number of jobs seen. A
+candidate counts as a duplicate when the share of equal signature
+positions, an estimate of the Jaccard similarity of the shingle sets,
+reaches the threshold.
+
+Usage:
+    dedupe = NearDuplicateFilter(threshold=0.8)
+    for job in dedupe.unique(jobs):
+        writer.write(job)
+    dedupe.write_report(REPORT_FILE)
+"""
+
+import hashlib
+import json
+import os
+import random
+import re
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+DEFAULT_THRESHOLD = 0.8
+NUM_PERM = 64
+BANDS = 16          # 16 bands of 4 rows
+MIN_BAND_MATCHES = 2  # Shared buckets before a signature is compared (~99.7% recall at 0.8)
+SHINGLE_SIZE = 5
+MIN_SHINGLES = 10   # Shorter descriptions (e.g. fallbacks) are never merged
+
+_WORD_RE = re.compile(r'\w+')
+_COMPANY_RE = re.compile(r'[^a-z0-9]+')
+
+# XOR with a fixed random 64-bit salt per position stands in for a hash permutation
+_SALTS = [random.Random(f'minhash-{position}').getrandbits(64) for position in range(NUM_PERM)]
+
+
+def shingle_hashes(text: str) -> List[int]:
+    """64-bit hashes of the distinct word 5-grams of `text` (case-insensitive)."""
+    words = _WORD_RE.findall(text.lower())
+    shingles = {' '.join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)}
+    return [
+        int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'little')
+        for shingle in shingles
+    ]
+
+
+def minhash_signature(hashes: List[int]) -> array:
+    """MinHash signature (NUM_PERM unsigned 64-bit minimums) of a shingle hash set."""
+    return array('Q', [min(map(salt.__xor__, hashes)) for salt in _SALTS])
+
+
+def similarity(first: array, second: array) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    return sum(map(int.__eq__, first, second)) / len(first)
+
+
+def company_key(name: Optional[str]) -> str:
+    return _COMPANY_RE.sub('', (name or '').lower())
+
+
+class NearDuplicateFilter:
+    """Streams jobs through, dropping near-duplicates of jobs already passed on."""
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD):
+        if not 0 < threshold <= 1:
+            raise ValueError('threshold must be in (0, 1]')
+        self.threshold = threshold
+        self.seen = 0
+        self._rows = NUM_PERM // BANDS
+        self._signatures: List[array] = []
+        self._canonical: List[Dict[str, Any]] = []  # Summary of each passed-on job
+        self._buckets: Dict[Tuple[str, int, Tuple[int, ...]], List[int]] = {}
+        self._merged: Dict[int, List[Dict[str, Any]]] = {}
+
+    @property
+    def duplicates(self) -> int:
+        return sum(len(merged) for merged in self._merged.values())
+
+    def _band_keys(self, company: str, signature: array) -> Iterator[Tuple[str, int, Tuple[int, ...]]]:
+        for band in range(BANDS):
+            yield company, band, tuple(signature[band * self._rows:(band + 1) * self._rows])
+
+    def _best_match(self, keys: List[Tuple[str, int, Tuple[int, ...]]],
+                    signature: array) -> Tuple[Optional[int], float]:
+        band_matches: Dict[int, int] = {}
+        for key in keys:
+            for candidate in self._buckets.get(key, ()):
+                band_matches[candidate] = band_matches.get(candidate, 0) + 1
+
+        best, best_similarity = None, 0.0
+        for candidate, matches in band_matches.items():
+            if matches < MIN_BAND_MATCHES:
+                continue
+            estimate = similarity(signature, self._signatures[candidate])
+            if estimate >= self.threshold and estimate > best_similarity:
+                best, best_similarity = candidate, estimate
+        return best, best_similarity
+
+    def check(self, job: Dict[str, Any]) -> Optional[str]:
+        """
+        folder_path of the job `job` duplicates, or None after registering it
+        as the canonical job of a new cluster.
+        """
+        self.seen += 1
+        summary = {
+            'folder_path': job.get('folder_path'),
+            'company_name': job.get('company_name'),
+            'position_title': job.get('position_title'),
+        }
+        hashes = shingle_hashes(job.get('job_description_text') or '')
+        if len(hashes) < MIN_SHINGLES:
+            return None
+
+        signature = minhash_signature(hashes)
+        keys = list(self._band_keys(company_key(job.get('company_name')), signature))
+        match, match_similarity = self._best_match(keys, signature)
+        if match is not None:
+            self._merged.setdefault(match, []).append({**summary, 'similarity': round(match_similarity, 3)})
+            return self._canonical[match]['folder_path']
+
+        index = len(self._signatures)
+        self._signatures.append(signature)
+        self._canonical.append(summary)
+        for key in keys:
+            self._buckets.setdefault(key, []).append(index)
+        return None
+
+    def unique(self, jobs: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Yield the jobs that aren't near-duplicates of an earlier one."""
+        for job in jobs:
+            canonical = self.check(job)
+            if canonical is None:
+                yield job
+            else:
+                print(f"  🧬 {job.get('folder_path')} duplicates {canonical}")
+
+    def report(self) -> Dict[str, Any]:
+        """Clusters that absorbed at least one duplicate, largest first."""
+        clusters = [
+            {**self._canonical[index], 'merged': merged}
+            for index, merged in sorted(self._merged.items(), key=lambda item: (-len(item[1]), item[0]))
+        ]
+        return {
+            'threshold': self.threshold,
+            'jobs_seen': self.seen,
+            'duplicates_merged': self.duplicates,
+            'clusters': clusters,
+        }
+
+    def write_report(self, path: Path) -> None:
+        path = Path(path)
+        temp_path = path.with_suffix('.tmp')
+        temp_path.write_text(json.dumps(self.report(), indent=2, ensure_ascii=False), encoding='utf-8')
+        os.replace(temp_path, path)
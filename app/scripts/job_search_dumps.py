@@ -0,0 +1,194 @@
+"""
+Streaming reader for 05_Tracking/job-search-*.json dumps.
+
+A dump maps each search date to the postings found that day:
+
+    {"2025-07-28": [{"source", "companyName", "jobDesc", "location", "email"}, ...], ...}
+
+(a bare array of postings is accepted too, dated from the file name). Dumps
+grow with every search session, so iter_dump_postings() never loads a whole
+file: it reads fixed-size chunks and decodes one posting at a time with
+json.JSONDecoder.raw_decode, keeping memory at one chunk plus one posting.
+
+dump_job_record() turns a posting into the job record shape
+generate-seed-data.py's parse_job_spec produces, so dumps can go through the
+same seed writers and Postgres loader as 04_Applications.
+
+Usage:
+    from job_search_dumps import iter_dump_jobs
+    for job in iter_dump_jobs(sorted(TRACKING_DIR.glob(DUMP_GLOB))):
+        writer.write(job)
+"""
+
+import json
+import re
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, IO, Iterable, Iterator, Optional, Tuple
+
+from date_normalization import normalize_iso_date
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+TRACKING_DIR = PROJECT_ROOT / "05_Tracking"
+DUMP_GLOB = 'job-search-*.json'
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# "job-search-2025-07-28-00-09-24.json" -> 2025-07-28, for dumps that are a bare array
+DUMP_DATE_RE = re.compile(r'job-search-(\d{4}-\d{2}-\d{2})')
+_WHITESPACE_RE = re.compile(r'[ \t\r\n]*')
+_DECODER = json.JSONDecoder()
+
+MAX_TITLE_LENGTH = 200
+
+
+class _ChunkedJsonReader:
+    """Decodes JSON tokens and values from a text file one chunk at a time."""
+
+    def __init__(self, f: IO[str], chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self._file = f
+        self._chunk_size = chunk_size
+        self._buffer = ''
+        self._pos = 0
+        self._offset = 0  # Characters dropped from the front of the buffer
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Append the next chunk, dropping what has been consumed. False at end of file."""
+        if self._eof:
+            return False
+        data = self._file.read(self._chunk_size)
+        if not data:
+            self._eof = True
+            return False
+        self._offset += self._pos
+        self._buffer = self._buffer[self._pos:] + data
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character ('' at end of file)."""
+        while True:
+            self._pos = _WHITESPACE_RE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, allowed: str) -> str:
+        """Consume one structural character out of `allowed`."""
+        char = self.peek()
+        if not char or char not in allowed:
+            raise ValueError(f"Expected one of {allowed!r} at character {self._offset + self._pos}, "
+                             f"found {char or 'end of file'!r}")
+        self._pos += 1
+        return char
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value, reading more chunks until it is whole."""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as e:
+                if self._fill():
+                    continue
+                raise ValueError(f"{e.msg} at character {self._offset + e.pos}") from None
+            # A number can run on into the next chunk
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def array_items(self) -> Iterator[Any]:
+        """Values of the array whose '[' was just consumed."""
+        if self.peek() == ']':
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.expect(',]') == ']':
+                return
+
+
+def iter_dump_postings(path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tuple[Optional[str], Dict[str, Any]]]:
+    """Yield (search date, posting) pairs of a dump without loading the whole file."""
+    path = Path(path)
+    with open(path, 'r', encoding='utf-8') as f:
+        reader = _ChunkedJsonReader(f, chunk_size)
+        if reader.expect('{[') == '[':
+            match = DUMP_DATE_RE.search(path.name)
+            file_date = match.group(1) if match else None
+            for posting in reader.array_items():
+                if isinstance(posting, dict):
+                    yield file_date, posting
+            return
+
+        if reader.peek() == '}':
+            return
+        while True:
+            search_date = reader.value()
+            reader.expect(':')
+            if reader.peek() == '[':
+                reader.expect('[')
+                for posting in reader.array_items():
+                    if isinstance(posting, dict):
+                        yield search_date, posting
+            else:
+                reader.value()  # Not a list of postings (e.g. metadata): skip it
+            if reader.expect(',}') == '}':
+                return
+
+
+def posting_title(description: Optional[str]) -> Optional[str]:
+    """First sentence of a posting's jobDesc, which names the role."""
+    if not description:
+        return None
+    title = description.strip().split('. ', 1)[0].rstrip('.').strip()
+    return title[:MAX_TITLE_LENGTH] or None
+
+
+def dump_job_record(posting: Dict[str, Any], search_date: Optional[str], dump_name: str,
+                    index: int) -> Dict[str, Any]:
+    """
+    Job record (same keys as parse_job_spec) for one posting of a dump.
+
+    folder_path is "05_Tracking/<dump>/<date>/<n>", where n counts postings of
+    that date, so ids and loader upserts stay stable while a dump grows.
+    """
+    date = normalize_iso_date(search_date) if isinstance(search_date, str) else None
+    folder_path = f"05_Tracking/{dump_name}/{date or 'undated'}/{index}"
+    source = posting.get('source') or None
+    description = posting.get('jobDesc') or ''
+    return {
+        'id': str(uuid.uuid5(uuid.NAMESPACE_URL, folder_path)),
+        'created_at': f"{date}T12:00:00Z" if date else datetime.now().isoformat(),
+        'input_type': 'url' if source else 'text',
+        'input_content': source or description,
+        'original_url': source,
+        'company_name': posting.get('companyName') or 'Unknown Company',
+        'position_title': posting_title(description) or 'Unknown Position',
+        'location': posting.get('location') or None,
+        'salary_range': None,
+        'job_type': None,
+        'job_description_text': description,
+        'match_percentage': None,
+        'match_analysis': {
+            'strengths': [],
+            'partial_matches': [],
+            'gaps': []
+        },
+        'status': 'processing',  # Found in a search, not applied to yet
+        'folder_path': folder_path,
+    }
+
+
+def iter_dump_jobs(paths: Iterable[Path], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+    """Yield a job record for every posting of every dump, one at a time."""
+    for path in paths:
+        counts: Dict[Optional[str], int] = {}
+        for search_date, posting in iter_dump_postings(path, chunk_size):
+            index = counts.get(search_date, 0)
+            counts[search_date] = index + 1
+            yield dump_job_record(posting, search_date, Path(path).name, index)
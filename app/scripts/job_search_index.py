@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+"""
+Full-text search over the 05_Tracking job-search dumps and parsed job specs.
+
+05_Tracking/job-search-*.json files map a search date to the postings found
+that day ({source, companyName, jobDesc, location, email}). This tool keeps a
+SQLite FTS5 index of every posting in those dumps plus the fields
+generate-seed-data.py parses from 04_Applications/*/job-spec.md, so keyword,
+company and location queries over years of searches answer in milliseconds.
+
+The index is updated incrementally: each dump and job spec is recorded with
+its mtime, size and content hash, and only new or edited files are
+(re)indexed; postings of deleted files are dropped. `search` runs that
+update first, which costs one stat() per file when nothing changed.
+
+Usage:
+    python3 job_search_index.py update                  # Index new and edited files
+    python3 job_search_index.py search react typescript
+    python3 job_search_index.py search --company agoda --location bangkok
+    python3 job_search_index.py search "front end" --kind dump --since 2025-07-01 --json
+    python3 job_search_index.py rebuild                 # Drop and re-index everything
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from application_scanner import list_application_folders, scan_applications
+from date_normalization import normalize_iso_date
+from job_search_dumps import DUMP_GLOB, TRACKING_DIR, iter_dump_postings
+from seed_generator import load_seed_generator
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+APPLICATIONS_DIR = PROJECT_ROOT / "04_Applications"
+INDEX_FILE = PROJECT_ROOT / "app" / "scripts" / ".job-search-index.sqlite"
+
+INDEX_VERSION = 1
+DEFAULT_LIMIT = 20
+
+QUERY_TERM_RE = re.compile(r'\w+\*?')
+
+# bm25 weights for company, position, location, description
+RANK_WEIGHTS = (10.0, 5.0, 3.0, 1.0)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+  path TEXT PRIMARY KEY,
+  kind TEXT NOT NULL,
+  mtime_ns INTEGER NOT NULL,
+  size INTEGER NOT NULL,
+  sha256 TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS postings (
+  id INTEGER PRIMARY KEY,
+  path TEXT NOT NULL,
+  kind TEXT NOT NULL,
+  search_date TEXT,
+  company TEXT,
+  position TEXT,
+  location TEXT,
+  description TEXT,
+  url TEXT,
+  email TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_postings_path ON postings(path);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS postings_fts USING fts5(
+  company, position, location, description,
+  content='postings', content_rowid='id',
+  tokenize='unicode61 remove_diacritics 2'
+);
+
+CREATE TRIGGER IF NOT EXISTS postings_ai AFTER INSERT ON postings BEGIN
+  INSERT INTO postings_fts(rowid, company, position, location, description)
+  VALUES (new.id, new.company, new.position, new.location, new.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS postings_ad AFTER DELETE ON postings BEGIN
+  INSERT INTO postings_fts(postings_fts, rowid, company, position, location, description)
+  VALUES ('delete', old.id, old.company, old.position, old.location, old.description);
+END;
+"""
+
+POSTING_COLUMNS = ('path', 'kind', 'search_date', 'company', 'position', 'location', 'description', 'url', 'email')
+
+
+class Posting(NamedTuple):
+    """One indexed job posting."""
+    path: str
+    kind: str  # 'dump' or 'spec'
+    search_date: Optional[str]
+    company: Optional[str]
+    position: Optional[str]
+    location: Optional[str]
+    description: Optional[str]
+    url: Optional[str]
+    email: Optional[str]
+
+
+class UpdateStats(NamedTuple):
+    indexed: int    # Files (re)indexed
+    unchanged: int  # Files skipped because they were already indexed
+    removed: int    # Files dropped because they no longer exist
+    postings: int   # Postings written
+    seconds: float
+
+
+def file_hash(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def relative_path(path: Path) -> str:
+    """Path relative to the project root, the key used in the index."""
+    try:
+        return path.resolve().relative_to(PROJECT_ROOT.resolve()).as_posix()
+    except ValueError:
+        return path.resolve().as_posix()
+
+
+def dump_postings(path: Path, key: str) -> Iterator[Posting]:
+    """Postings of a job-search-*.json dump, streamed (see job_search_dumps.py)."""
+    for search_date, entry in iter_dump_postings(path):
+        yield Posting(
+            path=key,
+            kind='dump',
+            search_date=normalize_iso_date(search_date) if isinstance(search_date, str) else None,
+            company=entry.get('companyName'),
+            position=None,
+            location=entry.get('location'),
+            description=entry.get('jobDesc'),
+            url=entry.get('source'),
+            email=entry.get('email'),
+        )
+
+
+def spec_posting(job: Dict[str, Any], key: str) -> Posting:
+    """Posting for a job record parsed by generate-seed-data.py."""
+    return Posting(
+        path=key,
+        kind='spec',
+        search_date=job['created_at'][:10] if job.get('created_at') else None,
+        company=job.get('company_name'),
+        position=job.get('position_title'),
+        location=job.get('location'),
+        description=job.get('job_description_text'),
+        url=job.get('original_url'),
+        email=None,
+    )
+
+
+def build_match_query(keywords: List[str], company: Optional[str] = None,
+                      location: Optional[str] = None) -> str:
+    """
+    FTS5 MATCH expression: every keyword term, company and location must match.
+    Terms are quoted so punctuation in user input can't break the query;
+    a trailing * keeps prefix matching (e.g. "type*").
+    """
+    def terms(text: str) -> List[str]:
+        return [
+            f'"{term[:-1]}"*' if term.endswith('*') else f'"{term}"'
+            for term in QUERY_TERM_RE.findall(text)
+        ]
+
+    clauses = [term for keyword in keywords for term in terms(keyword)]
+    for column, value in (('company', company), ('location', location)):
+        if value and terms(value):
+            clauses.append(f"{column} : ({' '.join(terms(value))})")
+    return ' AND '.join(clauses)
+
+
+class JobSearchIndex:
+    """SQLite FTS5 index of job-search dumps and job specs."""
+
+    def __init__(self, path: Path = INDEX_FILE):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.row_factory = sqlite3.Row
+        self._init_schema()
+
+    def _init_schema(self) -> None:
+        version = self._conn.execute('PRAGMA user_version').fetchone()[0]
+        if version not in (0, INDEX_VERSION):
+            # Layout changed: the index is disposable, so start over
+            self._drop()
+        self._conn.executescript(SCHEMA)
+        self._conn.execute(f'PRAGMA user_version = {INDEX_VERSION}')
+        self._conn.commit()
+
+    def _drop(self) -> None:
+        self._conn.executescript("""
+            DROP TRIGGER IF EXISTS postings_ai;
+            DROP TRIGGER IF EXISTS postings_ad;
+            DROP TABLE IF EXISTS postings_fts;
+            DROP TABLE IF EXISTS postings;
+            DROP TABLE IF EXISTS sources;
+        """)
+
+    def rebuild(self) -> None:
+        """Forget everything so the next update re-indexes every file."""
+        self._drop()
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    def _source(self, key: str) -> Optional[sqlite3.Row]:
+        return self._conn.execute('SELECT * FROM sources WHERE path = ?', (key,)).fetchone()
+
+    def _replace(self, key: str, kind: str, stat: os.stat_result, sha256: str,
+                 postings: List[Posting]) -> None:
+        """Swap the postings of one file (one transaction per file)."""
+        with self._conn:
+            self._conn.execute('DELETE FROM postings WHERE path = ?', (key,))
+            self._conn.executemany(
+                f"INSERT INTO postings ({', '.join(POSTING_COLUMNS)}) "
+                f"VALUES ({', '.join('?' for _ in POSTING_COLUMNS)})",
+                postings
+            )
+            self._conn.execute(
+                'INSERT OR REPLACE INTO sources (path, kind, mtime_ns, size, sha256) VALUES (?, ?, ?, ?, ?)',
+                (key, kind, stat.st_mtime_ns, stat.st_size, sha256)
+            )
+
+    def _touch(self, key: str, stat: os.stat_result) -> None:
+        """Record a new mtime/size for a file whose content didn't change."""
+        with self._conn:
+            self._conn.execute(
+                'UPDATE sources SET mtime_ns = ?, size = ? WHERE path = ?',
+                (stat.st_mtime_ns, stat.st_size, key)
+            )
+
+    def update(self, tracking_dir: Path = TRACKING_DIR,
+               applications_dir: Path = APPLICATIONS_DIR) -> UpdateStats:
+        """Index new and edited dumps and job specs, and drop deleted ones."""
+        started = time.perf_counter()
+        indexed = unchanged = postings_written = 0
+        seen = set()
+        seed = None
+
+        dumps = sorted(tracking_dir.glob(DUMP_GLOB)) if tracking_dir.is_dir() else []
+        for path in dumps:
+            key = relative_path(path)
+            seen.add(key)
+            stat = path.stat()
+            source = self._source(key)
+            if source and source['mtime_ns'] == stat.st_mtime_ns and source['size'] == stat.st_size:
+                unchanged += 1
+                continue
+            sha256 = file_hash(path)
+            if source and source['sha256'] == sha256:
+                self._touch(key, stat)
+                unchanged += 1
+                continue
+            try:
+                postings = list(dump_postings(path, key))
+            except (OSError, ValueError) as e:
+                print(f"⚠️  Skipping {key}: {e}")
+                continue
+            self._replace(key, 'dump', stat, sha256, postings)
+            indexed += 1
+            postings_written += len(postings)
+
+        for folder, spec_file, stat in scan_applications(sorted(list_application_folders(applications_dir))):
+            if stat is None:
+                continue
+            key = relative_path(spec_file)
+            seen.add(key)
+            source = self._source(key)
+            if source and source['mtime_ns'] == stat.st_mtime_ns and source['size'] == stat.st_size:
+                unchanged += 1
+                continue
+            if seed is None:
+                seed = load_seed_generator()
+            result = seed.parse_application_folder(folder, source['sha256'] if source else None)
+            if result.unchanged:
+                self._touch(key, stat)
+                unchanged += 1
+                continue
+            if result.error:
+                # Recorded without postings, so it is only retried once the file changes
+                print(f"⚠️  Not indexing {key}: {result.error}")
+                self._replace(key, 'spec', stat, '', [])
+                continue
+            postings = [spec_posting(result.job, key)]
+            self._replace(key, 'spec', stat, result.content_hash, postings)
+            indexed += 1
+            postings_written += len(postings)
+
+        removed = 0
+        with self._conn:
+            for (key,) in self._conn.execute('SELECT path FROM sources').fetchall():
+                if key not in seen:
+                    self._conn.execute('DELETE FROM postings WHERE path = ?', (key,))
+                    self._conn.execute('DELETE FROM sources WHERE path = ?', (key,))
+                    removed += 1
+
+        return UpdateStats(indexed, unchanged, removed, postings_written, time.perf_counter() - started)
+
+    def search(self, keywords: List[str], company: Optional[str] = None, location: Optional[str] = None,
+               kind: Optional[str] = None, since: Optional[str] = None,
+               limit: int = DEFAULT_LIMIT) -> List[Dict[str, Any]]:
+        """Best-ranked postings matching every keyword, the company and the location."""
+        match = build_match_query(keywords, company, location)
+        if not match:
+            return []
+
+        where = ['postings_fts MATCH ?']
+        params: List[Any] = [match]
+        if kind:
+            where.append('p.kind = ?')
+            params.append(kind)
+        if since:
+            where.append('p.search_date >= ?')
+            params.append(since)
+        params.append(limit)
+
+        rows = self._conn.execute(f"""
+            SELECT p.kind, p.search_date, p.company, p.position, p.location, p.url, p.email, p.path,
+                   snippet(postings_fts, 3, '[', ']', '…', 12) AS snippet,
+                   bm25(postings_fts, {', '.join(str(weight) for weight in RANK_WEIGHTS)}) AS rank
+            FROM postings_fts
+            JOIN postings p ON p.id = postings_fts.rowid
+            WHERE {' AND '.join(where)}
+            ORDER BY rank
+            LIMIT ?
+        """, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def counts(self) -> Tuple[int, int]:
+        """(indexed files, indexed postings)."""
+        files = self._conn.execute('SELECT count(*) FROM sources').fetchone()[0]
+        postings = self._conn.execute('SELECT count(*) FROM postings').fetchone()[0]
+        return files, postings
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> 'JobSearchIndex':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def print_update(stats: UpdateStats) -> None:
+    print(f"🔄 Index updated in {stats.seconds * 1000:.0f}ms: {stats.indexed} files indexed "
+          f"({stats.postings} postings), {stats.unchanged} unchanged, {stats.removed} removed")
+
+
+def print_results(results: List[Dict[str, Any]], seconds: float) -> None:
+    print(f"🔍 {len(results)} results in {seconds * 1000:.1f}ms")
+    for result in results:
+        title = result['company'] or 'Unknown company'
+        if result['position']:
+            title += f" | {result['position']}"
+        print(f"\n  {title}")
+        details = [detail for detail in (result['search_date'], result['location'], result['kind']) if detail]
+        print(f"    {' · '.join(details)}")
+        if result['snippet']:
+            print(f"    {result['snippet']}")
+        print(f"    {result['url'] or result['path']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Search 05_Tracking job-search dumps and parsed job specs')
+    parser.add_argument('--index', type=str, default=str(INDEX_FILE),
+                        help='Path to the search index (default: app/scripts/.job-search-index.sqlite)')
+    parser.add_argument('--tracking-dir', type=str, default=str(TRACKING_DIR),
+                        help='Directory with job-search-*.json dumps (default: 05_Tracking)')
+    parser.add_argument('--applications-dir', type=str, default=str(APPLICATIONS_DIR),
+                        help='Directory with application folders (default: 04_Applications)')
+
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('update', help='Index new and edited files, drop deleted ones')
+    subparsers.add_parser('rebuild', help='Drop the index and index every file again')
+    search_parser = subparsers.add_parser('search', help='Search indexed postings')
+    search_parser.add_argument('keywords', nargs='*', help='Terms that must all match (prefix with term*)')
+    search_parser.add_argument('--company', type=str, help='Company name terms')
+    search_parser.add_argument('--location', type=str, help='Location terms')
+    search_parser.add_argument('--kind', choices=('dump', 'spec'), help='Only search dumps or job specs')
+    search_parser.add_argument('--since', type=str, help='Only postings found on or after YYYY-MM-DD')
+    search_parser.add_argument('--limit', type=int, default=DEFAULT_LIMIT,
+                               help=f'Maximum results (default: {DEFAULT_LIMIT})')
+    search_parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    search_parser.add_argument('--no-update', action='store_true', help="Don't update the index first")
+    args = parser.parse_args()
+
+    if args.command == 'search':
+        if not (args.keywords or args.company or args.location):
+            parser.error('search needs keywords, --company or --location')
+        if args.since and not normalize_iso_date(args.since):
+            parser.error('--since must be a YYYY-MM-DD date')
+
+    tracking_dir = Path(args.tracking_dir)
+    applications_dir = Path(args.applications_dir)
+
+    with JobSearchIndex(Path(args.index)) as index:
+        if args.command == 'rebuild':
+            index.rebuild()
+
+        if args.command != 'search' or not args.no_update:
+            stats = index.update(tracking_dir, applications_dir)
+            if args.command != 'search' or not args.json:
+                print_update(stats)
+
+        if args.command != 'search':
+            files, postings = index.counts()
+            print(f"📊 {postings} postings from {files} files in {index.path}")
+            return
+
+        started = time.perf_counter()
+        results = index.search(args.keywords, args.company, args.location, args.kind, args.since, args.limit)
+        seconds = time.perf_counter() - started
+        if args.json:
+            print(json.dumps(results, indent=2, ensure_ascii=False))
+        else:
+            print_results(results, seconds)
+
+
+if __name__ == '__main__':
+    main()
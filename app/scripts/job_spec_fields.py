@@ -0,0 +1,331 @@
+"""
+Single-pass field extraction for job-spec.md files.
+
+The original extract_* functions (kept in bench_job_spec_fields.py) each
+run several uncompiled `re.search` calls over the whole document, so a spec
+is scanned dozens of times. JobSpecIndex indexes the document once, recording
+the positions the field patterns can start from: field labels ending at a
+colon ("**Company**:", "Location:", ...), lines starting with '#', "## "
+heading markers and "(http" links. Every field is then resolved by applying
+a precompiled pattern anchored at those positions, in the same priority
+order as the original functions, so the results are identical.
+
+Usage:
+    from job_spec_fields import extract_fields
+    fields = extract_fields(content, folder_company, folder_position)
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from stage_profiler import lap_timer
+
+
+# Labels that the original extractors look for, with and without bold markup
+_LABELS = frozenset({
+    'Company', 'Title', 'Position', 'Location', 'Salary Range', 'Compensation',
+    'Type', 'Employment Type', 'Source URL', 'Job URL',
+})
+_LABEL_LENGTHS = sorted({len(label) for label in _LABELS})
+
+# Tails of the original patterns, applied right after a label
+_VALUE_RE = re.compile(r'\s*(.+?)(?:\n|$)', re.MULTILINE)
+_URL_VALUE_RE = re.compile(r'\s*(https?://[^\s\)]+)')
+_PAREN_URL_RE = re.compile(r'\(https?://[^\s\)]+\)')
+
+_TITLE_MATCH_RE = re.compile(r'\*\*Match.*?:\s*\d+%\*\*')
+_TITLE_STRONG_MATCH_RE = re.compile(r'-\s*Very Strong Match')
+
+# Every match score pattern ends in ":\s*(\d+)%"
+_SCORE_TAIL_RE = re.compile(r':\s*(\d+)%')
+_MATCH_WORD_RE = re.compile(r'match', re.IGNORECASE)
+# Match score patterns in priority order, with the distance from their start
+# to the colon. None means the colon can be anywhere later on the line.
+_MATCH_PATTERNS = (
+    (re.compile(r'\*\*Match Score:\s*(\d+)%\*\*', re.IGNORECASE), len('**Match Score')),
+    (re.compile(r'\*\*Match Percentage:\s*(\d+)%\*\*', re.IGNORECASE), len('**Match Percentage')),
+    (re.compile(r'Match Score:\s*(\d+)%', re.IGNORECASE), len('Match Score')),
+    (re.compile(r'Match Percentage:\s*(\d+)%', re.IGNORECASE), len('Match Percentage')),
+    (re.compile(r'Match.*?:\s*(\d+)%', re.IGNORECASE), None),
+)
+
+_DESCRIPTION_HEADINGS = (
+    re.compile(r'## Job Description', re.IGNORECASE),
+    re.compile(r'## Role Overview', re.IGNORECASE),
+    re.compile(r'## About the Role', re.IGNORECASE),
+)
+
+_STRENGTHS_HEADING_RE = re.compile(r'### Strong Matches|### Strengths?', re.IGNORECASE)
+_PARTIAL_HEADING_RE = re.compile(r'### Partial Matches', re.IGNORECASE)
+_GAPS_HEADING_RE = re.compile(r'### Gaps', re.IGNORECASE)
+
+_STRENGTH_BOLD_RE = re.compile(r'[-\*]\s*[✅✓]\s*\*\*(.+?)\*\*')
+_STRENGTH_LINE_RE = re.compile(r'[-\*]\s*✅\s*(.+?)(?:\n|$)')
+_PARTIAL_BOLD_RE = re.compile(r'[-\*]\s*[⚠️🟡]\s*\*\*(.+?)\*\*')
+_PARTIAL_LINE_RE = re.compile(r'[-\*]\s*⚠️\s*(.+?)(?:\n|$)')
+_GAP_BOLD_RE = re.compile(r'[-\*]\s*[❌]\s*\*\*(.+?)\*\*')
+_GAP_LINE_RE = re.compile(r'[-\*]\s*❌\s*(.+?)(?:\n|$)')
+
+
+def _find_all(content: str, token: str) -> List[int]:
+    """Offsets of every occurrence of `token` in `content`."""
+    offsets = []
+    index = content.find(token)
+    while index != -1:
+        offsets.append(index)
+        index = content.find(token, index + 1)
+    return offsets
+
+
+class JobSpecIndex:
+    """
+    Token index of a job-spec.md document.
+
+    Built from a few literal scans (C-level `str.find`, no regex) instead of
+    one regex search per pattern per field.
+    """
+
+    def __init__(self, content: str):
+        self.content = content
+        self._lines: Optional[List[str]] = None
+        self.labels: Dict[str, List[int]] = {}  # "**Label**" or "Label" -> value start offsets
+        self.colons: List[Tuple[int, int]] = []  # (colon offset, line start offset)
+
+        for colon in _find_all(content, ':'):
+            self.colons.append((colon, content.rfind('\n', 0, colon) + 1))
+            self._index_labels(colon)
+
+        # Lines starting with '#', "## " markers anywhere, and "(http" links
+        self.heading_line_starts = [offset + 1 for offset in _find_all(content, '\n#')]
+        if content.startswith('#'):
+            self.heading_line_starts.insert(0, 0)
+        self.heading_markers = _find_all(content, '## ')
+        self.paren_url_starts = _find_all(content, '(http')
+
+    @property
+    def lines(self) -> List[str]:
+        if self._lines is None:
+            self._lines = self.content.split('\n')
+        return self._lines
+
+    def _index_labels(self, colon: int) -> None:
+        """Record every label that ends right before `colon`."""
+        content = self.content
+        value_start = colon + 1
+        for length in _LABEL_LENGTHS:
+            if colon >= length and content[colon - length:colon] in _LABELS:
+                self.labels.setdefault(content[colon - length:colon], []).append(value_start)
+
+        if colon >= 2 and content[colon - 2:colon] == '**':
+            end = colon - 2
+            for length in _LABEL_LENGTHS:
+                start = end - length
+                if start >= 2 and content[start:end] in _LABELS and content[start - 2:start] == '**':
+                    self.labels.setdefault(f"**{content[start:end]}**", []).append(value_start)
+
+    # ------------------------------------------------------------------
+    # Field resolvers
+    # ------------------------------------------------------------------
+
+    def label_value(self, label: str) -> Optional[str]:
+        """First value of `label` (e.g. "**Company**" or "Company"), stripped."""
+        for value_start in self.labels.get(label, ()):
+            match = _VALUE_RE.match(self.content, value_start)
+            if match:
+                return match.group(1).strip()
+        return None
+
+    def first_label_value(self, labels: Tuple[str, ...]) -> Optional[str]:
+        """Value of the first label in priority order that is present."""
+        for label in labels:
+            value = self.label_value(label)
+            if value is not None:
+                return value
+        return None
+
+    def _heading_line_value(self) -> Optional[str]:
+        """Equivalent of re.search(r'^#\\s*(.+?)(?:\\n|$)', content, re.MULTILINE)."""
+        for start in self.heading_line_starts:
+            match = _VALUE_RE.match(self.content, start + 1)
+            if match:
+                return match.group(1).strip()
+        return None
+
+    def company_name(self, folder_company: str) -> str:
+        value = self.first_label_value(('**Company**', 'Company'))
+        return value if value is not None else folder_company
+
+    def position_title(self, folder_position: str) -> str:
+        candidates = (
+            lambda: self.label_value('**Title**'),
+            lambda: self.label_value('**Position**'),
+            lambda: self.label_value('Position'),
+            lambda: self.label_value('Title'),
+            self._heading_line_value,
+        )
+        for candidate in candidates:
+            title = candidate()
+            if title is None:
+                continue
+            # Clean up title
+            title = _TITLE_MATCH_RE.sub('', title).strip()
+            title = _TITLE_STRONG_MATCH_RE.sub('', title).strip()
+            if title:
+                return title
+        return folder_position
+
+    def location(self) -> Optional[str]:
+        return self.first_label_value(('**Location**', 'Location'))
+
+    def salary_range(self) -> Optional[str]:
+        return self.first_label_value(('**Salary Range**', '**Compensation**', 'Salary Range', 'Compensation'))
+
+    def job_type(self) -> Optional[str]:
+        return self.first_label_value(('**Type**', '**Employment Type**', 'Type', 'Employment Type'))
+
+    def original_url(self) -> Optional[str]:
+        for label in ('**Source URL**', '**Job URL**', 'Source URL', 'Job URL'):
+            for value_start in self.labels.get(label, ()):
+                match = _URL_VALUE_RE.match(self.content, value_start)
+                if match:
+                    return match.group(1).strip('()')
+
+        for start in self.paren_url_starts:
+            match = _PAREN_URL_RE.match(self.content, start)
+            if match:
+                return match.group(0).strip('()')
+        return None
+
+    def match_percentage(self) -> Optional[int]:
+        content = self.content
+        score_colons = [
+            (colon, line_start) for colon, line_start in self.colons
+            if _SCORE_TAIL_RE.match(content, colon)
+        ]
+
+        for pattern, colon_distance in _MATCH_PATTERNS:
+            for colon, line_start in score_colons:
+                if colon_distance is None:
+                    # "Match" may start anywhere earlier on the colon's line
+                    word = _MATCH_WORD_RE.search(content, line_start, colon)
+                    start = word.start() if word else -1
+                else:
+                    start = colon - colon_distance
+                if start < 0:
+                    continue
+                match = pattern.match(content, start)
+                if match:
+                    return int(match.group(1))
+        return None
+
+    def _section(self, heading_re: re.Pattern, hashes: int, include_heading: bool) -> Optional[str]:
+        """
+        Text after the first heading matching `heading_re`, up to the next run
+        of `hashes` '#' characters (or the end of the document).
+        """
+        content = self.content
+        shift = hashes - 2  # Heading patterns start this far before their "## "
+        for marker in self.heading_markers:
+            start = marker - shift
+            if start < 0:
+                continue
+            match = heading_re.match(content, start)
+            if match:
+                section_end = content.find('#' * hashes, match.end())
+                if section_end == -1:
+                    section_end = len(content)
+                return content[match.start() if include_heading else match.end():section_end]
+        return None
+
+    def job_description(self) -> str:
+        for heading_re in _DESCRIPTION_HEADINGS:
+            section = self._section(heading_re, 2, include_heading=False)
+            if section is not None:
+                desc = section.strip()
+                return desc[:1000] if len(desc) > 1000 else desc
+
+        # If no section found, take first 500 characters after the header
+        desc_lines = []
+        desc_length = -1  # len('\n'.join(desc_lines)) without re-joining
+        skip_count = 5  # Skip first few header lines
+        for line in self.lines[skip_count:]:
+            if line.strip():
+                desc_lines.append(line)
+                desc_length += len(line) + 1
+            if desc_length > 500:
+                break
+
+        return '\n'.join(desc_lines)[:500]
+
+    def match_analysis(self) -> Dict[str, List[str]]:
+        analysis = {
+            'strengths': [],
+            'partial_matches': [],
+            'gaps': []
+        }
+
+        strengths_text = self._section(_STRENGTHS_HEADING_RE, 3, include_heading=True)
+        if strengths_text is not None:
+            strengths = _STRENGTH_BOLD_RE.findall(strengths_text)
+            if not strengths:
+                strengths = _STRENGTH_LINE_RE.findall(strengths_text)
+            analysis['strengths'] = [s.strip() for s in strengths[:5]]
+
+        partial_text = self._section(_PARTIAL_HEADING_RE, 3, include_heading=True)
+        if partial_text is not None:
+            partials = _PARTIAL_BOLD_RE.findall(partial_text)
+            if not partials:
+                partials = _PARTIAL_LINE_RE.findall(partial_text)
+            analysis['partial_matches'] = [p.strip() for p in partials[:5]]
+
+        gaps_text = self._section(_GAPS_HEADING_RE, 3, include_heading=True)
+        if gaps_text is not None:
+            gaps = _GAP_BOLD_RE.findall(gaps_text)
+            if not gaps:
+                gaps = _GAP_LINE_RE.findall(gaps_text)
+            analysis['gaps'] = [g.strip() for g in gaps[:5]]
+
+        return analysis
+
+
+def extract_fields(content: str, folder_company: str, folder_position: str,
+                   timings: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+    """
+    Extract all job-spec.md fields used for seed records.
+
+    Returns the same values, in the same key order, as the individual
+    extract_* functions in bench_job_spec_fields.py. When `timings` is given,
+    the seconds spent indexing and on each field are added to it.
+    """
+    lap = lap_timer(timings)
+    index = JobSpecIndex(content)
+    lap('index')
+    original_url = index.original_url()
+    lap('original_url')
+    company_name = index.company_name(folder_company)
+    lap('company_name')
+    position_title = index.position_title(folder_position)
+    lap('position_title')
+    location = index.location()
+    lap('location')
+    salary_range = index.salary_range()
+    lap('salary_range')
+    job_type = index.job_type()
+    lap('job_type')
+    job_description_text = index.job_description()
+    lap('job_description_text')
+    match_percentage = index.match_percentage()
+    lap('match_percentage')
+    match_analysis = index.match_analysis()
+    lap('match_analysis')
+    return {
+        'original_url': original_url,
+        'company_name': company_name,
+        'position_title': position_title,
+        'location': location,
+        'salary_range': salary_range,
+        'job_type': job_type,
+        'job_description_text': job_description_text,
+        'match_percentage': match_percentage,
+        'match_analysis': match_analysis,
+    }
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Local match pre-scoring of job postings against the master profile.
+
+Scoring a posting properly goes through the calculate-match worker (one LLM
+call per job). This script ranks whole 05_Tracking/job-search-*.json dumps
+offline first, so only the most promising postings need that call.
+
+The skills parse_profile() reads from 01_Profile/master_profile.md and every
+job description become sparse TF-IDF term vectors (sublinear term
+frequency, IDF over all scored postings). A posting's pre-score is the cosine
+similarity of its vector with the profile's, times 100. With NumPy installed
+(`pip install numpy`) postings are scored in batches as CSR arrays;
+without it the same numbers come from a pure-Python loop.
+
+Dumps are streamed twice: once to count document frequencies, once to score
+batch by batch while keeping the best --top postings, so memory stays flat
+however many postings there are.
+
+Usage:
+    python3 match_prescore.py                        # Top 20 postings of every dump
+    python3 match_prescore.py --top 50 --json > candidates.json
+    python3 match_prescore.py 05_Tracking/job-search-2025-07-28-00-09-24.json --min-score 15
+"""
+
+import argparse
+import heapq
+import json
+import math
+import re
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+from job_search_dumps import DUMP_GLOB, TRACKING_DIR, iter_dump_jobs
+from profile_parser import parse_profile
+from skill_index import INDEX_FILE, SkillIndex
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+PROFILE_FILE = PROJECT_ROOT / "01_Profile" / "master_profile.md"
+
+DEFAULT_TOP = 20
+DEFAULT_BATCH_SIZE = 5000
+
+# "Node.js", "C++", "C#" and "HTML5" stay single terms
+_TERM_RE = re.compile(r'[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*')
+STOP_WORDS = frozenset(
+    'a an and are as at be by for from in is it of on or our the to we with you your will'.split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-case terms of `text`; "React.js" and "React" are the same term."""
+    terms = []
+    for term in _TERM_RE.findall(text.lower()):
+        if term.endswith('.js'):
+            term = term[:-3]
+        if len(term) > 1 and term not in STOP_WORDS:
+            terms.append(term)
+    return terms
+
+
+def profile_skills(path: Path = PROFILE_FILE) -> List[str]:
+    """Skill names of the master profile."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return [skill['skill_name'] for skill in parse_profile(f.read())['skills']]
+
+
+class PreScorer:
+    """Cosine similarity of TF-IDF job vectors with a fixed skill vector."""
+
+    def __init__(self, skills: Sequence[str], document_frequencies: Counter, documents: int):
+        self.skills = list(skills)
+        self.documents = documents
+        self._document_frequencies = document_frequencies
+        self._profile = self._weights(Counter(term for skill in self.skills for term in tokenize(skill)))
+        self._profile_norm = math.sqrt(sum(weight * weight for weight in self._profile.values()))
+
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        self._numpy = numpy
+
+    @property
+    def vectorized(self) -> bool:
+        return self._numpy is not None
+
+    def idf(self, term: str) -> float:
+        return math.log((1 + self.documents) / (1 + self._document_frequencies.get(term, 0))) + 1
+
+    def _weights(self, counts: Counter) -> Dict[str, float]:
+        return {term: (1 + math.log(count)) * self.idf(term) for term, count in counts.items()}
+
+    def score_batch(self, texts: Sequence[str]) -> List[float]:
+        """Pre-scores (0-100) of a batch of job descriptions."""
+        if not self._profile_norm:
+            return [0.0] * len(texts)
+        counts = [Counter(tokenize(text)) for text in texts]
+        if self._numpy is not None:
+            return self._score_numpy(counts)
+        scores = []
+        for job_counts in counts:
+            weights = self._weights(job_counts)
+            norm = math.sqrt(sum(weight * weight for weight in weights.values()))
+            dot = sum(weight * self._profile.get(term, 0.0) for term, weight in weights.items())
+            scores.append(100 * dot / (norm * self._profile_norm) if norm else 0.0)
+        return scores
+
+    def _score_numpy(self, counts: List[Counter]) -> List[float]:
+        np = self._numpy
+        # CSR layout: one row per job, columns are batch-local term ids
+        vocabulary: Dict[str, int] = {}
+        indices: List[int] = []
+        frequencies: List[int] = []
+        row_lengths: List[int] = []
+        for job_counts in counts:
+            for term, count in job_counts.items():
+                indices.append(vocabulary.setdefault(term, len(vocabulary)))
+                frequencies.append(count)
+            row_lengths.append(len(job_counts))
+
+        terms = list(vocabulary)
+        idf = np.array([self.idf(term) for term in terms])
+        profile = np.array([self._profile.get(term, 0.0) for term in terms])
+        indices_array = np.array(indices, dtype=np.int64)
+        rows = np.repeat(np.arange(len(counts)), row_lengths)
+
+        weights = (1 + np.log(np.array(frequencies, dtype=np.float64))) * idf[indices_array]
+        norms = np.sqrt(np.bincount(rows, weights=weights * weights, minlength=len(counts)))
+        dots = np.bincount(rows, weights=weights * profile[indices_array], minlength=len(counts))
+        scores = np.divide(100 * dots, norms * self._profile_norm, out=np.zeros(len(counts)), where=norms > 0)
+        return scores.tolist()
+
+
+def document_frequencies(texts: Iterable[str]) -> Tuple[Counter, int]:
+    """(document frequency per term, number of documents)."""
+    frequencies: Counter = Counter()
+    documents = 0
+    for text in texts:
+        frequencies.update(set(tokenize(text)))
+        documents += 1
+    return frequencies, documents
+
+
+def batched(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def top_postings(scorer: PreScorer, jobs: Iterable[Dict[str, Any]], top: int,
+                 batch_size: int = DEFAULT_BATCH_SIZE, min_score: float = 0.0) -> List[Tuple[float, Dict[str, Any]]]:
+    """Best `top` (score, job) pairs, highest first."""
+    best: List[Tuple[float, int, Dict[str, Any]]] = []
+    order = 0
+    for batch in batched(jobs, batch_size):
+        scores = scorer.score_batch([job.get('job_description_text') or '' for job in batch])
+        for score, job in zip(scores, batch):
+            order += 1
+            if score < min_score:
+                continue
+            # order breaks ties in favour of the earlier posting
+            entry = (score, -order, job)
+            if len(best) < top:
+                heapq.heappush(best, entry)
+            elif entry[:2] > best[0][:2]:
+                heapq.heapreplace(best, entry)
+    return [(score, job) for score, _, job in sorted(best, key=lambda entry: entry[:2], reverse=True)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Pre-score job-search dump postings against the master profile')
+    parser.add_argument('dumps', nargs='*', help=f'Dump files (default: every 05_Tracking/{DUMP_GLOB})')
+    parser.add_argument('--profile', type=str, default=str(PROFILE_FILE),
+                        help='master_profile.md to read skills from (default: 01_Profile/master_profile.md)')
+    parser.add_argument('--top', type=int, default=DEFAULT_TOP, help=f'Postings to keep (default: {DEFAULT_TOP})')
+    parser.add_argument('--min-score', type=float, default=0.0, help='Drop postings scoring below this (0-100)')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f'Postings scored per batch (default: {DEFAULT_BATCH_SIZE})')
+    parser.add_argument('--json', action='store_true', help='Print the top postings as JSON job records')
+    args = parser.parse_args()
+
+    if args.top < 1 or args.batch_size < 1:
+        parser.error('--top and --batch-size must be at least 1')
+
+    dump_files = [Path(path) for path in args.dumps] or sorted(TRACKING_DIR.glob(DUMP_GLOB))
+    if not dump_files:
+        print(f"❌ No job-search dumps found in {TRACKING_DIR}")
+        return
+
+    skills = profile_skills(Path(args.profile))
+    skill_index = SkillIndex.load_or_build(Path(args.profile), Path(args.profile).with_name(INDEX_FILE.name))
+    started = time.perf_counter()
+    frequencies, documents = document_frequencies(
+        job.get('job_description_text') or '' for job in iter_dump_jobs(dump_files)
+    )
+    scorer = PreScorer(skills, frequencies, documents)
+    results = top_postings(scorer, iter_dump_jobs(dump_files), args.top, args.batch_size, args.min_score)
+    seconds = time.perf_counter() - started
+
+    if args.json:
+        records = []
+        for score, job in results:
+            strengths, gaps = skill_index.match(job['job_description_text'])
+            match_analysis = {**job['match_analysis'], 'strengths': strengths, 'gaps': gaps}
+            records.append({**job, 'prescore': round(score, 1), 'match_analysis': match_analysis})
+        print(json.dumps(records, indent=2, ensure_ascii=False))
+        return
+
+    engine = 'NumPy' if scorer.vectorized else 'pure Python'
+    print(f"🎯 Scored {documents} postings from {len(dump_files)} dumps against {len(skills)} skills "
+          f"in {seconds:.2f}s ({engine})")
+    for rank, (score, job) in enumerate(results, 1):
+        print(f"\n  {rank:>2}. {score:5.1f}  {job['company_name']} | {job['position_title']}")
+        details = [detail for detail in (job['created_at'][:10], job.get('location')) if detail]
+        print(f"      {' · '.join(details)}")
+        strengths, gaps = skill_index.match(job['job_description_text'])
+        if strengths:
+            print(f"      ✅ {', '.join(strengths)}")
+        if gaps:
+            print(f"      ❌ {', '.join(gaps)}")
+        print(f"      {job.get('original_url') or job['folder_path']}")
+
+
+if __name__ == '__main__':
+    main()
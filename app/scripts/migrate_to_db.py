@@ -3,23 +3,40 @@
 Migrate master_profile.md to Supabase database
 
 This script parses the existing master_profile.md file and imports it into
-the database using the create_master_profile RPC function.
+the database using the create_master_profile RPC function. With --sync, an
+existing profile is updated instead: only the fields and rows that differ
+from the markdown are sent (see profile_sync.py).
 
 Usage:
     python3 migrate_to_db.py --dry-run           # Preview what will be imported
     python3 migrate_to_db.py                     # Actually import to database
     python3 migrate_to_db.py --backup            # Backup original file first
+    python3 migrate_to_db.py --chunked           # Import in resumable batches
+    python3 migrate_to_db.py --sync              # Update the existing profile with only what changed
+    python3 migrate_to_db.py --sync --dry-run    # Show what a sync would change
+    python3 migrate_to_db.py --dir 01_Profile/variants --concurrency 4   # Import many profiles
+    python3 migrate_to_db.py --dry-run --profile --profile-output migrate.pstats   # Stage timings and cProfile
 """
 
 import re
 import json
 import argparse
+import glob
+import hashlib
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from dotenv import load_dotenv
-from supabase import create_client, Client
+from profile_parser import build_profile_data
+from profile_sync import apply_diff, diff_profile, fetch_profile, find_profile, print_diff
+from rpc_capabilities import call_rpc, get_capabilities
+from stage_profiler import StageProfiler, profile_calls
+from supabase_session import get_session
 
 # Load environment variables from frontend .env file
 env_path = Path(__file__).parent.parent / 'frontend' / '.env'
@@ -37,303 +54,341 @@ if not SUPABASE_URL or not SUPABASE_KEY:
 
 MASTER_PROFILE_PATH = Path("/Users/user/Documents/cari-kerja/01_Profile/master_profile.md")
 
+# create_master_profile parameters missing from older schemas
+OPTIONAL_PROFILE_PARAMS = {'p_education', 'p_certifications'}
 
-def load_markdown(file_path: Path) -> str:
-    """Load markdown file contents."""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return f.read()
+# Progress of interrupted --chunked imports, one file per source profile
+CHECKPOINT_DIR = Path(__file__).parent / '.import-checkpoints'
+DEFAULT_CHUNK_SIZE = 25
+DEFAULT_CONCURRENCY = 4
 
+# Profile id each source file was last imported or synced to, for --sync
+SYNC_STATE_FILE = Path(__file__).parent / '.profile-sync.json'
+_sync_state_lock = threading.Lock()
 
-def parse_contact_info(content: str) -> Dict[str, str]:
-    """Parse contact information section."""
-    contact = {}
+# Files written by --backup, skipped when discovering profiles
+BACKUP_NAME_RE = re.compile(r'_backup_\d{8}_\d{6}$')
 
-    # Extract email
-    email_match = re.search(r'\*\*Email\*\*:\s*([^\n]+)', content)
-    if email_match:
-        contact['email'] = email_match.group(1).strip()
 
-    # Extract phones
-    whatsapp_match = re.search(r'Whatsapp:\s*([^\n]+)', content)
-    if whatsapp_match:
-        contact['phone_primary'] = whatsapp_match.group(1).strip()
-
-    phone_match = re.search(r'Phone:\s*([^\n]+)', content)
-    if phone_match:
-        contact['phone_secondary'] = phone_match.group(1).strip()
-
-    # Extract LinkedIn
-    linkedin_match = re.search(r'\*\*LinkedIn\*\*:.*?\[.*?\]\((https?://[^\)]+)\)', content)
-    if linkedin_match:
-        contact['linkedin_url'] = linkedin_match.group(1).strip()
+def load_markdown(file_path: Path) -> str:
+    """Load markdown file contents."""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return f.read()
 
-    # Extract location
-    location_match = re.search(r'\*\*Location\*\*:\s*([^\n]+)', content)
-    if location_match:
-        contact['location'] = location_match.group(1).strip()
 
-    return contact
+def import_to_database(data: Dict[str, Any], dry_run: bool = False) -> Optional[str]:
+    """Import data to Supabase using create_master_profile RPC."""
 
+    if dry_run:
+        print("\n=== DRY RUN MODE ===")
+        print("\nProfile Data:")
+        print(json.dumps(data['profile'], indent=2))
+        print(f"\nWork Experiences: {len(data['experiences'])} entries")
+        print(f"Skills: {len(data['skills'])} entries")
+        print(f"Education: {len(data['education'])} entries")
+        print(f"Certifications: {len(data['certifications'])} entries")
+        return None
 
-def parse_professional_summary(content: str) -> str:
-    """Parse professional summary section."""
-    match = re.search(r'## Professional Summary\n(.+?)(?=\n##)', content, re.DOTALL)
-    if match:
-        return match.group(1).strip()
-    return ""
+    # Shared Supabase session (one keep-alive connection pool per process)
+    supabase = get_session(SUPABASE_URL, SUPABASE_KEY)
 
+    # Send education/certifications only if this database's RPC accepts them
+    params = {
+        'p_profile': data['profile'],
+        'p_experiences': data['experiences'],
+        'p_skills': data['skills'],
+        'p_education': data['education'],
+        'p_certifications': data['certifications']
+    }
+    response, _ = call_rpc(
+        supabase, 'create_master_profile', params, OPTIONAL_PROFILE_PARAMS,
+        on_unsupported=lambda _: print("\n⚠️  RPC doesn't support education/certifications yet, importing without them...")
+    )
 
-def parse_work_experiences(content: str) -> List[Dict[str, Any]]:
-    """Parse professional experience section."""
-    experiences = []
+    if response.data:
+        profile_id = response.data
+        print(f"\n✅ Profile imported successfully!")
+        print(f"Profile ID: {profile_id}")
+        return profile_id
+    else:
+        raise Exception(f"Failed to import profile: {response}")
 
-    # Find Professional Experience section (extract until ## Education)
-    exp_start = content.find('## Professional Experience')
-    edu_start = content.find('## Education', exp_start)
 
-    if exp_start == -1:
-        return experiences
+def checkpoint_path(source: Path) -> Path:
+    """Checkpoint file for a source profile, keyed by its absolute path."""
+    key = hashlib.sha1(str(source.resolve()).encode('utf-8')).hexdigest()[:12]
+    return CHECKPOINT_DIR / f"{source.stem}-{key}.json"
 
-    exp_text = content[exp_start:edu_start] if edu_start != -1 else content[exp_start:]
 
-    # Find all job entries (### Company | Position)
-    job_pattern = r'###\s+(.+?)\s*\|\s*(.+?)\n\*\*(.+?)\*\*\s*\|\s*(.+?)\n((?:-.+?\n)+)'
-    matches = re.finditer(job_pattern, exp_text, re.MULTILINE)
+def load_checkpoint(path: Path, source_sha256: str) -> Optional[Dict[str, Any]]:
+    """Load a checkpoint if it belongs to the current version of the source file."""
+    if not path.exists():
+        return None
+    try:
+        checkpoint = json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        print(f"⚠️  Ignoring unreadable checkpoint: {path}")
+        return None
+    if checkpoint.get('source_sha256') != source_sha256:
+        print("⚠️  Profile file changed since the interrupted import, starting over")
+        return None
+    return checkpoint
 
-    for idx, match in enumerate(matches):
-        company_name = match.group(1).strip()
-        position_title = match.group(2).strip()
-        date_range = match.group(3).strip()
-        location = match.group(4).strip()
-        description_text = match.group(5).strip()
 
-        # Parse date range
-        start_date, end_date, is_current = parse_date_range(date_range)
+def save_checkpoint(path: Path, checkpoint: Dict[str, Any]) -> None:
+    """Write the checkpoint atomically so a crash never leaves it half-written."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix('.tmp')
+    temp_path.write_text(json.dumps(checkpoint, indent=2), encoding='utf-8')
+    os.replace(temp_path, path)
 
-        experiences.append({
-            'company_name': company_name,
-            'position_title': position_title,
-            'location': location if location else None,
-            'start_date': start_date,
-            'end_date': end_date,
-            'is_current': is_current,
-            'description': description_text,
-            'display_order': idx
-        })
 
-    return experiences
+def child_rows(data: Dict[str, Any]) -> List[tuple[str, Dict[str, Any]]]:
+    """Work experiences then skills, as (payload key, row) pairs in import order."""
+    return (
+        [('p_experiences', exp) for exp in data['experiences']]
+        + [('p_skills', skill) for skill in data['skills']]
+    )
 
 
-def parse_date_range(date_range: str) -> tuple[Optional[str], Optional[str], bool]:
+def import_to_database_chunked(data: Dict[str, Any], source_sha256: str, checkpoint_file: Path,
+                               chunk_size: int = DEFAULT_CHUNK_SIZE, dry_run: bool = False) -> Optional[str]:
     """
-    Parse date range like 'March 2023 - Present' or 'June 2022 - March 2023'.
-    Returns (start_date, end_date, is_current) in YYYY-MM-DD format.
-    """
-    is_current = 'Present' in date_range or 'present' in date_range
-
-    # Split by dash
-    parts = date_range.split('-')
-    if len(parts) != 2:
-        return None, None, False
+    Import a profile in bounded batches, resuming from a local checkpoint.
 
-    start_str = parts[0].strip()
-    end_str = parts[1].strip()
-
-    start_date = parse_month_year(start_str)
-    end_date = None if is_current else parse_month_year(end_str)
-
-    return start_date, end_date, is_current
-
-
-def parse_month_year(date_str: str) -> Optional[str]:
+    The profile, education and certifications are created once through
+    create_master_profile. Work experiences and skills are then sent
+    `chunk_size` rows at a time through update_master_profile_with_details,
+    and the checkpoint is updated after every committed batch.
     """
-    Parse 'March 2023' or 'June 2022' to 'YYYY-MM-DD' format.
-    Returns first day of the month.
-    """
-    months = {
-        'January': '01', 'February': '02', 'March': '03', 'April': '04',
-        'May': '05', 'June': '06', 'July': '07', 'August': '08',
-        'September': '09', 'October': '10', 'November': '11', 'December': '12'
-    }
-
-    for month_name, month_num in months.items():
-        if month_name in date_str:
-            year_match = re.search(r'(\d{4})', date_str)
-            if year_match:
-                year = year_match.group(1)
-                return f"{year}-{month_num}-01"
-
-    return None
-
-
-def parse_skills(content: str) -> List[Dict[str, Any]]:
-    """Parse all skills sections."""
-    skills = []
-
-    # Find Technical Skills section (extract until ## Professional Experience)
-    skills_start = content.find('## Technical Skills')
-    exp_start = content.find('## Professional Experience', skills_start)
-
-    if skills_start == -1:
-        return skills
-
-    skills_text = content[skills_start:exp_start] if exp_start != -1 else content[skills_start:]
-
-    # Find all skill category sections (### Category Name)
-    category_pattern = r'###\s+(.+?)\n((?:-.+?\n)+)'
-    matches = re.finditer(category_pattern, skills_text, re.MULTILINE)
-
-    display_order = 0
-
-    for match in matches:
-        category_name = match.group(1).strip()
-        skills_block = match.group(2).strip()
-
-        # Extract individual skills (lines starting with -)
-        skill_lines = [line.strip()[2:].strip() for line in skills_block.split('\n') if line.strip().startswith('-')]
-
-        for skill_name in skill_lines:
-            if skill_name:
-                skills.append({
-                    'skill_name': skill_name,
-                    'category': category_name,
-                    'proficiency_level': None,
-                    'years_of_experience': None,
-                    'display_order': display_order
-                })
-                display_order += 1
-
-    return skills
-
-
-def parse_education(content: str) -> List[Dict[str, Any]]:
-    """Parse education section."""
-    education = []
-
-    # Find Education section
-    edu_section = re.search(r'## Education\n(.+?)(?=\n##|$)', content, re.DOTALL)
-    if not edu_section:
-        return education
-
-    edu_text = edu_section.group(1).strip()
+    rows = child_rows(data)
+    batch_count = -(-len(rows) // chunk_size)
 
-    # Split by lines starting with -
-    edu_lines = [line.strip()[2:].strip() for line in edu_text.split('\n') if line.strip().startswith('-')]
-
-    for idx, edu_line in enumerate(edu_lines):
-        # Example: "SMK Negeri 7 Bandung (High School) - Analytical Chemistry (2009-2011)"
-
-        # Extract institution name (before first parenthesis or dash)
-        institution_match = re.search(r'^([^(]+?)(?:\s*\(|\s*-)', edu_line)
-        institution_name = institution_match.group(1).strip() if institution_match else edu_line
-        # Remove markdown bold syntax
-        institution_name = institution_name.replace('**', '').strip()
-
-        # Extract degree/field
-        degree_match = re.search(r'-\s*([^(]+?)\s*\(', edu_line)
-        degree_or_field = degree_match.group(1).strip() if degree_match else None
-
-        # Extract date range (last parentheses)
-        date_match = re.search(r'\((\d{4})-(\d{4})\)', edu_line)
-        start_date = None
-        end_date = None
-
-        if date_match:
-            start_year = date_match.group(1)
-            end_year = date_match.group(2)
-            start_date = f"{start_year}-01-01"  # Year precision
-            end_date = f"{end_year}-12-31"
-
-        education.append({
-            'institution_name': institution_name,
-            'degree_or_field': degree_or_field,
-            'location': None,
-            'description': None,
-            'start_date': start_date,
-            'end_date': end_date,
-            'date_precision': 'year',
-            'is_current': False,
-            'display_order': idx
-        })
+    if dry_run:
+        print("\n=== DRY RUN MODE (chunked) ===")
+        print(f"\n1 create_master_profile call, then {batch_count} batches of up to {chunk_size} rows")
+        print(f"Work Experiences: {len(data['experiences'])} entries")
+        print(f"Skills: {len(data['skills'])} entries")
+        return None
 
-    return education
+    checkpoint = load_checkpoint(checkpoint_file, source_sha256)
+    if checkpoint:
+        print(f"\n♻️  Resuming profile {checkpoint['profile_id']} at row {checkpoint['rows_done']} of {len(rows)}")
+    else:
+        profile_id = import_to_database({**data, 'experiences': [], 'skills': []})
+        # New profiles start at version 1 (see 004_profile_transactions.sql)
+        checkpoint = {
+            'source_sha256': source_sha256,
+            'profile_id': profile_id,
+            'version': 1,
+            'rows_done': 0,
+            'in_flight': False,
+        }
+        save_checkpoint(checkpoint_file, checkpoint)
+
+    supabase = get_session(SUPABASE_URL, SUPABASE_KEY)
+
+    while checkpoint['rows_done'] < len(rows):
+        batch = rows[checkpoint['rows_done']:checkpoint['rows_done'] + chunk_size]
+        payload = {'p_experiences': [], 'p_skills': []}
+        for key, row in batch:
+            payload[key].append(row)
+
+        # Mark the batch as sent, so a crash before the reply can be resolved on resume
+        checkpoint['in_flight'] = True
+        save_checkpoint(checkpoint_file, checkpoint)
+
+        result = supabase.rpc('update_master_profile_with_details', {
+            'p_profile_id': checkpoint['profile_id'],
+            'p_expected_version': checkpoint['version'],
+            'p_profile_updates': {},
+            **payload
+        }).execute().data
+
+        if not result.get('success'):
+            # The previous run's batch was committed but its checkpoint wasn't saved
+            committed = result.get('current_version') == checkpoint['version'] + 1
+            if not (checkpoint['in_flight'] and committed):
+                raise Exception(f"Batch import failed: {result.get('error_message')}")
+
+        checkpoint['version'] += 1
+        checkpoint['rows_done'] += len(batch)
+        checkpoint['in_flight'] = False
+        save_checkpoint(checkpoint_file, checkpoint)
+        batch_number = -(-checkpoint['rows_done'] // chunk_size)
+        print(f"  ✅ Batch {batch_number}/{batch_count} committed ({checkpoint['rows_done']}/{len(rows)} rows)")
+
+    checkpoint_file.unlink()
+    return checkpoint['profile_id']
+
+
+
+def load_sync_state() -> Dict[str, str]:
+    """Source file path -> profile id, from earlier --sync runs."""
+    try:
+        return json.loads(SYNC_STATE_FILE.read_text(encoding='utf-8'))
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError):
+        print(f"⚠️  Ignoring unreadable sync state: {SYNC_STATE_FILE}")
+        return {}
+
+
+def remember_synced_profile(source: Path, profile_id: str) -> None:
+    """Record the profile a source file syncs to (atomically, shared by --dir threads)."""
+    with _sync_state_lock:
+        state = load_sync_state()
+        state[str(source.resolve())] = profile_id
+        temp_path = SYNC_STATE_FILE.with_suffix('.tmp')
+        temp_path.write_text(json.dumps(state, indent=2), encoding='utf-8')
+        os.replace(temp_path, SYNC_STATE_FILE)
+
+
+def sync_to_database(data: Dict[str, Any], source: Path, profile_id: Optional[str] = None,
+                     match_by_name: bool = True, dry_run: bool = False) -> Optional[str]:
+    """
+    Update an existing profile with only what differs from `data`.
 
+    The profile is --profile-id, else the one `source` was last synced to,
+    else (with `match_by_name`) the latest profile with the same name and
+    email. Without one, the profile is created as in a plain import.
+    """
+    supabase = get_session(SUPABASE_URL, SUPABASE_KEY)
+    profile_id = profile_id or load_sync_state().get(str(source.resolve()))
+    if profile_id:
+        current = fetch_profile(supabase, profile_id)
+        if current is None:
+            raise Exception(f"Profile {profile_id} not found or deleted")
+    else:
+        current = find_profile(supabase, data['profile']) if match_by_name else None
 
-def parse_certifications(content: str) -> List[Dict[str, Any]]:
-    """Parse certifications section."""
-    certifications = []
+    if current is None:
+        print("\n🆕 No existing profile to sync, creating one")
+        profile_id = import_to_database(data, dry_run=dry_run)
+        if profile_id:
+            remember_synced_profile(source, profile_id)
+        return profile_id
 
-    # Find Certifications section
-    cert_section = re.search(r'## Certifications\n(.+?)(?=\n##|$)', content, re.DOTALL)
-    if not cert_section:
-        return certifications
+    print(f"\n🔄 Syncing profile {current['id']} (version {current['version']})")
+    diff = diff_profile(current, data)
+    print_diff(diff)
+    if dry_run or diff.is_empty:
+        if not dry_run:
+            remember_synced_profile(source, current['id'])
+        return None if dry_run else current['id']
 
-    cert_text = cert_section.group(1).strip()
+    version, rows_sent = apply_diff(supabase, current, diff)
+    remember_synced_profile(source, current['id'])
+    print(f"\n✅ Sent {rows_sent} rows and {len(diff.profile_updates)} profile fields, now version {version}")
+    return current['id']
 
-    # Split by lines starting with -
-    cert_lines = [line.strip()[2:].strip() for line in cert_text.split('\n') if line.strip().startswith('-')]
 
-    for idx, cert_line in enumerate(cert_lines):
-        certifications.append({
-            'certification_name': cert_line,
-            'issuing_organization': None,
-            'credential_id': None,
-            'credential_url': None,
-            'description': None,
-            'issue_date': None,
-            'expiry_date': None,
-            'date_precision': 'year',
-            'display_order': idx
-        })
-
-    return certifications
+def migrate_profile(file_path: Path, args: argparse.Namespace,
+                    profiler: Optional[StageProfiler] = None) -> tuple[Dict[str, Any], Optional[str]]:
+    """
+    Parse, optionally back up, and import one profile file. Returns (data, profile_id).
 
+    With a `profiler`, the read, per-section parse, backup and import times are recorded.
+    """
+    def stage(name: str):
+        return profiler.stage(name) if profiler else nullcontext()
 
-def import_to_database(data: Dict[str, Any], dry_run: bool = False) -> Optional[str]:
-    """Import data to Supabase using create_master_profile RPC."""
+    with stage('read'):
+        content = load_markdown(file_path)
 
-    if dry_run:
-        print("\n=== DRY RUN MODE ===")
-        print("\nProfile Data:")
-        print(json.dumps(data['profile'], indent=2))
-        print(f"\nWork Experiences: {len(data['experiences'])} entries")
-        print(f"Skills: {len(data['skills'])} entries")
-        print(f"Education: {len(data['education'])} entries")
-        print(f"Certifications: {len(data['certifications'])} entries")
-        return None
+    timings: Optional[Dict[str, float]] = {} if profiler else None
+    start = time.perf_counter()
+    profile_data = build_profile_data(content, timings)
+    if profiler:
+        seconds = time.perf_counter() - start
+        profiler.add('parse', seconds)
+        profiler.add_timings(timings, prefix='parse.')
+        profiler.record_file(str(file_path), seconds)
 
-    # Initialize Supabase client
-    supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+    # Backup if requested
+    if args.backup and not args.dry_run:
+        backup_path = file_path.parent / f"{file_path.stem}_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
+        print(f"💾 Creating backup: {backup_path}")
+        with stage('backup'), open(backup_path, 'w', encoding='utf-8') as f:
+            f.write(content)
 
-    # Call create_master_profile RPC
-    # Note: Try with education/certifications if RPC supports it
-    try:
-        response = supabase.rpc('create_master_profile', {
-            'p_profile': data['profile'],
-            'p_experiences': data['experiences'],
-            'p_skills': data['skills'],
-            'p_education': data['education'],
-            'p_certifications': data['certifications']
-        }).execute()
-    except Exception as e:
-        # Fallback: Try without education/certifications if RPC doesn't support it yet
-        if 'parameter' in str(e).lower() or 'function' in str(e).lower():
-            print("\n⚠️  RPC doesn't support education/certifications yet, importing without them...")
-            response = supabase.rpc('create_master_profile', {
-                'p_profile': data['profile'],
-                'p_experiences': data['experiences'],
-                'p_skills': data['skills']
-            }).execute()
+    # Import to database
+    with stage('import'):
+        if args.sync:
+            profile_id = sync_to_database(
+                profile_data,
+                file_path,
+                profile_id=args.profile_id,
+                match_by_name=not (args.dir or args.glob),
+                dry_run=args.dry_run
+            )
+        elif args.chunked:
+            profile_id = import_to_database_chunked(
+                profile_data,
+                hashlib.sha256(content.encode('utf-8')).hexdigest(),
+                checkpoint_path(file_path),
+                chunk_size=args.chunk_size,
+                dry_run=args.dry_run
+            )
         else:
-            raise e
+            profile_id = import_to_database(profile_data, dry_run=args.dry_run)
+    return profile_data, profile_id
+
+
+def discover_profiles(directory: Optional[str], pattern: Optional[str]) -> List[Path]:
+    """Profile markdown files under --dir and/or matching --glob, without READMEs or --backup copies."""
+    paths = set()
+    if directory:
+        paths.update(Path(directory).rglob('*.md'))
+    if pattern:
+        paths.update(Path(match) for match in glob.glob(pattern, recursive=True))
+    return sorted(
+        path for path in paths
+        if path.is_file() and path.stem.lower() != 'readme' and not BACKUP_NAME_RE.search(path.stem)
+    )
 
-    if response.data:
-        profile_id = response.data
-        print(f"\n✅ Profile imported successfully!")
-        print(f"Profile ID: {profile_id}")
-        return profile_id
-    else:
-        raise Exception(f"Failed to import profile: {response}")
+
+def migrate_many(files: List[Path], args: argparse.Namespace, profiler: Optional[StageProfiler] = None) -> int:
+    """Import many profile files with bounded concurrency and print a summary table."""
+
+    def run(file_path: Path) -> Dict[str, Any]:
+        start = time.perf_counter()
+        try:
+            data, profile_id = migrate_profile(file_path, args, profiler)
+            outcome = 'dry-run' if args.dry_run else 'synced' if args.sync else 'imported'
+            detail = profile_id or f"{len(data['experiences'])} exp, {len(data['skills'])} skills"
+        except Exception as e:
+            outcome, detail = 'failed', str(e)
+        return {
+            'file': file_path,
+            'outcome': outcome,
+            'seconds': time.perf_counter() - start,
+            'detail': detail,
+        }
+
+    print(f"📚 Migrating {len(files)} profiles ({args.concurrency} at a time)...")
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        results = list(executor.map(run, files))
+    total_seconds = time.perf_counter() - start
+
+    width = max(len(str(result['file'])) for result in results)
+    print("\n📊 Migration Summary:")
+    print(f"  {'File':<{width}}  {'Outcome':<8}  {'Latency':>8}  Details")
+    for result in results:
+        icon = '❌' if result['outcome'] == 'failed' else '✅'
+        print(f"  {str(result['file']):<{width}}  {result['outcome']:<8}  "
+              f"{result['seconds']:>7.2f}s  {icon} {result['detail']}")
+
+    failed = sum(1 for result in results if result['outcome'] == 'failed')
+    print(f"\n  {len(results) - failed} succeeded, {failed} failed in {total_seconds:.2f}s")
+    return 1 if failed else 0
+
+
+def report_timings(args: argparse.Namespace) -> None:
+    """Print per-endpoint Supabase request timings when --timings or --profile is set."""
+    if (args.timings or args.profile) and not args.dry_run:
+        get_session(SUPABASE_URL, SUPABASE_KEY).print_timings()
 
 
 def main():
@@ -341,9 +396,67 @@ def main():
     parser.add_argument('--dry-run', action='store_true', help='Preview without importing')
     parser.add_argument('--backup', action='store_true', help='Backup original file before migration')
     parser.add_argument('--file', type=str, help='Path to master_profile.md (default: 01_Profile/master_profile.md)')
+    parser.add_argument('--dir', type=str, help='Import every profile .md file under this directory')
+    parser.add_argument('--glob', type=str, help="Import every profile file matching this pattern (e.g. '01_Profile/**/*.md')")
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help=f'Profiles imported at once with --dir/--glob (default: {DEFAULT_CONCURRENCY})')
+    parser.add_argument('--chunked', action='store_true',
+                        help='Import experiences and skills in batches, resuming an interrupted import')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f'Rows per batch with --chunked (default: {DEFAULT_CHUNK_SIZE})')
+    parser.add_argument('--sync', action='store_true',
+                        help='Update the existing profile with only the changed fields and rows '
+                             'instead of creating a new one (needs migration 029 for education, '
+                             'certifications and deletions)')
+    parser.add_argument('--profile-id', type=str, help='Profile to update with --sync')
+    parser.add_argument('--timings', action='store_true', help='Print Supabase request timings at the end')
+    parser.add_argument('--refresh-rpc-cache', action='store_true',
+                        help='Re-probe RPC signatures instead of using the cached ones')
+    parser.add_argument('--profile', action='store_true',
+                        help='Time reading, each parser section, backup and import (implies --timings) '
+                             'and list the slowest profiles')
+    parser.add_argument('--profile-output', type=str, default=None,
+                        help='With --profile, also run under cProfile and write pstats to this file')
 
     args = parser.parse_args()
 
+    if args.chunk_size < 1:
+        parser.error('--chunk-size must be at least 1')
+    if args.concurrency < 1:
+        parser.error('--concurrency must be at least 1')
+    if args.file and (args.dir or args.glob):
+        parser.error('--file cannot be combined with --dir/--glob')
+    if args.sync and args.chunked:
+        parser.error('--sync cannot be combined with --chunked')
+    if args.profile_id and not args.sync:
+        parser.error('--profile-id requires --sync')
+    if args.profile_id and (args.dir or args.glob):
+        parser.error('--profile-id cannot be combined with --dir/--glob')
+    if args.profile_output and not args.profile:
+        parser.error('--profile-output requires --profile')
+
+    profiler = StageProfiler() if args.profile else None
+    with profile_calls(args.profile_output):
+        status = migrate(args, profiler)
+    if profiler:
+        profiler.print_summary('Migration profile')
+    return status
+
+
+def migrate(args: argparse.Namespace, profiler: Optional[StageProfiler] = None) -> int:
+    """Run the migration the parsed arguments describe. Returns the exit status."""
+    if args.refresh_rpc_cache and not args.dry_run:
+        get_capabilities(get_session(SUPABASE_URL, SUPABASE_KEY)).invalidate()
+
+    if args.dir or args.glob:
+        files = discover_profiles(args.dir, args.glob)
+        if not files:
+            print("❌ Error: No profile files found")
+            return 1
+        status = migrate_many(files, args, profiler)
+        report_timings(args)
+        return status
+
     # Determine file path
     file_path = Path(args.file) if args.file else MASTER_PROFILE_PATH
 
@@ -353,72 +466,31 @@ def main():
 
     print(f"📄 Reading {file_path}...")
 
-    # Load and parse markdown
-    content = load_markdown(file_path)
-
-    # Extract full name from title (first line)
-    title_match = re.search(r'^#\s+(.+?)\s*-\s*Master Profile', content, re.MULTILINE)
-    full_name = title_match.group(1).strip() if title_match else "Unknown"
-
-    # Parse all sections
-    contact = parse_contact_info(content)
-    summary = parse_professional_summary(content)
-    experiences = parse_work_experiences(content)
-    skills = parse_skills(content)
-    education = parse_education(content)
-    certifications = parse_certifications(content)
-
-    # Build profile data
-    profile_data = {
-        'profile': {
-            'profile_name': f"{full_name} - Master Profile",
-            'is_default': True,
-            'full_name': full_name,
-            'email': contact.get('email', ''),
-            'phone_primary': contact.get('phone_primary'),
-            'phone_secondary': contact.get('phone_secondary'),
-            'linkedin_url': contact.get('linkedin_url'),
-            'github_url': None,
-            'portfolio_url': None,
-            'location': contact.get('location', ''),
-            'professional_summary': summary,
-            'years_of_experience': 9,  # 2016-2025
-            'current_position': 'Software Engineer'
-        },
-        'experiences': experiences,
-        'skills': skills,
-        'education': education,
-        'certifications': certifications
-    }
-
-    # Backup if requested
-    if args.backup and not args.dry_run:
-        backup_path = file_path.parent / f"{file_path.stem}_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
-        print(f"💾 Creating backup: {backup_path}")
-        with open(backup_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-
-    # Import to database
     try:
-        profile_id = import_to_database(profile_data, dry_run=args.dry_run)
+        profile_data, profile_id = migrate_profile(file_path, args, profiler)
 
-        if not args.dry_run and profile_id:
+        if args.sync and not args.dry_run and profile_id:
+            print(f"\nView at: http://localhost:5173/profiles/{profile_id}")
+        elif not args.dry_run and profile_id:
             print(f"\n✅ Migration completed successfully!")
             print(f"\nImported:")
             print(f"  - 1 profile")
-            print(f"  - {len(experiences)} work experiences")
-            print(f"  - {len(skills)} skills")
-            print(f"  - {len(education)} education entries")
-            print(f"  - {len(certifications)} certifications")
+            print(f"  - {len(profile_data['experiences'])} work experiences")
+            print(f"  - {len(profile_data['skills'])} skills")
+            print(f"  - {len(profile_data['education'])} education entries")
+            print(f"  - {len(profile_data['certifications'])} certifications")
             print(f"\nProfile ID: {profile_id}")
             print(f"\nView at: http://localhost:5173/profiles/{profile_id}")
 
+        report_timings(args)
         return 0
 
     except Exception as e:
         print(f"\n❌ Error during migration: {e}")
+        if args.chunked:
+            print("   Committed batches are checkpointed; run the same command again to resume.")
+        report_timings(args)
         return 1
 
-
 if __name__ == '__main__':
     exit(main())
@@ -0,0 +1,345 @@
+"""
+Parsing of master_profile.md into the create_master_profile payload.
+
+parse_profile() indexes the document once: it finds every "##"/"###"
+heading with literal scans, builds a section tree from them, and reads each
+field from its section instead of re-finding sections with `find`/`re.search`
+and re-splitting the whole document per field. The original parse_*
+functions are kept in bench_profile_parser.py as the reference
+implementation; it checks that both return the same structures and measures
+scaling.
+
+Dates go through date_normalization.py, so parse_profile() also accepts
+abbreviated months, en/em dashes and ISO dates that parse_date_range() and
+the "(YYYY-YYYY)" education pattern miss.
+
+Usage:
+    from profile_parser import build_profile_data
+    data = build_profile_data(content)
+"""
+
+import re
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from date_normalization import normalize_date_range, normalize_year_range
+from stage_profiler import lap_timer
+
+
+_TITLE_RE = re.compile(r'^#\s+(.+?)\s*-\s*Master Profile', re.MULTILINE)
+_EMAIL_RE = re.compile(r'\*\*Email\*\*:\s*([^\n]+)')
+_WHATSAPP_RE = re.compile(r'Whatsapp:\s*([^\n]+)')
+_PHONE_RE = re.compile(r'Phone:\s*([^\n]+)')
+_LINKEDIN_RE = re.compile(r'\*\*LinkedIn\*\*:.*?\[.*?\]\((https?://[^\)]+)\)')
+_LOCATION_RE = re.compile(r'\*\*Location\*\*:\s*([^\n]+)')
+
+_INSTITUTION_RE = re.compile(r'^([^(]+?)(?:\s*\(|\s*-)')
+_DEGREE_RE = re.compile(r'-\s*([^(]+?)\s*\(')
+
+
+class Heading(NamedTuple):
+    """A line starting with "##" and where its text ends."""
+    start: int  # Offset of the line
+    end: int    # Offset of its newline, or len(content) for an unterminated last line
+    level: int  # Number of leading '#'
+    line: str
+
+
+class Section(NamedTuple):
+    """A "## " heading, its own text, and the deeper headings under it."""
+    heading: Heading
+    body_end: int  # End of the text before the next "##"-or-deeper heading
+    terminated: bool  # A heading follows (the text ends at a "\n##")
+    children: List[int]  # Indexes into ProfileDocument.headings
+
+
+class ProfileDocument:
+    """Section tree of a master_profile.md document."""
+
+    def __init__(self, content: str):
+        self.content = content
+        self.headings: List[Heading] = []
+        self.sections: List[Section] = []
+
+        starts = []
+        index = content.find('\n##')
+        while index != -1:
+            starts.append(index + 1)
+            index = content.find('\n##', index + 1)
+        if content.startswith('##'):
+            starts.insert(0, 0)
+
+        for start in starts:
+            end = content.find('\n', start)
+            if end == -1:
+                end = len(content)
+            line = content[start:end]
+            self.headings.append(Heading(start, end, len(line) - len(line.lstrip('#')), line))
+
+        for position, heading in enumerate(self.headings):
+            if heading.level == 2:
+                terminated = position + 1 < len(self.headings)
+                body_end = self.headings[position + 1].start - 1 if terminated else len(content)
+                self.sections.append(Section(heading, body_end, terminated, []))
+            elif self.sections:
+                self.sections[-1].children.append(position)
+
+    def section(self, title: str) -> Optional[Section]:
+        """First "## <title>" section whose heading line is newline-terminated."""
+        line = f"## {title}"
+        for section in self.sections:
+            if section.heading.line == line and section.heading.end < len(self.content):
+                return section
+        return None
+
+    def body(self, section: Section) -> str:
+        return self.content[section.heading.end + 1:section.body_end]
+
+    def span(self, first: str, until: str) -> List[Section]:
+        """Sections from the first "## <first>..." up to the next "## <until>..." (or the end)."""
+        for position, section in enumerate(self.sections):
+            if section.heading.line.startswith(f"## {first}"):
+                selected = []
+                for following in self.sections[position:]:
+                    if following is not section and following.heading.line.startswith(f"## {until}"):
+                        break
+                    selected.append(following)
+                return selected
+        return []
+
+    def lines_after(self, position: int) -> List[str]:
+        """Newline-terminated lines between heading `position` and the next heading."""
+        heading = self.headings[position]
+        if position + 1 < len(self.headings):
+            end = self.headings[position + 1].start
+        else:
+            end = len(self.content)
+        # The last element is '' or an unterminated final line; drop it either way
+        return self.content[heading.end + 1:end].split('\n')[:-1]
+
+    def entries(self, sections: List[Section]) -> List[Tuple[str, List[str]]]:
+        """(heading text, following lines) of every "###"-or-deeper heading in `sections`.
+
+        Trailing whitespace of the heading text is kept; callers strip it.
+        """
+        entries = []
+        for section in sections:
+            for position in section.children:
+                line = self.headings[position].line
+                level = self.headings[position].level
+                # Same as the original "###\s+" prefix
+                if line[level:level + 1].isspace() and line[level:].strip():
+                    entries.append((line[level:].lstrip(), self.lines_after(position)))
+        return entries
+
+
+def _bullets(lines: List[str]) -> List[str]:
+    """Leading run of "-" lines (the original "(?:-.+?\n)+" block)."""
+    bullets = []
+    for line in lines:
+        if len(line) < 2 or line[0] != '-':
+            break
+        bullets.append(line)
+    return bullets
+
+
+def _list_items(text: str) -> List[str]:
+    """Text of every "- item" line in a section body."""
+    return [line.strip()[2:].strip() for line in text.strip().split('\n') if line.strip().startswith('-')]
+
+
+def _line_values(tail: str, lines: List[str], cursor: int) -> List[Tuple[str, int]]:
+    """
+    Candidate (value, next line) pairs for an original "\\s*(.+?)\\n" tail, in
+    the order the regex tries them.
+
+    `tail` is the rest of the current line. When it is blank, "\\s*" first runs
+    on to the next non-blank line, which becomes the value; if the rest of the
+    pattern fails from there it backs off to the blank tail itself.
+    """
+    if tail.strip():
+        return [(tail.strip(), cursor)]
+    candidates = []
+    following = cursor
+    while following < len(lines) and not lines[following].strip():
+        following += 1
+    if following < len(lines):
+        candidates.append((lines[following].strip(), following + 1))
+    if tail:
+        candidates.append(('', cursor))
+    return candidates
+
+
+def _experience_dates(line: str) -> Optional[Tuple[str, str]]:
+    """Split "**Date Range** | Location" into the date range and the raw location tail."""
+    if not line.startswith('**'):
+        return None
+    search = 3
+    while True:
+        close = line.find('**', search)
+        if close == -1:
+            return None
+        rest = line[close + 2:].lstrip()
+        if rest.startswith('|'):
+            return line[2:close].strip(), rest[1:]
+        search = close + 1
+
+
+def _experience_entry(text: str, lines: List[str]) -> Optional[Tuple[str, str, str, str, List[str]]]:
+    """(company, position, date range, location, bullets) of one "### Company | Position" entry."""
+    bar = text.find('|', 1)
+    if bar == -1:
+        return None
+    for position, cursor in _line_values(text[bar + 1:], lines, 0):
+        dates = _experience_dates(lines[cursor]) if cursor < len(lines) else None
+        if not dates:
+            continue
+        for location, after in _line_values(dates[1], lines, cursor + 1):
+            bullets = _bullets(lines[after:])
+            if bullets:
+                return text[:bar].strip(), position, dates[0], location, bullets
+    return None
+
+
+def parse_profile(content: str, timings: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+    """
+    Parse every master_profile.md field from one section tree.
+
+    Returns {'full_name', 'contact', 'summary', 'experiences', 'skills',
+    'education', 'certifications'}. The document is split into a
+    ProfileDocument section tree once, and each field is read from its own
+    section. When `timings` is given, the seconds spent building the section
+    tree and on each field are added to it.
+    """
+    lap = lap_timer(timings)
+    document = ProfileDocument(content)
+    lap('document')
+
+    title_match = _TITLE_RE.search(content)
+    contact = {}
+    for key, pattern in (
+        ('email', _EMAIL_RE),
+        ('phone_primary', _WHATSAPP_RE),
+        ('phone_secondary', _PHONE_RE),
+        ('linkedin_url', _LINKEDIN_RE),
+        ('location', _LOCATION_RE),
+    ):
+        match = pattern.search(content)
+        if match:
+            contact[key] = match.group(1).strip()
+    lap('contact')
+
+    summary = ''
+    summary_section = document.section('Professional Summary')
+    if summary_section and summary_section.terminated:
+        summary = document.body(summary_section).strip()
+    lap('summary')
+
+    experiences = []
+    for text, lines in document.entries(document.span('Professional Experience', 'Education')):
+        # "### Company | Position", "**Date Range** | Location", then "-" bullets
+        entry = _experience_entry(text, lines)
+        if not entry:
+            continue
+        company_name, position, date_range, location, bullets = entry
+        start_date, end_date, is_current = normalize_date_range(date_range)
+        experiences.append({
+            'company_name': company_name,
+            'position_title': position,
+            'location': location if location else None,
+            'start_date': start_date,
+            'end_date': end_date,
+            'is_current': is_current,
+            'description': '\n'.join(bullets).strip(),
+            'display_order': len(experiences)
+        })
+    lap('experiences')
+
+    skills = []
+    for category_name, lines in document.entries(document.span('Technical Skills', 'Professional Experience')):
+        category_name = category_name.strip()
+        for line in _bullets(lines):
+            skill_name = line.strip()[2:].strip()
+            if skill_name:
+                skills.append({
+                    'skill_name': skill_name,
+                    'category': category_name,
+                    'proficiency_level': None,
+                    'years_of_experience': None,
+                    'display_order': len(skills)
+                })
+    lap('skills')
+
+    education = []
+    education_section = document.section('Education')
+    for idx, edu_line in enumerate(_list_items(document.body(education_section)) if education_section else []):
+        institution_match = _INSTITUTION_RE.search(edu_line)
+        institution_name = institution_match.group(1).strip() if institution_match else edu_line
+        degree_match = _DEGREE_RE.search(edu_line)
+        start_date, end_date = normalize_year_range(edu_line)
+        education.append({
+            'institution_name': institution_name.replace('**', '').strip(),
+            'degree_or_field': degree_match.group(1).strip() if degree_match else None,
+            'location': None,
+            'description': None,
+            'start_date': start_date,
+            'end_date': end_date,
+            'date_precision': 'year',
+            'is_current': False,
+            'display_order': idx
+        })
+    lap('education')
+
+    certifications = []
+    certifications_section = document.section('Certifications')
+    for idx, cert_line in enumerate(_list_items(document.body(certifications_section)) if certifications_section else []):
+        certifications.append({
+            'certification_name': cert_line,
+            'issuing_organization': None,
+            'credential_id': None,
+            'credential_url': None,
+            'description': None,
+            'issue_date': None,
+            'expiry_date': None,
+            'date_precision': 'year',
+            'display_order': idx
+        })
+    lap('certifications')
+
+    return {
+        'full_name': title_match.group(1).strip() if title_match else "Unknown",
+        'contact': contact,
+        'summary': summary,
+        'experiences': experiences,
+        'skills': skills,
+        'education': education,
+        'certifications': certifications,
+    }
+
+
+def build_profile_data(content: str, timings: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+    """Parse master_profile.md content into the import payload (see parse_profile for `timings`)."""
+    parsed = parse_profile(content, timings)
+    full_name = parsed['full_name']
+    contact = parsed['contact']
+
+    return {
+        'profile': {
+            'profile_name': f"{full_name} - Master Profile",
+            'is_default': True,
+            'full_name': full_name,
+            'email': contact.get('email', ''),
+            'phone_primary': contact.get('phone_primary'),
+            'phone_secondary': contact.get('phone_secondary'),
+            'linkedin_url': contact.get('linkedin_url'),
+            'github_url': None,
+            'portfolio_url': None,
+            'location': contact.get('location', ''),
+            'professional_summary': parsed['summary'],
+            'years_of_experience': 9,  # 2016-2025
+            'current_position': 'Software Engineer'
+        },
+        'experiences': parsed['experiences'],
+        'skills': parsed['skills'],
+        'education': parsed['education'],
+        'certifications': parsed['certifications']
+    }
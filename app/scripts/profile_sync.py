@@ -0,0 +1,242 @@
+"""
+Diff-based sync of a parsed master_profile.md into an existing profile.
+
+A plain migrate_to_db.py run creates a new profile with every child row, so
+re-importing an edited master_profile.md duplicates the profile. Sync mode
+fetches the current profile with its work experiences, skills, education and
+certifications in one request, matches each parsed row to a stored row by a
+natural key, and sends only the differences through one
+update_master_profile_with_details call:
+
+- Parsed rows without a stored match are inserted
+- Matched rows whose columns differ are updated in place (by id)
+- Stored rows without a parsed match are deleted
+- Changed profile fields go in p_profile_updates
+
+Keys are compared case-insensitively:
+- experiences:    company_name, position_title, start_date
+- skills:         skill_name, category
+- education:      institution_name, degree_or_field
+- certifications: certification_name, issuing_organization
+
+Education, certifications and deletions need migration 029. Against an older
+RPC, only the profile, experience and skill changes are sent and the rest is
+reported as skipped. A profile field the markdown leaves empty is not cleared,
+because the RPC keeps the stored value for NULL (COALESCE).
+
+Usage:
+    current = fetch_profile(session, profile_id)
+    diff = diff_profile(current, build_profile_data(content))
+    if not diff.is_empty:
+        version, rows_sent = apply_diff(session, current, diff)
+"""
+
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from rpc_capabilities import call_rpc
+from supabase_session import SupabaseSession
+
+
+SYNC_RPC = 'update_master_profile_with_details'
+# Parameters added by migration 029
+SYNC_PARAMS = {'p_education', 'p_certifications', 'p_deleted'}
+
+PROFILE_FIELDS = (
+    'profile_name', 'is_default', 'full_name', 'email', 'phone_primary', 'phone_secondary',
+    'linkedin_url', 'github_url', 'portfolio_url', 'location', 'professional_summary',
+    'years_of_experience', 'current_position',
+)
+
+
+class Section(NamedTuple):
+    name: str      # Key in build_profile_data() output and in p_deleted
+    table: str
+    param: str     # RPC parameter with the upserted rows
+    key: Tuple[str, ...]
+    columns: Tuple[str, ...]
+    defaults: Dict[str, Any]  # Values the RPC stores for a missing column
+
+
+SECTIONS = (
+    Section('experiences', 'work_experiences', 'p_experiences',
+            ('company_name', 'position_title', 'start_date'),
+            ('company_name', 'position_title', 'location', 'start_date', 'end_date', 'is_current',
+             'description', 'display_order'),
+            {'is_current': False, 'display_order': 0}),
+    Section('skills', 'skills', 'p_skills',
+            ('skill_name', 'category'),
+            ('skill_name', 'category', 'proficiency_level', 'years_of_experience', 'display_order'),
+            {'display_order': 0}),
+    Section('education', 'education', 'p_education',
+            ('institution_name', 'degree_or_field'),
+            ('institution_name', 'degree_or_field', 'location', 'description', 'start_date', 'end_date',
+             'date_precision', 'is_current', 'display_order'),
+            {'date_precision': 'month', 'is_current': False, 'display_order': 0}),
+    Section('certifications', 'certifications', 'p_certifications',
+            ('certification_name', 'issuing_organization'),
+            ('certification_name', 'issuing_organization', 'credential_id', 'credential_url', 'description',
+             'issue_date', 'expiry_date', 'date_precision', 'display_order'),
+            {'date_precision': 'month', 'display_order': 0}),
+)
+
+PROFILE_SELECT = '*, ' + ', '.join(f"{section.table}(*)" for section in SECTIONS)
+
+
+class SectionDiff(NamedTuple):
+    inserts: List[Dict[str, Any]]
+    updates: List[Dict[str, Any]]  # Full rows with the stored id
+    deletes: List[str]             # Stored ids
+    unchanged: int
+
+
+class ProfileDiff(NamedTuple):
+    profile_updates: Dict[str, Any]
+    sections: Dict[str, SectionDiff]
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.profile_updates and not any(
+            diff.inserts or diff.updates or diff.deletes for diff in self.sections.values()
+        )
+
+    @property
+    def row_count(self) -> int:
+        """Child rows to insert or update plus ids to delete."""
+        return sum(len(diff.inserts) + len(diff.updates) + len(diff.deletes) for diff in self.sections.values())
+
+
+def _value(value: Any) -> Any:
+    # The parser emits '' and None interchangeably for missing text
+    return None if value == '' else value
+
+
+def _column(row: Dict[str, Any], column: str, defaults: Dict[str, Any]) -> Any:
+    value = _value(row.get(column))
+    return defaults.get(column) if value is None else value
+
+
+def _key(row: Dict[str, Any], section: Section) -> Tuple[Any, ...]:
+    return tuple(
+        value.strip().casefold() if isinstance(value, str) else value
+        for value in (_column(row, column, section.defaults) for column in section.key)
+    )
+
+
+def diff_section(section: Section, stored: List[Dict[str, Any]], parsed: List[Dict[str, Any]]) -> SectionDiff:
+    """Match parsed rows to stored rows by key; rows sharing a key pair up in order."""
+    by_key: Dict[Tuple[Any, ...], List[Dict[str, Any]]] = {}
+    for row in stored:
+        by_key.setdefault(_key(row, section), []).append(row)
+
+    inserts: List[Dict[str, Any]] = []
+    updates: List[Dict[str, Any]] = []
+    unchanged = 0
+    for row in parsed:
+        matches = by_key.get(_key(row, section))
+        if not matches:
+            inserts.append(row)
+            continue
+        match = matches.pop(0)
+        if any(_column(row, column, section.defaults) != _column(match, column, section.defaults)
+               for column in section.columns):
+            updates.append({**row, 'id': match['id']})
+        else:
+            unchanged += 1
+
+    deletes = [row['id'] for rows in by_key.values() for row in rows]
+    return SectionDiff(inserts, updates, deletes, unchanged)
+
+
+def diff_profile(current: Dict[str, Any], data: Dict[str, Any]) -> ProfileDiff:
+    """Differences between a fetched profile (fetch_profile) and build_profile_data() output."""
+    profile_updates = {
+        field: value for field, value in data['profile'].items()
+        if field in PROFILE_FIELDS and _value(value) is not None and value != current.get(field)
+    }
+    sections = {}
+    for section in SECTIONS:
+        # Soft-deleted rows (005_security_locking.sql) are invisible to the app
+        stored = [row for row in current.get(section.table) or [] if row.get('deleted_at') is None]
+        sections[section.name] = diff_section(section, stored, data[section.name])
+    return ProfileDiff(profile_updates, sections)
+
+
+def fetch_profile(session: SupabaseSession, profile_id: str) -> Optional[Dict[str, Any]]:
+    """A non-deleted profile with all its child rows, or None."""
+    response = (
+        session.table('master_profiles').select(PROFILE_SELECT)
+        .eq('id', profile_id).is_('deleted_at', 'null').limit(1).execute()
+    )
+    return response.data[0] if response.data else None
+
+
+def find_profile(session: SupabaseSession, profile: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """The most recently updated non-deleted profile with the same name and email, or None."""
+    response = (
+        session.table('master_profiles').select(PROFILE_SELECT)
+        .eq('profile_name', profile['profile_name']).eq('email', profile['email'])
+        .is_('deleted_at', 'null').order('updated_at', desc=True).limit(1).execute()
+    )
+    return response.data[0] if response.data else None
+
+
+def sync_params(current: Dict[str, Any], diff: ProfileDiff) -> Dict[str, Any]:
+    """The update_master_profile_with_details payload: only the changed rows."""
+    params: Dict[str, Any] = {
+        'p_profile_id': current['id'],
+        'p_expected_version': current['version'],
+        'p_profile_updates': diff.profile_updates,
+    }
+    deleted = {}
+    for section in SECTIONS:
+        section_diff = diff.sections[section.name]
+        params[section.param] = section_diff.updates + section_diff.inserts
+        if section_diff.deletes:
+            deleted[section.name] = section_diff.deletes
+    params['p_deleted'] = deleted
+    return params
+
+
+def _skipped_changes(params: Dict[str, Any]) -> List[str]:
+    """What leaving out the migration 029 parameters drops from a payload."""
+    skipped = [f"{len(params[param])} {param[2:]} changes" for param in ('p_education', 'p_certifications')
+               if params.get(param)]
+    skipped += [f"{len(ids)} {name} deletions" for name, ids in params.get('p_deleted', {}).items()]
+    return skipped
+
+
+def _warn_skipped(skipped: List[str]) -> None:
+    print("\n⚠️  RPC doesn't support education/certifications/deletions yet (apply migration 029)")
+    if skipped:
+        print(f"   Skipped: {', '.join(skipped)}")
+
+
+def _sent_rows(params: Dict[str, Any]) -> int:
+    """Child rows (inserted or updated) plus ids deleted in an RPC payload."""
+    rows = sum(len(params.get(section.param, [])) for section in SECTIONS)
+    return rows + sum(len(ids) for ids in params.get('p_deleted', {}).values())
+
+
+def apply_diff(session: SupabaseSession, current: Dict[str, Any], diff: ProfileDiff) -> Tuple[int, int]:
+    """Send the diff in one RPC call. Returns the profile's new version and the rows actually sent."""
+    # Send the 029 parameters only if this database's RPC accepts them
+    response, sent = call_rpc(
+        session, SYNC_RPC, sync_params(current, diff), SYNC_PARAMS,
+        on_unsupported=lambda params: _warn_skipped(_skipped_changes(params))
+    )
+    result = response.data
+    if not result.get('success'):
+        raise Exception(f"Profile sync failed: {result.get('error_message')}")
+    return result['current_version'], _sent_rows(sent)
+
+
+def print_diff(diff: ProfileDiff) -> None:
+    if diff.is_empty:
+        print("\n✅ Profile already in sync, nothing to send")
+        return
+    if diff.profile_updates:
+        print(f"\n📝 Profile fields: {', '.join(diff.profile_updates)}")
+    print(f"\n  {'Section':<16}  {'Insert':>6}  {'Update':>6}  {'Delete':>6}  {'Same':>6}")
+    for name, section_diff in diff.sections.items():
+        print(f"  {name:<16}  {len(section_diff.inserts):>6}  {len(section_diff.updates):>6}  "
+              f"{len(section_diff.deletes):>6}  {section_diff.unchanged:>6}")
@@ -0,0 +1,175 @@
+"""
+Cached RPC signatures per Supabase database.
+
+Older schemas don't accept every parameter the scripts can send (e.g.
+create_master_profile before p_education/p_certifications existed). Rather
+than sending the full payload, catching the error and re-sending a smaller
+one on every import, RpcCapabilities reads the RPC parameter lists once from
+PostgREST's OpenAPI description (GET /rest/v1/) and caches them per database
+URL in a local JSON file with an expiry.
+
+When the description is unavailable (e.g. the key isn't allowed to read it),
+parameters() returns None. call_rpc() then falls back to trying the call and
+records what worked with remember(), so the next run gets it right first time.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from supabase_session import SupabaseSession
+
+
+# PostgREST's error code for "no function with these parameters"
+SIGNATURE_ERROR_CODE = 'PGRST202'
+
+CAPABILITIES_FILE = Path(__file__).parent / '.rpc-capabilities.json'
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+
+
+def parse_rpc_parameters(openapi: Dict) -> Dict[str, List[str]]:
+    """Map each RPC in a PostgREST OpenAPI (Swagger 2.0) document to its body parameters."""
+    rpcs = {}
+    for path, operations in openapi.get('paths', {}).items():
+        if not path.startswith('/rpc/') or 'post' not in operations:
+            continue
+        names: List[str] = []
+        for parameter in operations['post'].get('parameters', []):
+            if parameter.get('in') == 'body':
+                names.extend(parameter.get('schema', {}).get('properties', {}))
+        rpcs[path[len('/rpc/'):]] = sorted(names)
+    return rpcs
+
+
+class RpcCapabilities:
+    """Supported RPC parameters for one database, cached on disk."""
+
+    def __init__(self, session: SupabaseSession, path: Path = CAPABILITIES_FILE,
+                 ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self.session = session
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._probed = False
+
+    def _load(self) -> Dict:
+        try:
+            return json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self, cache: Dict) -> None:
+        temp_path = self.path.with_suffix('.tmp')
+        temp_path.write_text(json.dumps(cache, indent=2, sort_keys=True), encoding='utf-8')
+        os.replace(temp_path, self.path)
+
+    def _entry(self, cache: Dict, fn: str) -> Optional[List[str]]:
+        """Cached parameter list of `fn`, if present and not expired."""
+        entry = cache.get(self.session.url, {}).get(fn)
+        if entry and time.time() - entry['checked_at'] < self.ttl_seconds:
+            return entry['params']
+        return None
+
+    def _probe(self) -> Optional[Dict[str, List[str]]]:
+        """Read every RPC signature from the PostgREST OpenAPI description."""
+        try:
+            response = self.session.http.get('/')
+            response.raise_for_status()
+            return parse_rpc_parameters(response.json())
+        except Exception as e:
+            reason = str(e).splitlines()[0] if str(e) else type(e).__name__
+            print(f"⚠️  Could not read RPC signatures ({reason}), detecting them per call instead")
+            return None
+
+    def _store(self, rpcs: Dict[str, List[str]]) -> None:
+        cache = self._load()
+        database = cache.setdefault(self.session.url, {})
+        now = time.time()
+        for fn, params in rpcs.items():
+            database[fn] = {'params': sorted(params), 'checked_at': now}
+        self._save(cache)
+
+    def parameters(self, fn: str) -> Optional[Set[str]]:
+        """Parameters `fn` accepts, or None when unknown. Probes at most once per process."""
+        with self._lock:
+            params = self._entry(self._load(), fn)
+            if params is None and not self._probed:
+                self._probed = True
+                rpcs = self._probe()
+                if rpcs:
+                    self._store(rpcs)
+                    params = rpcs.get(fn)
+            return set(params) if params is not None else None
+
+    def remember(self, fn: str, params: Set[str]) -> None:
+        """Record parameters a call to `fn` was accepted with."""
+        with self._lock:
+            self._store({fn: sorted(params)})
+
+    def invalidate(self) -> None:
+        """Forget everything cached for this database."""
+        with self._lock:
+            cache = self._load()
+            if cache.pop(self.session.url, None) is not None:
+                self._save(cache)
+            self._probed = False
+
+
+_capabilities: Dict[str, RpcCapabilities] = {}
+_capabilities_lock = threading.Lock()
+
+
+def get_capabilities(session: SupabaseSession) -> RpcCapabilities:
+    """Return the process-wide capability cache for a session's database."""
+    with _capabilities_lock:
+        capabilities = _capabilities.get(session.url)
+        if capabilities is None:
+            capabilities = _capabilities[session.url] = RpcCapabilities(session)
+        return capabilities
+
+
+def _is_signature_error(error: Exception) -> bool:
+    """Whether an RPC error means the function doesn't take the parameters sent."""
+    if getattr(error, 'code', None) == SIGNATURE_ERROR_CODE:
+        return True
+    message = str(error).lower()
+    return 'parameter' in message or 'function' in message
+
+
+def call_rpc(session: SupabaseSession, fn: str, params: Dict[str, Any], optional: Set[str],
+             on_unsupported: Optional[Callable[[Dict[str, Any]], None]] = None) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Call `fn`, leaving out the `optional` parameters if its signature lacks them.
+
+    `on_unsupported` is called with the full `params` before they are dropped.
+    Returns (response, parameters actually sent).
+    """
+    capabilities = get_capabilities(session)
+    supported = capabilities.parameters(fn)
+
+    def without_optional() -> Dict[str, Any]:
+        if on_unsupported:
+            on_unsupported(params)
+        return {key: value for key, value in params.items() if key not in optional}
+
+    if supported is not None:
+        sent = params if optional <= supported else without_optional()
+        return session.rpc(fn, sent).execute(), sent
+
+    # The signature couldn't be probed, so the only way to learn it is to try
+    # the full call and read the error. This is the one place the error text is
+    # trusted; the outcome is cached, so it happens once per database and TTL.
+    try:
+        response = session.rpc(fn, params).execute()
+    except Exception as e:
+        if not optional & set(params) or not _is_signature_error(e):
+            raise
+        sent = without_optional()
+        response = session.rpc(fn, sent).execute()
+        capabilities.remember(fn, set(sent))
+        return response, sent
+    capabilities.remember(fn, set(params))
+    return response, params
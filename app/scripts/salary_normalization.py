@@ -0,0 +1,197 @@
+"""
+Structured salary normalization for the seed pipeline.
+
+job-spec.md files state pay as free text ("THB 80k-120k/month",
+"$150,000 - $163,000", "30,000 - 80,000 baht/month"), which the jobs table
+keeps in salary_range. This module turns such strings into numeric
+salary_min/salary_max plus an ISO currency code and a pay period. Migration
+028 stores them in indexed columns, so pay filters can use a B-tree instead
+of parsing text.
+
+The currency table is compiled once into a single regex, every pattern is
+precompiled, and results are memoized on the raw string, since most specs
+repeat a handful of salary formats.
+
+Rules:
+- The first amount, or "A - B" / "A to B" range, wins; later text such as
+  "(stated range: ...)" or "+ equity" is ignored
+- "k" multiplies by 1,000 and "m"/"million" by 1,000,000; a suffix on the
+  upper bound also applies to a bare lower bound ("50-70k" -> 50,000-70,000)
+- Thousands may be grouped with ",", "." or a (non-breaking) space before
+  exactly three digits ("€60.000", "THB 70 000"). Mixed separators, or "."
+  groups with a k/m suffix ("1.500k"), are ambiguous and give None rather
+  than a guess
+- "Up to X" only sets the maximum, "X+" and "from X" only the minimum,
+  with or without a currency in between ("up to THB 150k")
+- Amounts followed by "years" ("5+ years exp") are not pay and are skipped
+- A bare number with no currency, period or k/m suffix anywhere in the text
+  ("Negotiable (5)") is not taken as a salary
+- Currency and period are None when the text doesn't name them; nothing
+  is guessed or converted
+
+Usage:
+    job = add_salary_fields(job)   # Adds salary_min, salary_max, salary_currency, salary_period
+
+Examples (checked with `python3 -m doctest salary_normalization.py`):
+    >>> normalize_salary('THB 80k-120k/month')
+    Salary(min=80000.0, max=120000.0, currency='THB', period='month')
+    >>> normalize_salary('€60.000 - €80.000')
+    Salary(min=60000.0, max=80000.0, currency='EUR', period=None)
+    >>> normalize_salary('THB 70 000 - 90 000')
+    Salary(min=70000.0, max=90000.0, currency='THB', period=None)
+    >>> normalize_salary('THB 70\u00a0000/month')
+    Salary(min=70000.0, max=70000.0, currency='THB', period='month')
+    >>> normalize_salary('$1.2 million')
+    Salary(min=1200000.0, max=1200000.0, currency='USD', period=None)
+    >>> normalize_salary('$1,234.56 per hour')
+    Salary(min=1234.56, max=1234.56, currency='USD', period='hour')
+    >>> normalize_salary('Up to THB 150k')
+    Salary(min=None, max=150000.0, currency='THB', period=None)
+    >>> normalize_salary('1.500k EUR') is None   # 1.5k or 1,500k?
+    True
+    >>> normalize_salary('Negotiable (5+ years exp)') is None
+    True
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, NamedTuple, Optional
+
+
+CACHE_SIZE = 4096
+
+SALARY_COLUMNS = ('salary_min', 'salary_max', 'salary_currency', 'salary_period')
+
+# Currency codes, symbols and names -> ISO 4217 code (matched case-insensitively)
+CURRENCIES = {
+    'thb': 'THB', '฿': 'THB', 'baht': 'THB',
+    'usd': 'USD', 'us$': 'USD', '$': 'USD', 'dollars': 'USD',
+    'eur': 'EUR', '€': 'EUR', 'euro': 'EUR', 'euros': 'EUR',
+    'gbp': 'GBP', '£': 'GBP', 'pounds': 'GBP',
+    'sgd': 'SGD', 's$': 'SGD',
+    'aud': 'AUD', 'a$': 'AUD',
+    'jpy': 'JPY', '¥': 'JPY', 'yen': 'JPY',
+    'hkd': 'HKD', 'hk$': 'HKD',
+    'myr': 'MYR', 'rm': 'MYR',
+    'vnd': 'VND', 'idr': 'IDR', 'php': 'PHP', 'inr': 'INR', '₹': 'INR',
+    'cad': 'CAD', 'c$': 'CAD', 'chf': 'CHF', 'twd': 'TWD', 'nt$': 'TWD',
+}
+
+# salary_period values (CHECK constraint in migration 028)
+PERIODS = ('hour', 'day', 'week', 'month', 'year')
+
+
+def _alternation(names) -> str:
+    # Longest first, so "hk$" wins over "$"; word-like names need word boundaries
+    return '|'.join(
+        rf'\b{re.escape(name)}\b' if name.isalpha() else
+        rf'(?<![a-z]){re.escape(name)}' if name[0].isalpha() else re.escape(name)
+        for name in sorted(names, key=len, reverse=True)
+    )
+
+
+_CURRENCY_RE = re.compile(_alternation(CURRENCIES), re.IGNORECASE)
+
+# Thousands separators: comma, dot, space, no-break space, narrow no-break space
+_AMOUNT = r'(\d{1,3}(?:[,. \u00a0\u202f]\d{3}(?!\d))+|\d+)(?:\.(\d+))?\s*(k|m(?:illion)?)?\b'
+_GROUP_SEPARATORS_RE = re.compile(r'[,. \u00a0\u202f]')
+_AMOUNT_RE = re.compile(_AMOUNT, re.IGNORECASE)
+# A second amount right after the first, with an optional currency in between
+_RANGE_TAIL_RE = re.compile(
+    rf'\s*(?:-|–|—|to)\s*(?:{_alternation(CURRENCIES)})?\s*{_AMOUNT}',
+    re.IGNORECASE
+)
+# Keyword, then optionally a currency, right before the amount
+_BEFORE_AMOUNT = rf'\W*(?:(?:{_alternation(CURRENCIES)})\W*)?$'
+_UP_TO_RE = re.compile(rf'\b(?:up\s+to|max(?:imum)?|under){_BEFORE_AMOUNT}', re.IGNORECASE)
+_FROM_RE = re.compile(rf'\b(?:from|min(?:imum)?|at\s+least|starting\s+(?:at|from)){_BEFORE_AMOUNT}', re.IGNORECASE)
+_PLUS_RE = re.compile(r'\+')  # Right after the amount: "100k+", not "100k + bonus"
+_YEARS_RE = re.compile(r'\s*\+?\s*(?:years?|yrs?)\b', re.IGNORECASE)
+
+_PERIOD_RE = re.compile(
+    r'(?P<hour>\bper\s+hour\b|/\s*h(?:ou)?r\b|\bhourly\b|\ban\s+hour\b)'
+    r'|(?P<day>\bper\s+day\b|/\s*day\b|\bdaily\b|\ba\s+day\b)'
+    r'|(?P<week>\bper\s+week\b|/\s*w(?:ee)?k\b|\bweekly\b)'
+    r'|(?P<month>\bper\s+month\b|/\s*mo(?:nth)?\b|\bmonthly\b|\ba\s+month\b|\bp\.?m\.?(?!\w))'
+    r'|(?P<year>\bper\s+(?:year|annum)\b|/\s*y(?:ea)?r\b|\b(?:yearly|annual(?:ly)?)\b|\ba\s+year\b|\bp\.?a\.?(?!\w))',
+    re.IGNORECASE
+)
+
+_MULTIPLIERS = {'k': 1_000, 'm': 1_000_000, 'million': 1_000_000}
+
+
+class Salary(NamedTuple):
+    min: Optional[float]
+    max: Optional[float]
+    currency: Optional[str]
+    period: Optional[str]
+
+
+def _amount(whole: str, fraction: Optional[str], suffix: Optional[str]) -> Optional[float]:
+    """The amount, or None when its digit grouping is ambiguous."""
+    separators = set(_GROUP_SEPARATORS_RE.findall(whole))
+    if len(separators) > 1 or ('.' in separators and (fraction or suffix)):
+        return None
+    value = float(_GROUP_SEPARATORS_RE.sub('', whole) + (f".{fraction}" if fraction else ''))
+    return value * _MULTIPLIERS.get((suffix or '').lower(), 1)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def normalize_salary(text: Optional[str]) -> Optional[Salary]:
+    """Parse a salary string into a Salary, or None when it holds no amount."""
+    if not text:
+        return None
+    for first in _AMOUNT_RE.finditer(text):
+        tail = _RANGE_TAIL_RE.match(text, first.end())
+        if not _YEARS_RE.match(text, (tail or first).end()):
+            break
+    else:
+        return None
+
+    currency = _CURRENCY_RE.search(text)
+    period = _PERIOD_RE.search(text)
+    if not (currency or period or first.group(3) or (tail and tail.group(3))):
+        return None
+
+    low = _amount(*first.groups())
+    high: Optional[float] = low
+    if low is None:
+        return None
+    if tail:
+        high = _amount(*tail.groups())
+        if high is None:
+            return None
+        if first.group(3) is None and tail.group(3) and low < 1000:
+            low *= _MULTIPLIERS[tail.group(3).lower()]
+        if low > high:
+            low, high = high, low
+    elif _UP_TO_RE.search(text, 0, first.start()):
+        low = None
+    elif _FROM_RE.search(text, 0, first.start()) or _PLUS_RE.match(text, first.end()):
+        high = None
+
+    return Salary(
+        low,
+        high,
+        CURRENCIES[currency.group(0).lower()] if currency else None,
+        period.lastgroup if period else None,
+    )
+
+
+def salary_fields(text: Optional[str]) -> Dict[str, Any]:
+    """The SALARY_COLUMNS values for a salary_range string (all None if it can't be parsed)."""
+    salary = normalize_salary(text)
+    if salary is None:
+        return dict.fromkeys(SALARY_COLUMNS)
+    return {
+        'salary_min': salary.min,
+        'salary_max': salary.max,
+        'salary_currency': salary.currency,
+        'salary_period': salary.period,
+    }
+
+
+def add_salary_fields(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Set the normalized salary columns of a job record from its salary_range (in place)."""
+    job.update(salary_fields(job.get('salary_range')))
+    return job
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Columnar seed export and vectorized seed analytics.
+
+`generate-seed-data.py --columnar` writes, next to seed-data.json, a NumPy
+.npz file with one array per column of the fields reports need. Only the
+short fields are kept; the descriptions and match analyses are left out.
+String columns are dictionary-encoded: an int32 code per job plus the
+distinct values, with -1 for a missing value. Grouping by status, location
+or job type is then a single np.bincount over the codes. created_at is
+stored as datetime64[D] and match_percentage as float32 (NaN when missing).
+
+Arrays in an .npz are only read when accessed, so the analytics command
+reads just the columns it reports on. Needs NumPy (`pip install numpy`).
+
+Usage:
+    python3 seed_columns.py                      # Distributions by status, location, job type and month
+    python3 seed_columns.py --by location --top 20
+    python3 seed_columns.py --file other.npz --json
+"""
+
+import argparse
+import json
+import os
+import re
+import tempfile
+import time
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+COLUMNAR_FILE = PROJECT_ROOT / "app" / "scripts" / "seed-data.npz"
+FORMAT_VERSION = 1
+DEFAULT_TOP = 10
+
+# Dictionary-encoded string columns
+STRING_COLUMNS = (
+    'id',
+    'folder_path',
+    'company_name',
+    'position_title',
+    'location',
+    'salary_range',
+    'job_type',
+    'status',
+)
+GROUP_BY = ('status', 'location', 'job_type', 'month')
+
+_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+
+def _require_numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise RuntimeError('Columnar seed data needs NumPy. Install it with: pip install numpy') from None
+    return numpy
+
+
+class ColumnarSeedWriter:
+    """
+    Collects jobs column by column and writes the .npz on close.
+
+    Same interface as the seed file writers: write() per job, then close()
+    (or use it as a context manager). Only integer codes and the distinct
+    values are held in memory, and the file is written to a temp file and
+    renamed over the target.
+    """
+
+    def __init__(self, path: Path):
+        self.np = _require_numpy()
+        self.path = Path(path)
+        self.count = 0
+        self._codes = {column: array('i') for column in STRING_COLUMNS}
+        self._categories: Dict[str, Dict[str, int]] = {column: {} for column in STRING_COLUMNS}
+        self._dates: List[str] = []
+        self._matches = array('f')
+
+    def write(self, job: Dict[str, Any]) -> None:
+        for column in STRING_COLUMNS:
+            value = job.get(column)
+            if value is None or value == '':
+                self._codes[column].append(-1)
+            else:
+                categories = self._categories[column]
+                code = categories.get(value)
+                if code is None:
+                    code = categories[value] = len(categories)
+                self._codes[column].append(code)
+
+        created_at = job.get('created_at') or ''
+        self._dates.append(created_at[:10] if _DATE_RE.match(created_at) else 'NaT')
+        match = job.get('match_percentage')
+        self._matches.append(float('nan') if match is None else float(match))
+        self.count += 1
+
+    def close(self) -> None:
+        np = self.np
+        arrays = {'format_version': np.array(FORMAT_VERSION)}
+        for column in STRING_COLUMNS:
+            arrays[f'{column}.codes'] = np.frombuffer(self._codes[column], dtype=np.int32)
+            # Dicts keep insertion order, which is code order
+            arrays[f'{column}.categories'] = np.array(list(self._categories[column]), dtype=str)
+        arrays['created_at'] = np.array(self._dates, dtype='datetime64[D]')
+        arrays['match_percentage'] = np.frombuffer(self._matches, dtype=np.float32)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix=f".{self.path.name}.", suffix='.tmp', dir=self.path.parent)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, **arrays)
+            os.chmod(temp_path, 0o644)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def abort(self) -> None:
+        self._codes = {}
+        self._dates = []
+
+    def __enter__(self) -> 'ColumnarSeedWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class SeedColumns:
+    """Lazily loaded columns of a columnar seed file."""
+
+    def __init__(self, path: Path):
+        self.np = _require_numpy()
+        self._file = self.np.load(str(path))
+        version = int(self._file['format_version'])
+        if version != FORMAT_VERSION:
+            raise ValueError(f"{path} has format version {version}, expected {FORMAT_VERSION}; "
+                             f"regenerate it with generate-seed-data.py --columnar")
+        self.total = len(self._file['match_percentage'])
+
+    def codes(self, column: str):
+        return self._file[f'{column}.codes']
+
+    def categories(self, column: str):
+        return self._file[f'{column}.categories']
+
+    def __getitem__(self, column: str):
+        return self._file[column]
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> 'SeedColumns':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _groups(np, labels, counts, match_sums, match_counts, top: Optional[int]) -> List[Dict[str, Any]]:
+    """Groups sorted by count (then label), with their average match."""
+    order = np.lexsort((labels, -counts))
+    order = order[counts[order] > 0]
+    if top is not None:
+        order = order[:top]
+    averages = np.divide(match_sums, match_counts, out=np.full(len(counts), np.nan), where=match_counts > 0)
+    return [
+        {
+            'value': str(labels[index]),
+            'count': int(counts[index]),
+            'average_match': None if np.isnan(averages[index]) else round(float(averages[index]), 1),
+        }
+        for index in order
+    ]
+
+
+def distribution(columns: SeedColumns, by: str, top: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Job count and average match per value of `by` (a string column or 'month')."""
+    np = columns.np
+    matches = columns['match_percentage']
+    has_match = ~np.isnan(matches) & (matches != 0)  # Same rule as the summary's match stats
+
+    if by == 'month':
+        months = columns['created_at'].astype('datetime64[M]')
+        valid = ~np.isnat(months)
+        labels, codes = np.unique(months[valid], return_inverse=True)
+        labels = labels.astype(str)
+    else:
+        codes = columns.codes(by)
+        valid = codes >= 0
+        codes = codes[valid]
+        labels = columns.categories(by)
+
+    # Missing values form their own group at the end of the labels
+    missing = int(np.count_nonzero(~valid))
+    size = len(labels)
+    counts = np.bincount(codes, minlength=size)
+    match_sums = np.bincount(codes, weights=np.where(has_match, matches, 0)[valid], minlength=size)
+    match_counts = np.bincount(codes, weights=has_match[valid], minlength=size)
+    if missing:
+        labels = np.append(labels.astype(object), '(none)')
+        counts = np.append(counts, missing)
+        match_sums = np.append(match_sums, np.where(has_match, matches, 0)[~valid].sum())
+        match_counts = np.append(match_counts, np.count_nonzero(has_match[~valid]))
+    return _groups(np, np.asarray(labels, dtype=str), counts, match_sums, match_counts, top)
+
+
+def summarize(columns: SeedColumns, by: Iterable[str] = GROUP_BY, top: Optional[int] = DEFAULT_TOP) -> Dict[str, Any]:
+    """The seed summary statistics plus the distribution for each of `by`."""
+    np = columns.np
+    matches = columns['match_percentage']
+    # Jobs without a match, or a 0% match, don't count towards the match stats
+    scored = matches[~np.isnan(matches) & (matches != 0)]
+    return {
+        'total_jobs': columns.total,
+        'match': {
+            'count': int(scored.size),
+            'average': round(float(scored.mean()), 1) if scored.size else None,
+            'best': int(scored.max()) if scored.size else None,
+            'lowest': int(scored.min()) if scored.size else None,
+        },
+        'with_location': int(np.count_nonzero(columns.codes('location') >= 0)),
+        'with_salary': int(np.count_nonzero(columns.codes('salary_range') >= 0)),
+        'distributions': {name: distribution(columns, name, top) for name in by},
+    }
+
+
+def print_summary(summary: Dict[str, Any]) -> None:
+    match = summary['match']
+    print(f"📊 {summary['total_jobs']} jobs")
+    if match['count']:
+        print(f"  Average match: {match['average']:.1f}% (best {match['best']}%, lowest {match['lowest']}%)")
+    print(f"  Jobs with location: {summary['with_location']}")
+    print(f"  Jobs with salary: {summary['with_salary']}")
+    for name, groups in summary['distributions'].items():
+        print(f"\n📈 By {name.replace('_', ' ')}:")
+        width = max((len(group['value']) for group in groups), default=0)
+        for group in groups:
+            average = f"{group['average_match']:.1f}%" if group['average_match'] is not None else '-'
+            print(f"  {group['value']:<{width}}  {group['count']:>8}  avg match {average}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Seed data distributions from the columnar export')
+    parser.add_argument('--file', type=str, default=str(COLUMNAR_FILE),
+                        help='Columnar seed file (default: app/scripts/seed-data.npz, written by '
+                             'generate-seed-data.py --columnar)')
+    parser.add_argument('--by', nargs='+', choices=GROUP_BY, default=list(GROUP_BY),
+                        help='Distributions to compute (default: all)')
+    parser.add_argument('--top', type=int, default=DEFAULT_TOP,
+                        help=f'Largest groups shown per distribution, 0 for all (default: {DEFAULT_TOP})')
+    parser.add_argument('--json', action='store_true', help='Print the summary as JSON')
+    args = parser.parse_args()
+
+    if not Path(args.file).exists():
+        print(f"❌ {args.file} not found; run generate-seed-data.py --columnar first")
+        return 1
+    started = time.perf_counter()
+    try:
+        with SeedColumns(Path(args.file)) as columns:
+            summary = summarize(columns, args.by, args.top or None)
+    except (RuntimeError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    if args.json:
+        print(json.dumps(summary, indent=2, ensure_ascii=False))
+    else:
+        print_summary(summary)
+        print(f"\n⏱️  {time.perf_counter() - started:.3f}s")
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
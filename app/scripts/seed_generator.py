@@ -0,0 +1,31 @@
+"""
+Import handle for generate-seed-data.py.
+
+The seed generator is run as a script and its file name is not a valid
+module name, so benchmarks and tools that reuse its parsers load it here.
+
+Usage:
+    from seed_generator import load_seed_generator
+    seed = load_seed_generator()
+    job = seed.parse_job_spec(path, folder_name, folder_date)
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+
+SEED_SCRIPT = Path(__file__).with_name('generate-seed-data.py')
+MODULE_NAME = 'generate_seed_data'
+
+
+def load_seed_generator() -> ModuleType:
+    """Load generate-seed-data.py once and return it as a module."""
+    module = sys.modules.get(MODULE_NAME)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(MODULE_NAME, SEED_SCRIPT)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[MODULE_NAME] = module
+        spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,133 @@
+"""
+Persistent manifest for incremental seed generation.
+
+Each application folder is keyed by its folder_path (e.g.
+"04_Applications/Company_Position_2025-01-01") and stores the job-spec.md
+mtime/size/content hash, the last parsed job record and a stable job id.
+generate-seed-data.py uses it to skip folders whose job-spec.md has not
+changed and to keep job ids identical across runs, so 003_seed_jobs.sql
+only changes where the underlying specs changed.
+
+The manifest is a SQLite file so lookups and updates stay per-folder and
+the whole archive never has to be held in memory.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+
+MANIFEST_VERSION = 1
+
+
+class ManifestEntry(NamedTuple):
+    """Cached state of one application folder."""
+    folder_path: str
+    mtime_ns: int
+    size: int
+    sha256: str
+    job_id: str
+    job: Optional[Dict[str, Any]]  # None when the last parse failed
+
+    def matches_stat(self, stat: os.stat_result) -> bool:
+        """True when the job-spec.md looks untouched since it was cached."""
+        return self.mtime_ns == stat.st_mtime_ns and self.size == stat.st_size
+
+
+def content_hash(content: str) -> str:
+    """Hash job-spec.md content the same way for workers and the manifest."""
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+class SeedManifest:
+    """SQLite-backed manifest of parsed job-spec.md files."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._init_schema()
+
+    def _init_schema(self) -> None:
+        version = self._conn.execute('PRAGMA user_version').fetchone()[0]
+        if version not in (0, MANIFEST_VERSION):
+            # Layout changed: the cache is disposable, so start over
+            self._conn.execute('DROP TABLE IF EXISTS entries')
+
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+              folder_path TEXT PRIMARY KEY,
+              mtime_ns INTEGER NOT NULL,
+              size INTEGER NOT NULL,
+              sha256 TEXT NOT NULL,
+              job_id TEXT NOT NULL,
+              job TEXT
+            )
+        """)
+        # Folders seen during the current run, kept on disk instead of in a Python set
+        self._conn.execute('CREATE TEMP TABLE IF NOT EXISTS seen (folder_path TEXT PRIMARY KEY)')
+        self._conn.execute(f'PRAGMA user_version = {MANIFEST_VERSION}')
+        self._conn.commit()
+
+    def get(self, folder_path: str) -> Optional[ManifestEntry]:
+        """Return the cached entry for a folder, if any."""
+        row = self._conn.execute(
+            'SELECT folder_path, mtime_ns, size, sha256, job_id, job FROM entries WHERE folder_path = ?',
+            (folder_path,)
+        ).fetchone()
+        if row is None:
+            return None
+        job = json.loads(row[5]) if row[5] is not None else None
+        return ManifestEntry(row[0], row[1], row[2], row[3], row[4], job)
+
+    def record(self, folder_path: str, stat: os.stat_result, sha256: str,
+               job_id: str, job: Optional[Dict[str, Any]]) -> None:
+        """Insert or replace the entry for a folder."""
+        self._conn.execute(
+            'INSERT OR REPLACE INTO entries (folder_path, mtime_ns, size, sha256, job_id, job) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            (
+                folder_path,
+                stat.st_mtime_ns,
+                stat.st_size,
+                sha256,
+                job_id,
+                json.dumps(job, ensure_ascii=False) if job is not None else None,
+            )
+        )
+
+    def remove(self, folder_path: str) -> None:
+        """Forget a folder that was deleted."""
+        self._conn.execute('DELETE FROM entries WHERE folder_path = ?', (folder_path,))
+
+    def stats(self) -> List[Tuple[str, int, int]]:
+        """(folder_path, mtime_ns, size) of every cached folder, without loading the job records."""
+        return self._conn.execute('SELECT folder_path, mtime_ns, size FROM entries').fetchall()
+
+    def mark_seen(self, folder_path: str) -> None:
+        """Remember that a folder still exists in this run (see prune_unseen)."""
+        self._conn.execute('INSERT OR IGNORE INTO seen (folder_path) VALUES (?)', (folder_path,))
+
+    def prune_unseen(self) -> int:
+        """Delete entries for folders not marked seen in this run. Returns the number removed."""
+        cursor = self._conn.execute(
+            'DELETE FROM entries WHERE folder_path NOT IN (SELECT folder_path FROM seen)'
+        )
+        self._conn.execute('DELETE FROM seen')
+        return cursor.rowcount
+
+    def commit(self) -> None:
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.commit()
+        self._conn.close()
+
+    def __enter__(self) -> 'SeedManifest':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,264 @@
+"""
+Streaming writers for the seed SQL and JSON files.
+
+generate-seed-data.py hands each job to these writers as soon as it is
+parsed, so memory stays flat no matter how many jobs the archive holds.
+Both writers write to a temporary file next to the target and atomically
+rename it on close, so an interrupted run never leaves a half-written seed.
+
+The SQL writer supports three formats:
+- insert: one INSERT statement per job (default, works everywhere)
+- values: multi-row INSERT ... VALUES batches of --batch-size rows
+- copy:   a single COPY jobs FROM STDIN block with tab-separated rows
+          (for psql -f; not supported by migration runners that lack COPY)
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, IO, List, Optional, Tuple
+
+
+SQL_FORMATS = ('insert', 'values', 'copy')
+DEFAULT_BATCH_SIZE = 500
+
+# Column order shared by every SQL format
+JOB_COLUMNS = (
+    'id',
+    'created_at',
+    'updated_at',
+    'input_type',
+    'input_content',
+    'original_url',
+    'company_name',
+    'position_title',
+    'location',
+    'salary_range',
+    'job_type',
+    'job_description_text',
+    'match_percentage',
+    'match_analysis',
+    'status',
+    'kanban_order',
+    'folder_path',
+)
+
+SQL_HEADER = """-- Seed data for jobs table
+-- Generated from 04_Applications folder
+-- Date: {date}
+
+-- Clear existing seed data (optional - comment out if you want to keep existing data)
+-- DELETE FROM jobs WHERE folder_path LIKE '04_Applications/%';
+
+"""
+
+
+def sql_value(value: Any) -> str:
+    """Convert Python value to SQL value."""
+    if value is None:
+        return 'NULL'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, dict):
+        value = json.dumps(value)
+    return f"'{str(value).replace(chr(39), chr(39)+chr(39))}'"
+
+
+def copy_value(value: Any) -> str:
+    """Convert Python value to a COPY text-format field."""
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, dict):
+        value = json.dumps(value)
+    return (
+        str(value)
+        .replace('\\', '\\\\')
+        .replace('\t', '\\t')
+        .replace('\n', '\\n')
+        .replace('\r', '\\r')
+    )
+
+
+def job_row(job: Dict[str, Any], order: int) -> List[Any]:
+    """Values of a job in JOB_COLUMNS order."""
+    return [
+        job['id'],
+        job['created_at'],
+        job['created_at'],
+        job['input_type'],
+        job['input_content'],
+        job.get('original_url'),
+        job.get('company_name'),
+        job.get('position_title'),
+        job.get('location'),
+        job.get('salary_range'),
+        job.get('job_type'),
+        job.get('job_description_text'),
+        job.get('match_percentage'),
+        job.get('match_analysis'),
+        job['status'],
+        order,
+        job.get('folder_path'),
+    ]
+
+
+def render_values_batch(rows: List[List[Any]]) -> str:
+    """Render one multi-row INSERT ... VALUES statement."""
+    columns = ',\n'.join(f"  {column}" for column in JOB_COLUMNS)
+    values = ',\n'.join(
+        '  (' + ', '.join(sql_value(value) for value in row) + ')'
+        for row in rows
+    )
+    return f"\nINSERT INTO jobs (\n{columns}\n) VALUES\n{values};\n"
+
+
+def _open_temp(target: Path) -> Tuple[IO[str], str]:
+    """Open a temporary text file in the target's directory."""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix=f".{target.name}.", suffix='.tmp', dir=target.parent)
+    return os.fdopen(fd, 'w', encoding='utf-8'), temp_path
+
+
+class _AtomicWriter:
+    """Base class: write to a temp file, rename over the target on success."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.count = 0
+        self._file, self._temp_path = _open_temp(self.path)
+
+    def _finish(self) -> None:
+        """Hook for subclasses to write trailing content before the rename."""
+
+    def close(self) -> None:
+        self._finish()
+        self._file.close()
+        # mkstemp creates files as 0600; keep the target's mode (or the usual 0644)
+        mode = self.path.stat().st_mode & 0o777 if self.path.exists() else 0o644
+        os.chmod(self._temp_path, mode)
+        os.replace(self._temp_path, self.path)
+
+    def abort(self) -> None:
+        self._file.close()
+        os.unlink(self._temp_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class SqlSeedWriter(_AtomicWriter):
+    """Writes 003_seed_jobs.sql one job at a time in the chosen SQL format."""
+
+    def __init__(self, path: Path, render_insert: Callable[[Dict[str, Any], int], str],
+                 sql_format: str = 'insert', batch_size: int = DEFAULT_BATCH_SIZE):
+        if sql_format not in SQL_FORMATS:
+            raise ValueError(f"Unknown SQL format: {sql_format}")
+        super().__init__(path)
+        self._render_insert = render_insert
+        self._format = sql_format
+        self._batch_size = max(1, batch_size)
+        self._batch: List[List[Any]] = []
+        self._file.write(SQL_HEADER.format(date=datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
+
+    def write(self, job: Dict[str, Any]) -> None:
+        if self._format == 'insert':
+            self._file.write(self._render_insert(job, self.count))
+        elif self._format == 'values':
+            self._batch.append(job_row(job, self.count))
+            if len(self._batch) >= self._batch_size:
+                self._flush_batch()
+        else:
+            if self.count == 0:
+                self._file.write(f"\nCOPY jobs ({', '.join(JOB_COLUMNS)}) FROM STDIN;\n")
+            self._file.write('\t'.join(copy_value(value) for value in job_row(job, self.count)) + '\n')
+        self.count += 1
+
+    def _flush_batch(self) -> None:
+        if self._batch:
+            self._file.write(render_values_batch(self._batch))
+            self._batch = []
+
+    def _finish(self) -> None:
+        if self._format == 'values':
+            self._flush_batch()
+        elif self._format == 'copy' and self.count:
+            self._file.write('\\.\n')
+
+
+class JsonSeedWriter(_AtomicWriter):
+    """
+    Writes seed-data.json one job at a time.
+
+    The output is identical to json.dump(..., indent=2) of
+    {'generated_at', 'total_jobs', 'jobs'}. Since total_jobs precedes the
+    array, jobs are streamed to a temp body file first and copied behind the
+    header on close.
+    """
+
+    def __init__(self, path: Path):
+        super().__init__(path)
+        self._generated_at = datetime.now().isoformat()
+        self._body: IO[str] = tempfile.TemporaryFile('w+', encoding='utf-8')
+
+    def write(self, job: Dict[str, Any]) -> None:
+        element = json.dumps(job, indent=2, ensure_ascii=False).replace('\n', '\n    ')
+        self._body.write((',\n    ' if self.count else '\n    ') + element)
+        self.count += 1
+
+    def _finish(self) -> None:
+        self._file.write('{\n')
+        self._file.write(f'  "generated_at": {json.dumps(self._generated_at)},\n')
+        self._file.write(f'  "total_jobs": {self.count},\n')
+        self._file.write('  "jobs": [')
+        self._body.seek(0)
+        shutil.copyfileobj(self._body, self._file)
+        self._body.close()
+        self._file.write('\n  ]\n}' if self.count else ']\n}')
+
+    def abort(self) -> None:
+        self._body.close()
+        super().abort()
+
+
+class SeedStats:
+    """Running summary statistics over the written jobs."""
+
+    def __init__(self):
+        self.total = 0
+        self.with_location = 0
+        self.with_salary = 0
+        self.match_count = 0
+        self.match_sum = 0
+        self.match_best: Optional[int] = None
+        self.match_lowest: Optional[int] = None
+
+    def add(self, job: Dict[str, Any]) -> None:
+        self.total += 1
+        if job.get('location'):
+            self.with_location += 1
+        if job.get('salary_range'):
+            self.with_salary += 1
+
+        match = job.get('match_percentage')
+        if match:
+            self.match_count += 1
+            self.match_sum += match
+            self.match_best = match if self.match_best is None else max(self.match_best, match)
+            self.match_lowest = match if self.match_lowest is None else min(self.match_lowest, match)
+
+    @property
+    def match_average(self) -> Optional[float]:
+        return self.match_sum / self.match_count if self.match_count else None
@@ -0,0 +1,478 @@
+#!/usr/bin/env python3
+"""
+Streaming, idempotent column rewrites of seed SQL files.
+
+Rewrites the INSERT and COPY statements for one table in a seed file such as
+003_seed_jobs.sql, in any of generate-seed-data.py's --sql-format layouts:
+
+- set:    give a column the same value in every row, adding it when missing
+          (e.g. created_by, which the jobs RLS policies require)
+- rename: rename a column (e.g. original_url -> job_source after migration 026)
+- drop:   remove a column and its values
+
+The file is read line by line and split into statements by a scanner that
+understands quoted strings, comments and COPY data blocks. Only one
+statement is in memory at a time. Rows that already have the right value
+are written back byte for byte, so a second run changes nothing. If nothing
+changed, an in-place rewrite leaves the file alone. Otherwise the output
+goes to a temp file next to the target and is renamed over it.
+
+Usage:
+    python3 seed_sql_rewrite.py app/supabase/migrations/003_seed_jobs.sql \\
+        --set created_by=31169b06-bbd0-46e5-985a-7d4506f26b15
+    python3 seed_sql_rewrite.py seed.sql --rename original_url=job_source --output seed-026.sql
+    python3 seed_sql_rewrite.py seed.sql --set created_by=... --check   # Exit 1 if it would change
+"""
+
+import argparse
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, IO, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from seed_output import copy_value, sql_value
+
+
+DEFAULT_TABLE = 'jobs'
+
+# Starts of quoted strings, comments and statement ends outside them
+_STATEMENT_TOKEN_RE = re.compile(r"'|\"|--|/\*|;")
+# List structure inside a statement; whole strings and comments are matched
+# (and skipped) by the regex engine, bare openers mean they never end
+_LIST_TOKEN_RE = re.compile(r"[(),]|'[^']*'|\"[^\"]*\"|--[^\n]*|/\*.*?\*/|'|\"|/\*", re.DOTALL)
+_QUOTE_ENDS = {"'": "'", '"': '"', '/*': '*/'}
+
+_INSERT_RE = re.compile(r'INSERT\s+INTO\s+("[^"]+"|[\w.]+)\s*(?=\()', re.IGNORECASE)
+_COPY_RE = re.compile(r'COPY\s+("[^"]+"|[\w.]+)\s*(?=\()', re.IGNORECASE)
+_COPY_FROM_STDIN_RE = re.compile(r'\)\s*FROM\s+STDIN\b', re.IGNORECASE)
+_VALUES_RE = re.compile(r'\s*VALUES\s*', re.IGNORECASE)
+_ROW_SEPARATOR_RE = re.compile(r'\s*,\s*')
+_LEADING_SPACE_RE = re.compile(r'\s*')
+# Quoted strings (skipped whole) or the start of a '--' comment
+_ITEM_COMMENT_RE = re.compile(r"'(?:[^']|'')*'|\"[^\"]*\"|--")
+
+
+class SqlPiece(NamedTuple):
+    """A statement (with the whitespace and comments before it) or a COPY data line."""
+    kind: str          # 'statement', 'copy_row' or 'copy_end'
+    prefix: str        # Whitespace and comments before a statement
+    text: str          # Statement without its ';', or a data line without its newline
+    terminator: str    # ';' (plus the rest of the line for COPY), '' at end of file, or the line ending
+
+
+class Transform(NamedTuple):
+    action: str                    # 'set', 'rename' or 'drop'
+    column: str
+    value: Any = None              # set: Python value, rendered per format; rename: new name
+
+
+class RewriteStats:
+    def __init__(self):
+        self.statements = 0
+        self.rows = 0
+        self.rows_changed = 0
+        self.columns_changed = 0  # Statements whose column list was rewritten
+        self.skipped = 0  # INSERT ... SELECT etc., whose rows can't be rewritten
+        self.bytes = 0
+        self.seconds = 0.0
+
+    @property
+    def changed(self) -> bool:
+        return self.rows_changed > 0 or self.columns_changed > 0
+
+
+def _skip_quoted(text: str, pos: int, opener: str) -> int:
+    """Position after the string or comment opened by `opener` just before `pos` (-1 if it runs on)."""
+    if opener == '--':
+        end = text.find('\n', pos)
+        return len(text) if end == -1 else end + 1
+    closer = _QUOTE_ENDS[opener]
+    end = text.find(closer, pos)
+    return -1 if end == -1 else end + len(closer)
+
+
+def _split_prefix(text: str) -> Tuple[str, str]:
+    """(leading whitespace and comments, the rest)."""
+    pos = 0
+    while True:
+        pos = _LEADING_SPACE_RE.match(text, pos).end()
+        if text.startswith('--', pos) or text.startswith('/*', pos):
+            end = _skip_quoted(text, pos + 2, text[pos:pos + 2])
+            pos = len(text) if end == -1 else end
+        else:
+            return text[:pos], text[pos:]
+
+
+def iter_sql_pieces(lines: Iterable[str]) -> Iterator[SqlPiece]:
+    """Split SQL text (an iterable of lines) into statements and COPY data lines."""
+    pending: List[str] = []  # Lines (or parts) of the statement being read
+    quote: Optional[str] = None  # Opener of the string/comment spanning lines
+    copy_data = False
+
+    for line in lines:
+        if copy_data:
+            data = line.rstrip('\r\n')
+            ending = line[len(data):]
+            if data == '\\.':
+                copy_data = False
+                yield SqlPiece('copy_end', '', data, ending)
+            else:
+                yield SqlPiece('copy_row', '', data, ending)
+            continue
+
+        start = pos = 0
+        while pos < len(line):
+            if quote is not None:
+                end = line.find(_QUOTE_ENDS[quote], pos)
+                if end == -1:
+                    pos = len(line)
+                    break
+                pos = end + len(_QUOTE_ENDS[quote])
+                quote = None
+                continue
+
+            match = _STATEMENT_TOKEN_RE.search(line, pos)
+            if not match:
+                break
+            token = match.group()
+            if token == '--':
+                break  # Rest of the line is a comment
+            if token != ';':
+                quote = token
+                pos = match.end()
+                continue
+
+            prefix, statement = _split_prefix(''.join(pending) + line[start:match.start()])
+            pending = []
+            if _COPY_RE.match(statement) and _COPY_FROM_STDIN_RE.search(statement):
+                # Data lines follow the rest of this line
+                copy_data = True
+                yield SqlPiece('statement', prefix, statement, line[match.start():])
+                start = pos = len(line)
+                break
+            yield SqlPiece('statement', prefix, statement, ';')
+            start = pos = match.end()
+
+        if start < len(line):
+            pending.append(line[start:])
+
+    if pending:
+        prefix, statement = _split_prefix(''.join(pending))
+        yield SqlPiece('statement', prefix, statement, '')
+
+
+class _ParenList:
+    """
+    A parenthesized, comma-separated list, split without touching its
+    formatting: render() returns the original text until items change.
+    """
+
+    def __init__(self, items: List[str], tail: str):
+        self.items = items  # Raw items, each with its leading whitespace
+        self.tail = tail    # Whitespace (and comments) before ')'
+
+    @classmethod
+    def parse(cls, text: str, start: int) -> Tuple['_ParenList', int]:
+        """Parse the list whose '(' is at `start`. Returns (list, position after ')')."""
+        items = []
+        depth = 0
+        item_start = start + 1
+        for match in _LIST_TOKEN_RE.finditer(text, start):
+            token = match.group()
+            if token == ',':
+                if depth == 1:
+                    items.append(text[item_start:match.start()])
+                    item_start = match.end()
+            elif token == '(':
+                depth += 1
+            elif token == ')':
+                depth -= 1
+                if depth == 0:
+                    pos = match.end()
+                    break
+            elif token in ("'", '"', '/*'):
+                raise ValueError(f"Unterminated string or comment in: {text[start:start + 80]!r}")
+        else:
+            raise ValueError(f"Unbalanced parentheses in: {text[start:start + 80]!r}")
+
+        last = text[item_start:pos - 1]
+        value = last.rstrip()
+        # Keep a trailing comment on the last item with its value
+        if value or items:
+            items.append(value)
+            tail = last[len(value):]
+        else:
+            tail = last
+        return cls(items, tail), pos
+
+    def _lead(self) -> str:
+        last = self.items[-1] if self.items else ''
+        return last[:len(last) - len(last.lstrip())] or ' '
+
+    def append(self, value: str) -> None:
+        self.items.append(self._lead() + value)
+
+    def replace(self, index: int, value: str) -> None:
+        item = self.items[index]
+        self.items[index] = item[:len(item) - len(item.lstrip())] + value
+
+    def remove(self, index: int) -> None:
+        del self.items[index]
+
+    def render(self) -> str:
+        return '(' + ','.join(self.items) + self.tail + ')'
+
+
+def _sql_item_value(item: str) -> str:
+    """An item's SQL without surrounding whitespace or a trailing '--' comment."""
+    _, rest = _split_prefix(item)
+    for match in _ITEM_COMMENT_RE.finditer(rest):
+        if match.group() == '--':
+            return rest[:match.start()].strip()
+    return rest.strip()
+
+
+def _column_name(item: str) -> str:
+    return _sql_item_value(item).strip('"').lower()
+
+
+def _table_matches(name: str, table: str) -> bool:
+    return name.strip('"').split('.')[-1].lower() == table.lower()
+
+
+class SeedSqlRewriter:
+    """Applies column transforms to the INSERT and COPY statements of one table."""
+
+    def __init__(self, transforms: Sequence[Transform], table: str = DEFAULT_TABLE):
+        self.transforms = list(transforms)
+        self.table = table
+        self.stats = RewriteStats()
+        # Row edits of the open COPY block and whether its column list changed
+        self._copy_plan: Optional[Tuple[List[Tuple[str, int, Any]], bool]] = None
+        # Column list text -> (new column list, row edits, whether the list changed); seeds repeat one list
+        self._plans: Dict[str, Tuple[str, List[Tuple[str, int, Any]], bool]] = {}
+
+    def _plan(self, columns: _ParenList) -> Tuple[List[Tuple[str, int, Any]], bool]:
+        """
+        Apply the transforms to a column list and return the row edits
+        ('set', index, value) / ('append', -1, value) / ('drop', index, None)
+        plus whether the column list itself changed.
+        """
+        edits = []
+        changed = False
+        for action, column, value in self.transforms:
+            names = [_column_name(item) for item in columns.items]
+            column = column.lower()
+            if action == 'set':
+                if column in names:
+                    edits.append(('set', names.index(column), value))
+                else:
+                    columns.append(column)
+                    edits.append(('append', -1, value))
+                    changed = True
+            elif action == 'rename':
+                if column in names and value.lower() not in names:
+                    columns.replace(names.index(column), value)
+                    changed = True
+            elif action == 'drop':
+                if column in names:
+                    index = names.index(column)
+                    columns.remove(index)
+                    edits.append(('drop', index, None))
+                    changed = True
+        return edits, changed
+
+    def _edit_row(self, row: _ParenList, edits: List[Tuple[str, int, Any]]) -> bool:
+        changed = False
+        for action, index, value in edits:
+            if action == 'set':
+                literal = sql_value(value)
+                if _sql_item_value(row.items[index]) != literal:
+                    row.replace(index, literal)
+                    changed = True
+            elif action == 'append':
+                row.append(sql_value(value))
+                changed = True
+            else:
+                row.remove(index)
+                changed = True
+        return changed
+
+    def rewrite_statement(self, statement: str) -> str:
+        """The statement with the transforms applied (unchanged if it isn't for the table)."""
+        insert = _INSERT_RE.match(statement)
+        copy = None if insert else _COPY_RE.match(statement)
+        match = insert or copy
+        if not match or not _table_matches(match.group(1), self.table):
+            return statement
+        self.stats.statements += 1
+
+        columns, pos = _ParenList.parse(statement, match.end())
+        values = None if copy else _VALUES_RE.match(statement, pos)
+        if insert and not values:
+            self.stats.skipped += 1
+            return statement
+
+        original = statement[match.end():pos]
+        plan = self._plans.get(original)
+        if plan is None:
+            edits, columns_changed = self._plan(columns)
+            plan = self._plans[original] = (columns.render(), edits, columns_changed)
+        rendered_columns, edits, columns_changed = plan
+        head = statement[:match.end()] + rendered_columns
+        if columns_changed:
+            self.stats.columns_changed += 1
+
+        if copy:
+            self._copy_plan = (edits, columns_changed)
+            return head + statement[pos:]
+
+        parts = [head, statement[pos:values.end()]]
+        pos = values.end()
+        while pos < len(statement) and statement[pos] == '(':
+            row, pos = _ParenList.parse(statement, pos)
+            self.stats.rows += 1
+            if self._edit_row(row, edits) or columns_changed:
+                self.stats.rows_changed += 1
+            parts.append(row.render())
+            separator = _ROW_SEPARATOR_RE.match(statement, pos)
+            if not separator or separator.end() >= len(statement) or statement[separator.end()] != '(':
+                break
+            parts.append(statement[pos:separator.end()])
+            pos = separator.end()
+        parts.append(statement[pos:])  # ON CONFLICT, RETURNING, ...
+        return ''.join(parts)
+
+    def rewrite_copy_row(self, line: str) -> str:
+        if self._copy_plan is None:
+            return line
+        edits, changed = self._copy_plan
+        self.stats.rows += 1
+        if not edits:
+            if changed:
+                self.stats.rows_changed += 1
+            return line
+        fields = line.split('\t')
+        for action, index, value in edits:
+            if action == 'set':
+                if fields[index] != copy_value(value):
+                    fields[index] = copy_value(value)
+                    changed = True
+            elif action == 'append':
+                fields.append(copy_value(value))
+                changed = True
+            else:
+                del fields[index]
+                changed = True
+        if changed:
+            self.stats.rows_changed += 1
+        return '\t'.join(fields)
+
+    def rewrite(self, lines: Iterable[str], out: IO[str]) -> RewriteStats:
+        """Stream `lines` to `out` with the transforms applied."""
+        started = time.perf_counter()
+        for piece in iter_sql_pieces(lines):
+            if piece.kind == 'statement':
+                text = piece.prefix + self.rewrite_statement(piece.text) + piece.terminator
+            elif piece.kind == 'copy_row':
+                text = self.rewrite_copy_row(piece.text) + piece.terminator
+            else:
+                self._copy_plan = None
+                text = piece.text + piece.terminator
+            out.write(text)
+            self.stats.bytes += len(text)
+        self.stats.seconds = time.perf_counter() - started
+        return self.stats
+
+
+def rewrite_file(source: Path, transforms: Sequence[Transform], output: Optional[Path] = None,
+                 table: str = DEFAULT_TABLE, check: bool = False) -> RewriteStats:
+    """
+    Rewrite `source` into `output` (default: in place) through a temp file and
+    an atomic rename. An in-place rewrite that changes nothing, or any run
+    with `check`, leaves the files untouched.
+    """
+    source = Path(source)
+    target = Path(output) if output else source
+    rewriter = SeedSqlRewriter(transforms, table)
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix=f".{target.name}.", suffix='.tmp', dir=target.parent)
+    try:
+        with open(source, 'r', encoding='utf-8', newline='') as src, \
+                os.fdopen(fd, 'w', encoding='utf-8', newline='') as out:
+            stats = rewriter.rewrite(src, out)
+        if check or (target == source and not stats.changed):
+            os.unlink(temp_path)
+            return stats
+        # mkstemp creates files as 0600; keep the source's mode
+        os.chmod(temp_path, source.stat().st_mode & 0o777)
+        os.replace(temp_path, target)
+        return stats
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+
+def parse_assignment(text: str, what: str) -> Tuple[str, str]:
+    column, separator, value = text.partition('=')
+    if not separator or not column.strip():
+        raise argparse.ArgumentTypeError(f"{what} must look like COLUMN=VALUE, got {text!r}")
+    return column.strip(), value
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Apply column transforms to a seed SQL file, streaming')
+    parser.add_argument('file', help='Seed SQL file, e.g. app/supabase/migrations/003_seed_jobs.sql')
+    parser.add_argument('--set', action='append', default=[], metavar='COLUMN=VALUE',
+                        help="Give COLUMN this value in every row, adding it if missing (VALUE 'NULL' for NULL)")
+    parser.add_argument('--rename', action='append', default=[], metavar='OLD=NEW', help='Rename a column')
+    parser.add_argument('--drop', action='append', default=[], metavar='COLUMN', help='Remove a column')
+    parser.add_argument('--table', default=DEFAULT_TABLE, help=f'Table whose statements are rewritten '
+                                                               f'(default: {DEFAULT_TABLE})')
+    parser.add_argument('--output', type=str, default=None, help='Write here instead of rewriting in place')
+    parser.add_argument('--check', action='store_true',
+                        help="Don't write anything; exit 1 if the file would change")
+    args = parser.parse_args()
+
+    transforms = []
+    try:
+        for assignment in args.set:
+            column, value = parse_assignment(assignment, '--set')
+            transforms.append(Transform('set', column, None if value == 'NULL' else value))
+        for assignment in args.rename:
+            column, new_name = parse_assignment(assignment, '--rename')
+            transforms.append(Transform('rename', column, new_name.strip()))
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+    transforms += [Transform('drop', column) for column in args.drop]
+    if not transforms:
+        parser.error('Nothing to do: pass --set, --rename or --drop')
+
+    try:
+        stats = rewrite_file(Path(args.file), transforms, Path(args.output) if args.output else None,
+                             args.table, args.check)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    rate = stats.bytes / 1_000_000 / stats.seconds if stats.seconds else 0
+    print(f"🔧 {stats.statements} {args.table} statements, {stats.rows} rows, "
+          f"{stats.rows_changed} changed ({stats.bytes / 1_000_000:.1f} MB in {stats.seconds:.2f}s, {rate:.0f} MB/s)")
+    if stats.skipped:
+        print(f"⚠️  Left {stats.skipped} {args.table} statements without a VALUES list unchanged")
+    if args.check:
+        print("❌ Would change" if stats.changed else "✅ Already up to date")
+        return 1 if stats.changed else 0
+    if not stats.changed and not args.output:
+        print(f"✅ {args.file} already up to date, left untouched")
+    else:
+        print(f"✅ Wrote {args.output or args.file}")
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
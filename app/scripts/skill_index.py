@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Skill-term index compiled from master_profile.md.
+
+The skills parse_profile() reads from the profile, each expanded into its
+aliases ("Node.js/NodeJS" -> node.js, node, nodejs; "CSS/CSS3" -> css,
+css3; "Bahasa Indonesia (Native)" -> bahasa indonesia), plus a lexicon of
+common skills the profile doesn't list, are compiled into one Aho-Corasick
+automaton. One linear scan of a job description then finds every skill it
+mentions:
+
+- strengths: profile skills the description mentions
+- gaps: lexicon skills the description mentions that aren't in the profile
+
+Matches only count on word boundaries, so "git" doesn't match inside
+"github". The automaton is persisted next to the profile
+(01_Profile/.skill-index.json) together with the profile's hash, and
+rebuilt automatically when the profile changes.
+
+Usage:
+    python3 skill_index.py build                  # Compile and save the index
+    python3 skill_index.py match job-spec.md ...  # Strengths and gaps of files
+    python3 skill_index.py match                  # Most requested gaps across all dumps
+
+    from skill_index import SkillIndex
+    index = SkillIndex.load_or_build()
+    strengths, gaps = index.match(description)
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import time
+from collections import Counter, deque
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from job_search_dumps import DUMP_GLOB, TRACKING_DIR, iter_dump_jobs
+from profile_parser import parse_profile
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+PROFILE_FILE = PROJECT_ROOT / "01_Profile" / "master_profile.md"
+INDEX_FILE = PROFILE_FILE.with_name('.skill-index.json')
+INDEX_VERSION = 1
+
+# Frequently requested skills, with aliases, that count as gaps when the profile lacks them
+LEXICON: Dict[str, Tuple[str, ...]] = {
+    'Angular': ('angular', 'angularjs'),
+    'Svelte': ('svelte', 'sveltekit'),
+    'Nuxt': ('nuxt', 'nuxt.js', 'nuxtjs'),
+    'Remix': ('remix.run',),
+    'Gatsby': ('gatsby', 'gatsbyjs'),
+    'Three.js': ('three.js', 'threejs', 'webgl'),
+    'D3.js': ('d3', 'd3.js'),
+    'Flutter': ('flutter',),
+    'Python': ('python',),
+    'Java': ('java',),
+    'Go': ('golang',),
+    'Rust': ('rust',),
+    'Ruby': ('ruby', 'ruby on rails', 'rails'),
+    'Kotlin': ('kotlin',),
+    'Swift': ('swift', 'swiftui'),
+    'C#/.NET': ('c#', '.net', 'asp.net'),
+    'C++': ('c++',),
+    'Django': ('django',),
+    'Laravel': ('laravel',),
+    'Spring': ('spring boot',),
+    'PostgreSQL': ('postgresql', 'postgres'),
+    'MySQL': ('mysql',),
+    'MongoDB': ('mongodb', 'mongo'),
+    'Redis': ('redis',),
+    'Kafka': ('kafka',),
+    'Docker': ('docker', 'containers'),
+    'Kubernetes': ('kubernetes', 'k8s'),
+    'AWS': ('aws', 'amazon web services'),
+    'Google Cloud': ('gcp', 'google cloud'),
+    'Azure': ('azure',),
+    'Terraform': ('terraform',),
+    'CI/CD': ('ci/cd', 'continuous integration', 'github actions', 'jenkins'),
+    'Microservices': ('microservices',),
+    'Micro-frontends': ('micro-frontends', 'micro frontends', 'microfrontends', 'module federation'),
+    'REST APIs': ('rest api', 'rest apis', 'restful'),
+    'gRPC': ('grpc',),
+    'WebSockets': ('websocket', 'websockets'),
+    'Accessibility': ('accessibility', 'a11y', 'wcag'),
+    'Playwright': ('playwright',),
+    'Vitest': ('vitest',),
+    'Mocha': ('mocha',),
+    'Web3': ('web3', 'blockchain', 'solidity'),
+    'Firebase': ('firebase',),
+    'Design Systems': ('design system', 'design systems'),
+    'Mobile Development': ('ios', 'android'),
+}
+
+_PARENTHESES_RE = re.compile(r'\s*\([^)]*\)')
+_SPACES_RE = re.compile(r'\s+')
+
+
+class SkillMatch(NamedTuple):
+    strengths: List[str]  # Profile skills the text mentions
+    gaps: List[str]       # Lexicon skills the text mentions that the profile lacks
+
+
+def skill_aliases(name: str) -> List[str]:
+    """Lower-case aliases of a profile skill name."""
+    aliases = []
+    for part in _PARENTHESES_RE.sub('', name).split('/'):
+        alias = _SPACES_RE.sub(' ', part).strip().lower()
+        if not alias:
+            continue
+        aliases.append(alias)
+        if alias.endswith('.js'):
+            # React.js is also written React and ReactJS
+            aliases.extend((alias[:-3], alias[:-3] + 'js'))
+    return list(dict.fromkeys(aliases))
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+
+class SkillIndex:
+    """Aho-Corasick automaton over every skill alias."""
+
+    def __init__(self, skills: List[Dict[str, object]], aliases: List[Tuple[str, int]],
+                 goto: List[Dict[str, int]], fail: List[int], output: List[List[int]],
+                 profile_sha256: str = ''):
+        self.skills = skills          # {'name', 'category', 'in_profile'}
+        self.aliases = aliases        # (alias, skill index)
+        self.profile_sha256 = profile_sha256
+        self._goto = goto
+        self._fail = fail
+        self._output = output         # Alias indexes ending at each state, fail chain included
+
+    @classmethod
+    def build(cls, profile_skills: Sequence[Dict[str, object]], profile_sha256: str = '') -> 'SkillIndex':
+        """Compile profile skills ({'skill_name', 'category'}) and the lexicon."""
+        skills: List[Dict[str, object]] = []
+        aliases: List[Tuple[str, int]] = []
+        seen = set()
+
+        def add(name: str, category: Optional[str], in_profile: bool, names: Sequence[str]) -> None:
+            fresh = [alias for alias in names if alias not in seen]
+            if not fresh:
+                return  # Every alias already belongs to a profile skill
+            seen.update(fresh)
+            skills.append({'name': name, 'category': category, 'in_profile': in_profile})
+            aliases.extend((alias, len(skills) - 1) for alias in fresh)
+
+        for skill in profile_skills:
+            add(str(skill['skill_name']), skill.get('category'), True, skill_aliases(str(skill['skill_name'])))
+        for name, names in LEXICON.items():
+            add(name, None, False, names)
+
+        goto: List[Dict[str, int]] = [{}]
+        output: List[List[int]] = [[]]
+        for alias_index, (alias, _) in enumerate(aliases):
+            state = 0
+            for char in alias:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = goto[state][char] = len(goto)
+                    goto.append({})
+                    output.append([])
+                state = next_state
+            output[state].append(alias_index)
+
+        # Breadth-first failure links
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(char, 0)
+                output[next_state] = output[next_state] + output[fail[next_state]]
+
+        return cls(skills, aliases, goto, fail, output, profile_sha256)
+
+    @classmethod
+    def from_profile(cls, path: Path = PROFILE_FILE) -> 'SkillIndex':
+        content = Path(path).read_text(encoding='utf-8')
+        sha256 = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        return cls.build(parse_profile(content)['skills'], sha256)
+
+    def save(self, path: Path = INDEX_FILE) -> None:
+        path = Path(path)
+        temp_path = path.with_suffix('.tmp')
+        temp_path.write_text(json.dumps({
+            'version': INDEX_VERSION,
+            'profile_sha256': self.profile_sha256,
+            'skills': self.skills,
+            'aliases': self.aliases,
+            'goto': self._goto,
+            'fail': self._fail,
+            'output': self._output,
+        }, ensure_ascii=False, separators=(',', ':')), encoding='utf-8')
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: Path = INDEX_FILE) -> Optional['SkillIndex']:
+        """The saved index, or None if it is missing or from another version."""
+        try:
+            data = json.loads(Path(path).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        if data.get('version') != INDEX_VERSION:
+            return None
+        aliases = [(alias, skill) for alias, skill in data['aliases']]
+        return cls(data['skills'], aliases, data['goto'], data['fail'], data['output'], data['profile_sha256'])
+
+    @classmethod
+    def load_or_build(cls, profile_path: Path = PROFILE_FILE, index_path: Path = INDEX_FILE) -> 'SkillIndex':
+        """The saved index if it was built from the current profile, else a freshly built (and saved) one."""
+        sha256 = hashlib.sha256(Path(profile_path).read_text(encoding='utf-8').encode('utf-8')).hexdigest()
+        index = cls.load(index_path)
+        if index is None or index.profile_sha256 != sha256:
+            index = cls.from_profile(profile_path)
+            index.save(index_path)
+        return index
+
+    def find(self, text: str) -> List[int]:
+        """Indexes of the skills mentioned in `text`, in order of first mention (one pass)."""
+        text = text.lower()
+        goto, fail, output, aliases = self._goto, self._fail, self._output, self.aliases
+        found: Dict[int, None] = {}
+        state = 0
+        for end, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for alias_index in output[state]:
+                alias, skill = aliases[alias_index]
+                start = end - len(alias) + 1
+                if (start == 0 or not _is_word_char(text[start - 1])) and \
+                        (end + 1 == len(text) or not _is_word_char(text[end + 1])):
+                    found.setdefault(skill)
+        return list(found)
+
+    def match(self, text: str) -> SkillMatch:
+        """Strengths and gaps of a job description."""
+        strengths, gaps = [], []
+        for skill in self.find(text):
+            (strengths if self.skills[skill]['in_profile'] else gaps).append(self.skills[skill]['name'])
+        return SkillMatch(strengths, gaps)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compile and query the profile skill index')
+    parser.add_argument('--profile', type=str, default=str(PROFILE_FILE),
+                        help='master_profile.md to compile (default: 01_Profile/master_profile.md)')
+    parser.add_argument('--index', type=str, default=None,
+                        help='Where the index is saved (default: .skill-index.json next to the profile)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('build', help='Compile the index from the profile and save it')
+    match_parser = subparsers.add_parser('match', help='Strengths and gaps of job descriptions')
+    match_parser.add_argument('files', nargs='*',
+                              help=f'Text/markdown files (default: every posting in 05_Tracking/{DUMP_GLOB})')
+    match_parser.add_argument('--top', type=int, default=15, help='Skills listed in the dump summary (default: 15)')
+    args = parser.parse_args()
+
+    profile_path = Path(args.profile)
+    index_path = Path(args.index) if args.index else profile_path.with_name(INDEX_FILE.name)
+
+    if args.command == 'build':
+        started = time.perf_counter()
+        index = SkillIndex.from_profile(profile_path)
+        index.save(index_path)
+        in_profile = sum(1 for skill in index.skills if skill['in_profile'])
+        print(f"🧩 Compiled {in_profile} profile skills and {len(index.skills) - in_profile} lexicon skills "
+              f"({len(index.aliases)} aliases) in {(time.perf_counter() - started) * 1000:.1f}ms")
+        print(f"💾 Saved to {index_path}")
+        return
+
+    index = SkillIndex.load_or_build(profile_path, index_path)
+
+    if args.files:
+        for file_path in args.files:
+            strengths, gaps = index.match(Path(file_path).read_text(encoding='utf-8'))
+            print(f"\n📄 {file_path}")
+            print(f"  ✅ Strengths: {', '.join(strengths) or '-'}")
+            print(f"  ❌ Gaps: {', '.join(gaps) or '-'}")
+        return
+
+    dump_files = sorted(TRACKING_DIR.glob(DUMP_GLOB))
+    strength_counts: Counter = Counter()
+    gap_counts: Counter = Counter()
+    postings = 0
+    started = time.perf_counter()
+    for job in iter_dump_jobs(dump_files):
+        strengths, gaps = index.match(job['job_description_text'])
+        strength_counts.update(strengths)
+        gap_counts.update(gaps)
+        postings += 1
+    seconds = time.perf_counter() - started
+
+    print(f"🔍 Matched {postings} postings from {len(dump_files)} dumps in {seconds:.2f}s")
+    for label, counts in (('✅ Most requested skills you have', strength_counts),
+                          ('❌ Most requested skills you lack', gap_counts)):
+        print(f"\n{label}:")
+        for name, count in counts.most_common(args.top):
+            print(f"  {count:>6}  {name}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,169 @@
+"""
+Opt-in stage timing and cProfile support for the scripts' --profile modes.
+
+StageProfiler accumulates wall time and counts per named stage (directory
+listing, file reads, each extractor, SQL rendering, ...) and keeps the
+slowest files seen, then prints one structured summary instead of
+per-item progress lines. Recording a timing is a dict update, so it is cheap
+enough to leave on for a whole run. Timings measured in worker processes
+come back as plain {stage: seconds} dicts and are merged with add_timings().
+
+lap_timer() is what the parsers use for per-extractor timings: it returns
+a no-op when no timings dict is passed, so normal runs pay nothing.
+
+profile_calls() wraps a run in cProfile, dumps the pstats file and prints
+the most expensive functions.
+
+Usage:
+    profiler = StageProfiler()
+    with profiler.stage('scan'):
+        folders = list_folders()
+    for job in profiler.timed('parse', iter_jobs(folders)):
+        ...
+    profiler.print_summary()
+
+    with profile_calls('seed.pstats'):
+        main()
+"""
+
+import cProfile
+import heapq
+import pstats
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+DEFAULT_SLOWEST = 10
+DEFAULT_TOP_FUNCTIONS = 20
+
+
+def _no_lap(name: str) -> None:
+    pass
+
+
+def lap_timer(timings: Optional[Dict[str, float]]) -> Callable[[str], None]:
+    """
+    Callable that adds the time since its previous call (or its creation) to
+    timings[name]. A no-op when `timings` is None.
+    """
+    if timings is None:
+        return _no_lap
+    last = time.perf_counter()
+
+    def lap(name: str) -> None:
+        nonlocal last
+        now = time.perf_counter()
+        timings[name] = timings.get(name, 0.0) + now - last
+        last = now
+
+    return lap
+
+
+class StageProfiler:
+    """Wall time and counts per stage, plus the slowest files (thread-safe)."""
+
+    def __init__(self, slowest: int = DEFAULT_SLOWEST):
+        self.started = time.perf_counter()
+        self._slowest_count = slowest
+        self._stages: Dict[str, List[float]] = {}  # name -> [count, total, max]
+        self._slowest: List[Tuple[float, str]] = []  # Min-heap of (seconds, file)
+        self._lock = threading.Lock()
+
+    def add(self, name: str, seconds: float, count: int = 1) -> None:
+        with self._lock:
+            stats = self._stages.get(name)
+            if stats is None:
+                self._stages[name] = [count, seconds, seconds]
+            else:
+                stats[0] += count
+                stats[1] += seconds
+                stats[2] = max(stats[2], seconds)
+
+    def add_timings(self, timings: Dict[str, float], prefix: str = '') -> None:
+        """Merge a {stage: seconds} dict (e.g. from a worker process), one count each."""
+        for name, seconds in timings.items():
+            self.add(prefix + name, seconds)
+
+    def count(self, name: str, count: int = 1) -> None:
+        """Count an event that takes no measurable time of its own (e.g. a cache hit)."""
+        self.add(name, 0.0, count)
+
+    @contextmanager
+    def stage(self, name: str, count: int = 1) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start, count)
+
+    def timed(self, name: str, items: Iterable[Any]) -> Iterator[Any]:
+        """Yield from `items`, timing how long each item takes to produce."""
+        iterator = iter(items)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            self.add(name, time.perf_counter() - start)
+            yield item
+
+    def record_file(self, path: str, seconds: float) -> None:
+        """Remember `path` if it is among the slowest files so far."""
+        with self._lock:
+            if len(self._slowest) < self._slowest_count:
+                heapq.heappush(self._slowest, (seconds, path))
+            elif seconds > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, (seconds, path))
+
+    def summary(self) -> Dict[str, Any]:
+        """Stages sorted by total time, and the slowest files, slowest first."""
+        with self._lock:
+            stages = {
+                name: {'count': int(count), 'total': total, 'average': total / count if count else 0.0, 'max': peak}
+                for name, (count, total, peak) in sorted(self._stages.items(), key=lambda item: -item[1][1])
+            }
+            slowest = [{'file': path, 'seconds': seconds} for seconds, path in sorted(self._slowest, reverse=True)]
+        return {
+            'wall_seconds': time.perf_counter() - self.started,
+            'stages': stages,
+            'slowest_files': slowest,
+        }
+
+    def print_summary(self, title: str = 'Stage timings') -> None:
+        summary = self.summary()
+        stages = summary['stages']
+        print(f"\n⏱️  {title} ({summary['wall_seconds']:.2f}s wall):")
+        if stages:
+            width = max(len(name) for name in stages)
+            print(f"  {'Stage':<{width}}  {'Count':>8}  {'Total':>9}  {'Average':>9}  {'Max':>9}")
+            for name, stats in stages.items():
+                print(f"  {name:<{width}}  {stats['count']:>8}  {stats['total']:>8.3f}s  "
+                      f"{stats['average'] * 1000:>7.3f}ms  {stats['max'] * 1000:>7.2f}ms")
+        if summary['slowest_files']:
+            print(f"\n🐢 Slowest {len(summary['slowest_files'])} files:")
+            for entry in summary['slowest_files']:
+                print(f"  {entry['seconds'] * 1000:>9.2f}ms  {entry['file']}")
+
+
+@contextmanager
+def profile_calls(output: Optional[str], top: int = DEFAULT_TOP_FUNCTIONS) -> Iterator[None]:
+    """
+    Run the block under cProfile when `output` is set: dump the stats to that
+    file (load with pstats or snakeviz) and print the `top` functions by
+    cumulative time. Only the current process is profiled.
+    """
+    if not output:
+        yield
+        return
+    profile = cProfile.Profile()
+    profile.enable()
+    try:
+        yield
+    finally:
+        profile.disable()
+        profile.dump_stats(output)
+        print(f"\n🔬 cProfile stats written to {output} (top {top} by cumulative time):")
+        pstats.Stats(profile).sort_stats('cumulative').print_stats(top)
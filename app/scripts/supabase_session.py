@@ -0,0 +1,133 @@
+"""
+Shared Supabase session for the Python scripts.
+
+`create_client()` builds a new PostgREST HTTP session each time, so every
+import used to pay for a fresh connection (and TLS handshake). get_session()
+returns one SupabaseSession per (url, key) for the whole process. Its
+keep-alive connection pool is reused by every RPC and table call, from any
+thread, and each HTTP request is timed so scripts can show where latency goes.
+
+Usage:
+    from supabase_session import get_session
+
+    session = get_session(SUPABASE_URL, SUPABASE_KEY)
+    response = session.rpc('create_master_profile', params).execute()
+    session.print_timings()
+
+Any URL works, including a local stub HTTP server standing in for PostgREST
+(e.g. http://127.0.0.1:8000, served under /rest/v1/).
+"""
+
+import threading
+import time
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from supabase import Client, create_client
+
+
+class RequestTiming(NamedTuple):
+    """One HTTP request made through a session."""
+    method: str
+    path: str
+    status: int
+    seconds: float
+
+
+class SupabaseSession:
+    """A Supabase client whose HTTP requests are timed."""
+
+    def __init__(self, url: str, key: str, client: Optional[Client] = None):
+        self.url = url
+        self.client = client or create_client(url, key)
+        self.timings: List[RequestTiming] = []
+        self._lock = threading.Lock()
+
+    def _instrument(self) -> None:
+        """Attach timing hooks to the current PostgREST HTTP session."""
+        # supabase-py replaces the PostgREST client on auth events, so check every call
+        http = self.client.postgrest.session
+        if getattr(http, '_timed_by', None) is self:
+            return
+        with self._lock:
+            if getattr(http, '_timed_by', None) is self:
+                return
+            hooks = http.event_hooks
+            hooks['request'] = hooks['request'] + [self._on_request]
+            hooks['response'] = hooks['response'] + [self._on_response]
+            http.event_hooks = hooks
+            http._timed_by = self
+
+    def _on_request(self, request) -> None:
+        request.extensions['timing_start'] = time.perf_counter()
+
+    def _on_response(self, response) -> None:
+        response.read()  # Include the body transfer in the timing
+        request = response.request
+        seconds = time.perf_counter() - request.extensions.get('timing_start', time.perf_counter())
+        with self._lock:
+            self.timings.append(RequestTiming(request.method, request.url.path, response.status_code, seconds))
+
+    @property
+    def http(self):
+        """The timed PostgREST HTTP client (base URL <project>/rest/v1)."""
+        self._instrument()
+        return self.client.postgrest.session
+
+    def rpc(self, fn: str, params: Optional[Dict[str, Any]] = None):
+        """Same as Client.rpc(), timed."""
+        self._instrument()
+        return self.client.rpc(fn, params or {})
+
+    def table(self, table_name: str):
+        """Same as Client.table(), timed."""
+        self._instrument()
+        return self.client.table(table_name)
+
+    def timing_summary(self) -> Dict[str, Dict[str, float]]:
+        """Request count and total/average/max seconds per endpoint path."""
+        summary: Dict[str, Dict[str, float]] = {}
+        with self._lock:
+            timings = list(self.timings)
+        for timing in timings:
+            stats = summary.setdefault(timing.path, {'requests': 0, 'total': 0.0, 'max': 0.0})
+            stats['requests'] += 1
+            stats['total'] += timing.seconds
+            stats['max'] = max(stats['max'], timing.seconds)
+        for stats in summary.values():
+            stats['average'] = stats['total'] / stats['requests']
+        return summary
+
+    def print_timings(self) -> None:
+        summary = self.timing_summary()
+        if not summary:
+            return
+        width = max(len(path) for path in summary)
+        print("\n⏱️  Supabase request timings:")
+        print(f"  {'Endpoint':<{width}}  {'Requests':>8}  {'Total':>8}  {'Average':>8}  {'Max':>8}")
+        for path, stats in sorted(summary.items(), key=lambda item: -item[1]['total']):
+            print(f"  {path:<{width}}  {stats['requests']:>8}  {stats['total']:>7.3f}s  "
+                  f"{stats['average']:>7.3f}s  {stats['max']:>7.3f}s")
+
+    def close(self) -> None:
+        self.client.postgrest.aclose()
+
+
+_sessions: Dict[Tuple[str, str], SupabaseSession] = {}
+_sessions_lock = threading.Lock()
+
+
+def get_session(url: str, key: str) -> SupabaseSession:
+    """Return the process-wide session for a Supabase project, creating it once."""
+    with _sessions_lock:
+        session = _sessions.get((url, key))
+        if session is None:
+            session = _sessions[(url, key)] = SupabaseSession(url, key)
+        return session
+
+
+def close_sessions() -> None:
+    """Close every shared session (their connection pools are otherwise kept alive)."""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
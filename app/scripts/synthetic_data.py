@@ -0,0 +1,183 @@
+"""
+Synthetic job-spec.md corpora and master_profile.md documents for benchmarks.
+
+Generates documents that mix the label styles, headings and match-analysis
+layouts found in 04_Applications (bold and plain labels, "**Label:**"
+variants, missing fields, fallback descriptions), and master profiles in the
+01_Profile layout, so benchmarks exercise the same code paths as real data.
+"""
+
+import random
+from pathlib import Path
+from typing import List
+
+
+COMPANIES = ['Agoda', 'Accenture', 'Buffer', 'College Board', 'LINE MAN Wongnai', 'Grab', 'Shopee', 'Binance']
+POSITIONS = ['Senior Frontend Engineer', 'Staff Software Engineer', 'Full Stack Developer', 'Product Engineer']
+LOCATIONS = ['Bangkok, Thailand', 'Remote (US)', 'Singapore', 'Jakarta, Indonesia']
+SALARIES = ['THB 80k-120k/month', '$120,000 - $150,000', 'Competitive', 'SGD 8,000 - 11,000 per month']
+JOB_TYPES = ['Full-time', 'Contract', 'Full-time, Remote', 'Hybrid']
+SKILLS = ['React', 'TypeScript', 'Vue.js', 'Node.js', 'GraphQL', 'CSS3', 'Go', 'Kubernetes', 'Web3', 'Testing']
+MONTHS = ['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August',
+          'September', 'October', 'November', 'December']
+SKILL_CATEGORIES = ['Frontend Frameworks & Libraries', 'Programming Languages', 'Styling & CSS',
+                    'Backend & APIs', 'Build Tools & DevOps', 'Testing & Documentation']
+SCHOOLS = ['Institut Teknologi Bandung', 'SMK Negeri 7 Bandung (High School)', 'Universitas Padjadjaran']
+FILLER = (
+    'We build products used by millions of travellers. You will work closely with designers, '
+    'product managers and backend engineers to ship fast, accessible interfaces. '
+)
+
+
+def _label(rng: random.Random, name: str, value: str) -> str:
+    style = rng.randrange(4)
+    if style == 0:
+        return f"**{name}**: {value}"
+    if style == 1:
+        return f"**{name}:** {value}"
+    if style == 2:
+        return f"- **{name}**:\n  {value}"
+    return f"{name}: {value}"
+
+
+def generate_job_spec(rng: random.Random, index: int) -> str:
+    """Generate one synthetic job-spec.md document."""
+    company = rng.choice(COMPANIES)
+    position = rng.choice(POSITIONS)
+    score = rng.randint(40, 98)
+
+    lines = []
+    heading = f"# {position} - {company}"
+    if rng.random() < 0.5:
+        heading += f" **Match Score: {score}%**"
+    lines.append(heading)
+    lines.append('')
+
+    if rng.random() < 0.5:
+        lines.append(f"**Match Percentage: {score}%**" if rng.random() < 0.5 else f"Overall match: {score}%")
+
+    lines.append('## Company Information')
+    fields = [
+        ('Company', company),
+        (rng.choice(['Title', 'Position']), position),
+        ('Location', rng.choice(LOCATIONS)),
+        (rng.choice(['Salary Range', 'Compensation']), rng.choice(SALARIES)),
+        (rng.choice(['Type', 'Employment Type']), rng.choice(JOB_TYPES)),
+        (rng.choice(['Source URL', 'Job URL']), f"https://careers.example.com/jobs/{index}"),
+    ]
+    for name, value in fields:
+        if rng.random() < 0.85:
+            lines.append(_label(rng, name, value))
+    lines.append('')
+
+    description_heading = rng.choice(['## Job Description', '## Role Overview', '## About the Role', None])
+    if description_heading:
+        lines.append(description_heading)
+    for _ in range(rng.randint(2, 12)):
+        lines.append(FILLER * rng.randint(1, 3))
+        lines.append(f"- Experience with {rng.choice(SKILLS)} and {rng.choice(SKILLS)}")
+    if rng.random() < 0.3:
+        lines.append(f"Apply here ([link](https://jobs.example.com/{company.lower()}/{index}))")
+    lines.append('')
+
+    lines.append('## Match Analysis')
+    skills = rng.sample(SKILLS, 6)
+    lines.append(rng.choice(['### Strong Matches', '### Strengths', '### Strength']))
+    for skill in skills[:3]:
+        lines.append(f"- ✅ **{skill}**: shipped in production" if rng.random() < 0.7 else f"- ✅ {skill} experience")
+    lines.append('### Partial Matches')
+    lines.append(f"- ⚠️ **{skills[3]}**: some exposure")
+    lines.append('### Gaps')
+    for skill in skills[4:]:
+        lines.append(f"- ❌ **{skill}**")
+    lines.append('')
+
+    return '\n'.join(lines)
+
+
+def generate_corpus(count: int, seed: int = 42) -> List[str]:
+    """Generate `count` job-spec.md documents deterministically."""
+    rng = random.Random(seed)
+    return [generate_job_spec(rng, index) for index in range(count)]
+
+
+def write_applications_tree(root: Path, count: int, seed: int = 42) -> List[Path]:
+    """
+    Write an 04_Applications-style tree of `count` folders under `root`.
+
+    Folder names follow the CompanyName_PositionTitle_YYYY-MM-DD layout.
+    Returns the created folders.
+    """
+    rng = random.Random(seed)
+    root.mkdir(parents=True, exist_ok=True)
+    folders = []
+    for index in range(count):
+        company = rng.choice(COMPANIES).replace(' ', '')
+        position = rng.choice(POSITIONS).replace(' ', '')
+        date = f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+        folder = root / f"{company}_{position}{index}_{date}"
+        folder.mkdir(exist_ok=True)
+        (folder / 'job-spec.md').write_text(generate_job_spec(rng, index), encoding='utf-8')
+        folders.append(folder)
+    return folders
+
+
+def generate_master_profile(rng: random.Random, experiences: int) -> str:
+    """
+    Generate one master_profile.md document with `experiences` work entries.
+
+    Skill categories, education and certification entries grow with it, so
+    document size is proportional to `experiences`.
+    """
+    lines = [
+        '# Alex Example - Master Profile',
+        '',
+        '## Contact Information',
+        '- **Email**: alex@example.com',
+        '- **Phone**: ',
+        '  - Whatsapp: +62 81300000000',
+        '  - Phone: +66 0800000000',
+        '- **LinkedIn**: [linkedin.com/in/alex](https://www.linkedin.com/in/alex)',
+        f"- **Location**: {rng.choice(LOCATIONS)}",
+        '',
+        '## Professional Summary',
+        FILLER.strip(),
+        '',
+        '## Key Achievements',
+        '- **27% increase in user traffic** through a web application revamp',
+        '',
+        '## Technical Skills',
+        '',
+    ]
+    for index in range(max(1, experiences // 2)):
+        lines.append(f"### {rng.choice(SKILL_CATEGORIES)} {index}")
+        for _ in range(rng.randint(0, 8)):
+            lines.append(f"- {rng.choice(SKILLS)}")
+        lines.append('')
+
+    lines += ['## Professional Experience', '']
+    for index in range(experiences):
+        start_year = rng.randint(2005, 2023)
+        end = 'Present' if rng.random() < 0.1 else f"{rng.choice(MONTHS)} {start_year + rng.randint(0, 2)}"
+        lines.append(f"### {rng.choice(COMPANIES)} {index} | {rng.choice(POSITIONS)}")
+        lines.append(f"**{rng.choice(MONTHS)} {start_year} - {end}** | {rng.choice(LOCATIONS + [' '])}")
+        for _ in range(rng.randint(1, 6)):
+            lines.append(f"- {FILLER[:rng.randint(20, len(FILLER))].strip()}")
+        if rng.random() < 0.2:
+            lines.append('  - Nested detail that is not part of the description')
+        lines.append('')
+
+    lines.append('## Education')
+    for index in range(max(1, experiences // 10)):
+        start_year = rng.randint(2000, 2015)
+        school = rng.choice(SCHOOLS)
+        if rng.random() < 0.5:
+            school = f"**{school}**"
+        lines.append(f"- {school} - Computer Science {index} ({start_year}-{start_year + 4})")
+    lines.append('')
+
+    lines.append('## Certifications')
+    for index in range(max(1, experiences // 5)):
+        lines.append(f"- Certificate of completion - {rng.choice(SKILLS)} {index}")
+
+    return '\n'.join(lines)
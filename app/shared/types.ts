@@ -61,6 +61,12 @@ export interface Job {
   salary_range?: string;
   job_type?: string;
 
+  // Normalized salary (Migration 028, parsed from salary_range)
+  salary_min?: number;
+  salary_max?: number;
+  salary_currency?: string;
+  salary_period?: 'hour' | 'day' | 'week' | 'month' | 'year';
+
   // Job description
   job_description_html?: string;
   job_description_text?: string;
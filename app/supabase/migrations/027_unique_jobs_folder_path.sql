@@ -0,0 +1,21 @@
+-- Migration 027: Unique application folder per owner
+-- Created: 2026-10-18
+-- Purpose: Let the Python seed loader upsert jobs on folder_path
+-- Related: app/scripts/seed_loader.py (generate-seed-data.py load)
+
+BEGIN;
+
+-- One job per 04_Applications folder and owner.
+-- NULL folder_path (jobs added from the UI) stays unrestricted.
+-- If this fails, find the duplicates with:
+--   SELECT created_by, folder_path, count(*) FROM jobs
+--   WHERE folder_path IS NOT NULL GROUP BY 1, 2 HAVING count(*) > 1;
+CREATE UNIQUE INDEX IF NOT EXISTS idx_jobs_created_by_folder_path
+  ON jobs(created_by, folder_path);
+
+COMMIT;
+
+-- Rollback script (if needed):
+-- BEGIN;
+-- DROP INDEX IF EXISTS idx_jobs_created_by_folder_path;
+-- COMMIT;
@@ -0,0 +1,63 @@
+-- Migration 028: Normalized salary columns
+-- Created: 2026-10-18
+-- Purpose: Numeric salary ranges parsed from the free-text salary_range, so pay filters use indexes
+-- Related: app/scripts/salary_normalization.py (filled by generate-seed-data.py load and watch)
+
+BEGIN;
+
+-- Step 1: Add the normalized columns (salary_range keeps the original text)
+ALTER TABLE jobs
+  ADD COLUMN IF NOT EXISTS salary_min DECIMAL(14, 2),
+  ADD COLUMN IF NOT EXISTS salary_max DECIMAL(14, 2),
+  ADD COLUMN IF NOT EXISTS salary_currency TEXT,
+  ADD COLUMN IF NOT EXISTS salary_period TEXT;
+
+-- Step 2: Add constraints
+ALTER TABLE jobs
+  ADD CONSTRAINT check_salary_bounds
+    CHECK (
+      (salary_min IS NULL OR salary_min >= 0)
+      AND (salary_max IS NULL OR salary_max >= 0)
+      AND (salary_min IS NULL OR salary_max IS NULL OR salary_min <= salary_max)
+    );
+
+ALTER TABLE jobs
+  ADD CONSTRAINT check_salary_period
+    CHECK (salary_period IS NULL OR salary_period IN ('hour', 'day', 'week', 'month', 'year'));
+
+-- Step 3: Add indexes for range queries such as
+--   WHERE salary_currency = 'THB' AND salary_period = 'month' AND salary_max >= 100000
+-- Only jobs with a parsed salary are indexed
+CREATE INDEX IF NOT EXISTS idx_jobs_salary_min
+  ON jobs(salary_currency, salary_period, salary_min)
+  WHERE salary_min IS NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_jobs_salary_max
+  ON jobs(salary_currency, salary_period, salary_max)
+  WHERE salary_max IS NOT NULL;
+
+-- Step 4: Add comments for documentation
+COMMENT ON COLUMN jobs.salary_min IS 'Lower bound parsed from salary_range (NULL for "up to" ranges or unparsed text)';
+COMMENT ON COLUMN jobs.salary_max IS 'Upper bound parsed from salary_range (NULL for open-ended "X+" ranges or unparsed text)';
+COMMENT ON COLUMN jobs.salary_currency IS 'ISO 4217 currency code named in salary_range, e.g. THB, USD';
+COMMENT ON COLUMN jobs.salary_period IS 'Pay period named in salary_range: hour, day, week, month or year';
+
+-- Step 5: Backfill existing rows
+-- salary_range is parsed in Python (app/scripts/salary_normalization.py), so jobs
+-- already in the table are filled after this migration with:
+--   python3 app/scripts/generate-seed-data.py backfill-salaries
+
+COMMIT;
+
+-- Rollback script (if needed):
+-- BEGIN;
+-- DROP INDEX IF EXISTS idx_jobs_salary_max;
+-- DROP INDEX IF EXISTS idx_jobs_salary_min;
+-- ALTER TABLE jobs
+--   DROP CONSTRAINT IF EXISTS check_salary_period,
+--   DROP CONSTRAINT IF EXISTS check_salary_bounds,
+--   DROP COLUMN IF EXISTS salary_period,
+--   DROP COLUMN IF EXISTS salary_currency,
+--   DROP COLUMN IF EXISTS salary_max,
+--   DROP COLUMN IF EXISTS salary_min;
+-- COMMIT;
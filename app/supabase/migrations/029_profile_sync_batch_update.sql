@@ -0,0 +1,272 @@
+-- Migration 029: Diff-based profile sync through the batch update RPC
+-- Created: 2026-10-18
+-- Purpose: Let update_master_profile_with_details also upsert education and certifications
+--          and delete removed child rows, so a re-synced master_profile.md only sends what changed
+-- Related: app/scripts/profile_sync.py (migrate_to_db.py --sync), 022_add_batch_update_profile.sql
+
+BEGIN;
+
+-- Step 1: Drop the 022 signature (adding parameters would otherwise create an overload)
+DROP FUNCTION IF EXISTS update_master_profile_with_details(UUID, INTEGER, JSONB, JSONB, JSONB);
+
+-- Step 2: Recreate it with education, certifications and deletions
+-- p_deleted lists the ids to remove per section:
+--   {"experiences": [uuid, ...], "skills": [...], "education": [...], "certifications": [...]}
+-- Existing callers (p_profile_id ... p_skills) are unaffected, the new parameters default to empty
+CREATE OR REPLACE FUNCTION update_master_profile_with_details(
+  p_profile_id UUID,
+  p_expected_version INTEGER,
+  p_profile_updates JSONB,
+  p_experiences JSONB DEFAULT '[]'::JSONB,
+  p_skills JSONB DEFAULT '[]'::JSONB,
+  p_education JSONB DEFAULT '[]'::JSONB,
+  p_certifications JSONB DEFAULT '[]'::JSONB,
+  p_deleted JSONB DEFAULT '{}'::JSONB
+) RETURNS JSONB
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  v_current_version INTEGER;
+  v_user_id UUID;
+  v_session_id TEXT;
+  v_updated_profile JSONB;
+  v_exp JSONB;
+  v_skill JSONB;
+  v_edu JSONB;
+  v_cert JSONB;
+BEGIN
+  -- Get authenticated user
+  v_user_id := auth.uid();
+
+  -- Lock row and get current version and session_id
+  SELECT version, session_id INTO v_current_version, v_session_id
+  FROM master_profiles
+  WHERE id = p_profile_id
+    AND deleted_at IS NULL
+    AND (
+      (user_id IS NOT NULL AND user_id = v_user_id)
+      OR (user_id IS NULL)
+    )
+  FOR UPDATE;
+
+  -- Check if profile exists and user has access
+  IF v_current_version IS NULL THEN
+    RETURN jsonb_build_object(
+      'success', false,
+      'current_version', NULL,
+      'error_message', 'Profile not found or access denied',
+      'profile', NULL
+    );
+  END IF;
+
+  -- Check version conflict
+  IF v_current_version != p_expected_version THEN
+    RETURN jsonb_build_object(
+      'success', false,
+      'current_version', v_current_version,
+      'error_message', 'Version conflict: Profile was modified by another session',
+      'profile', NULL
+    );
+  END IF;
+
+  -- Update master profile
+  UPDATE master_profiles
+  SET
+    profile_name = COALESCE(p_profile_updates->>'profile_name', profile_name),
+    is_default = COALESCE((p_profile_updates->>'is_default')::BOOLEAN, is_default),
+    full_name = COALESCE(p_profile_updates->>'full_name', full_name),
+    email = COALESCE(p_profile_updates->>'email', email),
+    phone_primary = COALESCE(p_profile_updates->>'phone_primary', phone_primary),
+    phone_secondary = COALESCE(p_profile_updates->>'phone_secondary', phone_secondary),
+    linkedin_url = COALESCE(p_profile_updates->>'linkedin_url', linkedin_url),
+    github_url = COALESCE(p_profile_updates->>'github_url', github_url),
+    portfolio_url = COALESCE(p_profile_updates->>'portfolio_url', portfolio_url),
+    location = COALESCE(p_profile_updates->>'location', location),
+    professional_summary = COALESCE(p_profile_updates->>'professional_summary', professional_summary),
+    years_of_experience = COALESCE((p_profile_updates->>'years_of_experience')::INTEGER, years_of_experience),
+    current_position = COALESCE(p_profile_updates->>'current_position', current_position),
+    version = version + 1,
+    updated_at = NOW()
+  WHERE id = p_profile_id;
+
+  -- Delete removed rows (scoped to this profile, so foreign ids are ignored)
+  DELETE FROM work_experiences
+  WHERE profile_id = p_profile_id
+    AND id IN (SELECT jsonb_array_elements_text(COALESCE(p_deleted->'experiences', '[]'::JSONB))::UUID);
+
+  DELETE FROM skills
+  WHERE profile_id = p_profile_id
+    AND id IN (SELECT jsonb_array_elements_text(COALESCE(p_deleted->'skills', '[]'::JSONB))::UUID);
+
+  DELETE FROM education
+  WHERE profile_id = p_profile_id
+    AND id IN (SELECT jsonb_array_elements_text(COALESCE(p_deleted->'education', '[]'::JSONB))::UUID);
+
+  DELETE FROM certifications
+  WHERE profile_id = p_profile_id
+    AND id IN (SELECT jsonb_array_elements_text(COALESCE(p_deleted->'certifications', '[]'::JSONB))::UUID);
+
+  -- Handle work experiences (upsert)
+  FOR v_exp IN SELECT * FROM jsonb_array_elements(p_experiences)
+  LOOP
+    IF v_exp->>'id' IS NOT NULL THEN
+      UPDATE work_experiences
+      SET
+        company_name = v_exp->>'company_name',
+        position_title = v_exp->>'position_title',
+        location = v_exp->>'location',
+        start_date = NULLIF(v_exp->>'start_date', '')::DATE,
+        end_date = NULLIF(v_exp->>'end_date', '')::DATE,
+        is_current = COALESCE((v_exp->>'is_current')::BOOLEAN, false),
+        description = v_exp->>'description',
+        display_order = COALESCE((v_exp->>'display_order')::INTEGER, 0),
+        updated_at = NOW()
+      WHERE id = (v_exp->>'id')::UUID AND profile_id = p_profile_id;
+    ELSE
+      INSERT INTO work_experiences (
+        profile_id, company_name, position_title, location,
+        start_date, end_date, is_current, description, display_order
+      )
+      VALUES (
+        p_profile_id,
+        v_exp->>'company_name',
+        v_exp->>'position_title',
+        v_exp->>'location',
+        NULLIF(v_exp->>'start_date', '')::DATE,
+        NULLIF(v_exp->>'end_date', '')::DATE,
+        COALESCE((v_exp->>'is_current')::BOOLEAN, false),
+        v_exp->>'description',
+        COALESCE((v_exp->>'display_order')::INTEGER, 0)
+      );
+    END IF;
+  END LOOP;
+
+  -- Handle skills (upsert)
+  FOR v_skill IN SELECT * FROM jsonb_array_elements(p_skills)
+  LOOP
+    IF v_skill->>'id' IS NOT NULL THEN
+      UPDATE skills
+      SET
+        skill_name = v_skill->>'skill_name',
+        category = v_skill->>'category',
+        proficiency_level = v_skill->>'proficiency_level',
+        years_of_experience = (v_skill->>'years_of_experience')::INTEGER,
+        display_order = COALESCE((v_skill->>'display_order')::INTEGER, 0)
+      WHERE id = (v_skill->>'id')::UUID AND profile_id = p_profile_id;
+    ELSE
+      INSERT INTO skills (
+        profile_id, skill_name, category, proficiency_level,
+        years_of_experience, display_order
+      )
+      VALUES (
+        p_profile_id,
+        v_skill->>'skill_name',
+        v_skill->>'category',
+        v_skill->>'proficiency_level',
+        (v_skill->>'years_of_experience')::INTEGER,
+        COALESCE((v_skill->>'display_order')::INTEGER, 0)
+      );
+    END IF;
+  END LOOP;
+
+  -- Handle education (upsert)
+  FOR v_edu IN SELECT * FROM jsonb_array_elements(p_education)
+  LOOP
+    IF v_edu->>'id' IS NOT NULL THEN
+      UPDATE education
+      SET
+        institution_name = v_edu->>'institution_name',
+        degree_or_field = v_edu->>'degree_or_field',
+        location = v_edu->>'location',
+        description = v_edu->>'description',
+        start_date = NULLIF(v_edu->>'start_date', '')::DATE,
+        end_date = NULLIF(v_edu->>'end_date', '')::DATE,
+        date_precision = COALESCE(v_edu->>'date_precision', 'month'),
+        is_current = COALESCE((v_edu->>'is_current')::BOOLEAN, false),
+        display_order = COALESCE((v_edu->>'display_order')::INTEGER, 0)
+      WHERE id = (v_edu->>'id')::UUID AND profile_id = p_profile_id;
+    ELSE
+      INSERT INTO education (
+        profile_id, institution_name, degree_or_field, location, description,
+        start_date, end_date, date_precision, is_current, display_order
+      )
+      VALUES (
+        p_profile_id,
+        v_edu->>'institution_name',
+        v_edu->>'degree_or_field',
+        v_edu->>'location',
+        v_edu->>'description',
+        NULLIF(v_edu->>'start_date', '')::DATE,
+        NULLIF(v_edu->>'end_date', '')::DATE,
+        COALESCE(v_edu->>'date_precision', 'month'),
+        COALESCE((v_edu->>'is_current')::BOOLEAN, false),
+        COALESCE((v_edu->>'display_order')::INTEGER, 0)
+      );
+    END IF;
+  END LOOP;
+
+  -- Handle certifications (upsert)
+  FOR v_cert IN SELECT * FROM jsonb_array_elements(p_certifications)
+  LOOP
+    IF v_cert->>'id' IS NOT NULL THEN
+      UPDATE certifications
+      SET
+        certification_name = v_cert->>'certification_name',
+        issuing_organization = v_cert->>'issuing_organization',
+        credential_id = v_cert->>'credential_id',
+        credential_url = v_cert->>'credential_url',
+        description = v_cert->>'description',
+        issue_date = NULLIF(v_cert->>'issue_date', '')::DATE,
+        expiry_date = NULLIF(v_cert->>'expiry_date', '')::DATE,
+        date_precision = COALESCE(v_cert->>'date_precision', 'month'),
+        display_order = COALESCE((v_cert->>'display_order')::INTEGER, 0)
+      WHERE id = (v_cert->>'id')::UUID AND profile_id = p_profile_id;
+    ELSE
+      INSERT INTO certifications (
+        profile_id, certification_name, issuing_organization,
+        credential_id, credential_url, description,
+        issue_date, expiry_date, date_precision, display_order
+      )
+      VALUES (
+        p_profile_id,
+        v_cert->>'certification_name',
+        v_cert->>'issuing_organization',
+        v_cert->>'credential_id',
+        v_cert->>'credential_url',
+        v_cert->>'description',
+        NULLIF(v_cert->>'issue_date', '')::DATE,
+        NULLIF(v_cert->>'expiry_date', '')::DATE,
+        COALESCE(v_cert->>'date_precision', 'month'),
+        COALESCE((v_cert->>'display_order')::INTEGER, 0)
+      );
+    END IF;
+  END LOOP;
+
+  -- Fetch and return the updated profile
+  SELECT to_jsonb(mp.*) INTO v_updated_profile
+  FROM master_profiles mp
+  WHERE mp.id = p_profile_id;
+
+  RETURN jsonb_build_object(
+    'success', true,
+    'current_version', v_current_version + 1,
+    'error_message', NULL,
+    'profile', v_updated_profile
+  );
+END;
+$$;
+
+-- Step 3: Grant permissions (dropped together with the old signature)
+GRANT EXECUTE ON FUNCTION update_master_profile_with_details TO authenticated;
+GRANT EXECUTE ON FUNCTION update_master_profile_with_details TO anon;
+
+COMMENT ON FUNCTION update_master_profile_with_details IS 'Atomically updates a profile and upserts/deletes its work experiences, skills, education and certifications (optimistic locking on version).';
+
+COMMIT;
+
+-- Rollback script (if needed): re-run 022_add_batch_update_profile.sql after
+-- BEGIN;
+-- DROP FUNCTION IF EXISTS update_master_profile_with_details(UUID, INTEGER, JSONB, JSONB, JSONB, JSONB, JSONB, JSONB);
+-- COMMIT;
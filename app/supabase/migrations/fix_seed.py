@@ -1,24 +1,29 @@
 #!/usr/bin/env python3
-import re
+"""
+Set created_by on every job in 003_seed_jobs.sql to the placeholder seed user.
 
-# Read the file
-with open('003_seed_jobs.sql', 'r') as f:
-    content = f.read()
+The rewrite streams the file, skips rows that already have the value and
+replaces the file atomically, so re-running it is safe. See
+app/scripts/seed_sql_rewrite.py for other column rewrites.
 
-# Replace pattern 1: Add created_by to column list in all INSERT statements
-column_pattern = r"(INSERT INTO jobs \([^\)]+)\n\) VALUES \("
-column_replacement = r"\1,\n  created_by\n) VALUES ("
+Usage:
+    python3 app/supabase/migrations/fix_seed.py
+"""
 
-# Replace pattern 2: find lines ending with folder path and closing paren, add created_by
-value_pattern = r"('04_Applications/[^']+'),?\n\);"
-value_replacement = r"\1,\n  '31169b06-bbd0-46e5-985a-7d4506f26b15'  -- Placeholder UUID for seed data\n);"
+import sys
+from pathlib import Path
 
-# Apply the replacements
-fixed_content = re.sub(column_pattern, column_replacement, content)
-fixed_content = re.sub(value_pattern, value_replacement, fixed_content)
+MIGRATIONS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(MIGRATIONS_DIR.parent.parent / 'scripts'))
 
-# Write back to file
-with open('003_seed_jobs.sql', 'w') as f:
-    f.write(fixed_content)
+from seed_sql_rewrite import Transform, rewrite_file  # noqa: E402
 
-print("Fixed seed data file")
+# Placeholder UUID for seed data
+SEED_USER_ID = '31169b06-bbd0-46e5-985a-7d4506f26b15'
+SEED_FILE = MIGRATIONS_DIR / '003_seed_jobs.sql'
+
+stats = rewrite_file(SEED_FILE, [Transform('set', 'created_by', SEED_USER_ID)])
+if stats.changed:
+    print(f"Fixed seed data file ({stats.rows_changed} of {stats.rows} rows)")
+else:
+    print("Seed data file already has created_by")